@@ -27,6 +27,18 @@ How To Use:
     Simply drag & drop one or more game files (ROMs/Disc/etc) or directories onto this script.
     -OR-
     Run this script in the directory where games files are located.
+    -OR-
+    Start this script once with "--daemon" and leave it running in the background. Files dropped
+    onto this script are then passed on to it, skipping reading all LaunchBox and RetroArch data
+    again for every drop. Stop it with "--stop-daemon".
+    -OR-
+    Split a large game library between several copies of this script (or computers) by starting
+    each with its own shard, "--shard 1/4", "--shard 2/4", etc. Every game title is always handled
+    by the same shard. When all are done, run this script with "--merge-shards" to create one log.
+    -OR-
+    Start this script with "--verify" to check the RetroArch thumbnails already saved match what the
+    current preset would create (missing, wrong size, older than their LaunchBox image, or not in a
+    playlist), without creating any.
 
 
 Requirements:
@@ -34,6 +46,10 @@ Requirements:
     necessary changing of formats (JPEG to PNG).
     - pip install Pillow
     - https://pypi.org/project/Pillow/
+    
+    lxml is an optional XML library that, if installed, is used to read LaunchBox's XML files faster.
+    - pip install lxml
+    - https://pypi.org/project/lxml/
 
 
 TODO:
@@ -46,7 +62,7 @@ TODO:
     [X] Priorities for Region (NA,Japan,etc), Format (.jpg,.png,etc), and Number (01,02,etc).
         [X] Random number option
         [X] Auto-detect region
-    [] Change Overall Priority Option - Default: Image Category > Region > Format > Number
+    [X] Change Overall Priority Option - Default: Image Category > Region > Number > Format
     [X] Extra Image Saving Parameters
     [X] Better archived game detection. "game.zip#game.rom"
 
@@ -85,15 +101,83 @@ game_extensions = [
   '.gg',                 # Sega Game Gear
 ]
 
+# Directories to skip when searching dropped directories for game files (upper or lower case doesn't
+# matter). Hidden directories, starting with a "." (like ".git"), are always skipped.
+skip_game_directories = ['Images', 'Manuals', 'Music', 'Videos']
+
+# Create RetroArch thumbnails while still searching for game files and LaunchBox images, instead of
+# searching for everything first and asking before creating any. The first thumbnails are created
+# within seconds of dropping a large game library, instead of after the whole search.
+# Note: This doesn't make creating all the thumbnails faster. Making the thumbnails (see thumbnail_workers)
+#       takes most of the time either way, only a slow search (like on a network drive) is hidden behind it.
+stream_thumbnails = False
+
 # This script will continue to run allowing the dropping of additional files or directories.
 # Set this to False and this script will run once, do it's thing, and close
 loop_script = True
 
+# When a daemon of this script is running (started with "--daemon"), pass dropped files and
+# directories on to it instead of reading all the LaunchBox and RetroArch data again. The daemon
+# handles one drop at a time, with its thumbnail workers (see thumbnail_workers) kept running between them.
+# Note: The daemon keeps using the settings and preset it was started with. Restart it after
+#       making any changes to this script.
+use_daemon = True
+
 # Create a log file that will record all the details of each new RetroArch thumbnail created.
 # Note: New log file will overwrite old log file. Rename and save log file once open if you
 # want to prevent it being overwritten.
 create_log_file = True
 
+# How many thumbnails to make at the same time, in threads. Pillow lets other threads run while it
+# decodes, resizes, and encodes images, so with more than one CPU core thumbnails are made at the same
+# time, and searching and saving never wait on each other. Use 0 for one per CPU core.
+thumbnail_workers = 0
+
+# The most pixels of LaunchBox images (and their resized copies) the thumbnail workers can have decoded
+# in memory at the same time, about 4 bytes each. Prevents a few huge images (like "Fanart - Background")
+# decoded at once from using up all the memory. A thumbnail worker waits for enough room before decoding
+# an image, and an image needing more than all of it is skipped. Use 0 for no limit.
+image_pixel_budget = 250_000_000
+
+# How many LaunchBox image folders to list at the same time. The image folders of a platform (and
+# their region folders) are all listed once, up front, instead of checking each region folder one at
+# a time. Raising this can help a lot when LaunchBox images are on a network drive (NAS). Also the
+# most dropped directories to search for game files at the same time, and the most thumbnails to
+# check at the same time with "--verify".
+image_folder_workers = 8
+
+# Limit how fast files are read and written, so this script doesn't slow down everything else using the
+# same drives (like games being played or a NAS backup running). The limits are shared by everything
+# this script does at the same time. Use 0 for no limit.
+io_read_limit = 0       # Bytes read per second (LaunchBox images). Example: 20_000_000 = 20 MB/s
+io_write_limit = 0      # Bytes written per second (RetroArch thumbnails).
+io_metadata_limit = 0   # Directories listed and files checked, created or synced per second.
+
+# Run this script at a low CPU and disk priority, so other programs always go first.
+# (nice and ionice on Linux, nice on macOS, background mode on Windows)
+low_priority = False
+
+# Check LaunchBox images for signs of a broken or incomplete download (wrong file type, bad header,
+# or missing end of file) before selecting them, so the next best image is used instead. Each image
+# is only checked again if its file size or modified time changes.
+validate_source_images = True
+
+# Keep a journal of every RetroArch thumbnail saved. If this script is closed or crashes before
+# finishing (power loss, network drive disconnects, etc), the next run will skip the thumbnails
+# already saved and clean up any temporary files left behind. The journal is emptied at every new
+# drop and deleted once a run finishes normally. Only one run at a time can use it.
+resume_journal = True
+
+# How sure to be that saved thumbnails are actually written to disk before moving on, in case of a
+# crash or power loss. Slower but safer the more syncing is done.
+#   NO_SYNC          : Let the operating system decide when to write to disk (fastest).
+#   SYNC_EACH_FILE   : Sync each thumbnail file and its directory right after it's saved (slowest).
+#   SYNC_DIRECTORIES : Sync each thumbnail file, but sync directories all at once after all thumbnails are saved.
+NO_SYNC = 0
+SYNC_EACH_FILE = 1
+SYNC_DIRECTORIES = 2
+save_durability = NO_SYNC
+
 # Match LaunchBox and RetroArch platforms before searching through playlists, for faster
 # searches. Set to False if your games (that are in both LaunchBox and RetroArch) are not
 # having their RetroArch thumbnails created.
@@ -145,13 +229,19 @@ ALTERNATE_GAMEPLAY_IMAGES = 8
 PREFERRED_BOXART_NUMBER = 9
 PREFERRED_TITLE_NUMBER = 10
 PREFERRED_GAMEPLAY_NUMBER = 11
+SELECTION_PRIORITY = 12
 MODIFY_IMAGE_WIDTH = 20
 MODIFY_IMAGE_HEIGHT = 21
 IMAGE_RESAMPLING_FILTER = 22
 KEEP_ASPECT_RATIO = 23
 EXTRA_IMAGE_SAVING_PARAMS = 24
+AUTO_SIZE_PROFILE = 25
 SEARCH_SUB_DIRS = 30
 OVERWRITE_IMAGES = 31
+OUTPUT_TARGETS = 40
+THUMBNAILS_ROOT = 41
+EXPORT_ARCHIVE = 42
+EXPORT_DELTA = 43
 
 RANDOM = 789
 
@@ -172,9 +262,20 @@ BICUBIC = 2   #
 JPEG = JPG = ('JPEG', '.jpg', '.jpeg', '.jpe')
 PNG = ('Portable Network Graphics', '.png')
 
+# Image Selection Priorities
+IMAGE_CATEGORY = 0  # Order of the image categories in FRONT_BOXART_PRIORITY, TITLE_SCREEN_PRIORITY, or GAMEPLAY_SCREEN_PRIORITY.
+IMAGE_REGION = 1    # Order of the regions in REGION_PRIORITY (after any region detected in the game's file name).
+IMAGE_NUMBER = 2    # Images with the PREFERRED_BOXART/TITLE/GAMEPLAY_NUMBER first.
+IMAGE_FORMAT = 3    # Images in the FORMAT_PREFERENCE first.
+DEFAULT_SELECTION_PRIORITY = [IMAGE_CATEGORY, IMAGE_REGION, IMAGE_NUMBER, IMAGE_FORMAT]
+
 # Extra Image Saving Parameters (PNG Only)
 OPTIMIZE = 3           # Possible optimization values are True or False.
 COMPRESSION_LEVEL = 5  # Possible compress levels are between 1-9, default 6, and auto-set to 9+ if OPTIMIZE is set to True.
+PALETTE_COLORS = 6     # Quantize images to an adaptive palette of 2-256 colors (smaller files), but only if quality stays above PALETTE_QUALITY.
+PALETTE_QUALITY = 7    # Minimum quality (PSNR in dB) of a quantized image, default 40. Lower = more images quantized but with more visible color loss.
+REDUCE_BIT_DEPTH = 8   # Possible values are True or False. Save images with 256 or fewer colors (pixel-art) as 1, 2, 4, or 8-bit palette images, without any color loss.
+STRIP_METADATA = 9     # Possible values are True or False. Don't save ICC color profiles or EXIF data in images.
 
 # Default LaunchBox image category priorities when selecting thumbnails for RetroArch.
 # Find all media types in LaunchBox "Tools / Manage / Platforms / Edit Platform / Folders / Media Type"
@@ -247,6 +348,12 @@ detected_regions_only = False
 #       any specific region folders within LaunchBox.
 always_prioritize_region_free = False
 
+# When no images are found for a game's title, because the title was changed after the images were
+# downloaded or the punctuation is different ("Pokémon" vs "Pokemon", ": " vs " - "), look for
+# image file names with a title similar enough to the game's title. Set how similar from 0.0 to 1.0
+# (1.0 = same title when ignoring case, accents, and punctuation) or 0 to turn off.
+fuzzy_title_matching = 0.85
+
 # Game files usually have "Codes" in their file names that show what region or part of the
 # world they were released in. Using these codes images will be selected first from the region
 # the game was released in.
@@ -304,6 +411,8 @@ auto_region_detector = {
 
 
 ### Select the default preset to use here. ###
+# Or a list of presets to run them all at once, finding games and listing image directories only
+# once for all of them. Give each preset its own THUMBNAILS_ROOT (or OUTPUT_TARGETS). Example: [1, 3]
 selected_preset = 5
 
 preset0 = { #               : Defaults                  # If option omitted, the default option value will be used.
@@ -320,14 +429,27 @@ preset0 = { #               : Defaults                  # If option omitted, the
   PREFERRED_BOXART_NUMBER   : None,                     # Every image in LaunchBox has a number (GameTitle-##.jpg) to distinguish it from other images in the same category/region.
   PREFERRED_TITLE_NUMBER    : None,                     #   This option will use that preferred number first, and only use others if either the preferred number isn't found
   PREFERRED_GAMEPLAY_NUMBER : None,                     #   or is already selected in a game with multiple files (discs, regions, etc.). Has priority over ALTERNATE___IMAGES.
+  SELECTION_PRIORITY        : DEFAULT_SELECTION_PRIORITY, # The order in which image categories, regions, preferred numbers, and formats decide which image is best.
+                                                        #   Example: [IMAGE_REGION, IMAGE_CATEGORY, IMAGE_NUMBER, IMAGE_FORMAT] = Any image in the best region first.
   MODIFY_IMAGE_WIDTH        : NO_CHANGE,                # Modify copied LaunchBox images before saving them as RetroArch thumbnails. Example: ('Image Modifier', Number)
   MODIFY_IMAGE_HEIGHT       : NO_CHANGE,                #   Image Modifiers: CHANGE_TO, MODIFY_BY_PIXELS, MODIFY_BY_PERCENT, UPSCALE, DOWNSCALE
   IMAGE_RESAMPLING_FILTER   : NEAREST,                  # Resampling changes the total number of pixels in an image. Filters: NEAREST, BILINEAR, BICUBIC
   KEEP_ASPECT_RATIO         : True,                     # Keep aspect ratio only if one size, width or height, has changed.
+  AUTO_SIZE_PROFILE         : False,                    # Downscale images to the largest size RetroArch can show (RGUI's 320x240, else the screen size for fullscreen
+                                                        #   thumbnails) from "retroarch.cfg". Overrides MODIFY_IMAGE_WIDTH/HEIGHT. True or a path to another device's "retroarch.cfg".
   EXTRA_IMAGE_SAVING_PARAMS : None,                     # Extra Image Saving Parameters (PNG Only). Example: {OPTIMIZE : False, COMPRESSION_LEVEL : 7}
+                                                        #   Smaller Images: {PALETTE_COLORS : 256, PALETTE_QUALITY : 40, REDUCE_BIT_DEPTH : True, STRIP_METADATA : True}
   SEARCH_SUB_DIRS           : False,                    # After searching for games in a directory also search sub-directories.
   OVERWRITE_IMAGES          : False,                    # Overwrite RetroArch thumbnail images, else skip the images that already exist.
-}                                                       ## TODO: Overall Priority Option? -Default: Image Category > Region > Format > Number
+  THUMBNAILS_ROOT           : None,                     # Directory to save thumbnails in, when not RetroArch's own thumbnails directory.
+  OUTPUT_TARGETS            : None,                     # A list of output targets (thumbnail directories) each with their own MODIFY_IMAGE_WIDTH, MODIFY_IMAGE_HEIGHT,
+                                                        #   and EXTRA_IMAGE_SAVING_PARAMS. Each image is only opened once for all targets. None = RetroArch's thumbnails.
+                                                        #   Example: [{THUMBNAILS_ROOT : r'E:\RetroArch\thumbnails', MODIFY_IMAGE_HEIGHT : (DOWNSCALE, 720)}, ...]
+  EXPORT_ARCHIVE            : None,                     # Save thumbnails in one ".zip" or ".tar" file (laid out like RetroArch's thumbnails directory)
+                                                        #   instead of many small files, for faster copying to SD cards and handhelds. Example: r'D:\thumbnails.zip'
+  EXPORT_DELTA              : False,                    # Only export thumbnails that are new or changed since the last export to the same archive. Each
+                                                        #   delta is saved next to the archive with the time in its name. Example: r'D:\thumbnails_delta_20240131_201500.zip'
+}
 
 preset1 = {
   DESCRIPTION               : ('Front and back boxart with a gameplay image. '+
@@ -447,22 +569,50 @@ preset_options = [preset0,preset1,preset2,preset3,preset4,preset5,preset6]
 debug = False
 
 import configparser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from hashlib import sha1
 import itertools
+from io import BytesIO, StringIO, TextIOBase
 import json
+from math import log10
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+import os
+import queue
 from pathlib import Path, PurePath
 try:
-    from PIL import Image, UnidentifiedImageError
+    from PIL import Image, ImageChops, ImageStat, UnidentifiedImageError
     pillow_installed = True
 except ModuleNotFoundError:
     pillow_installed = False
+try:
+    from lxml import etree as LXMLParser
+    lxml_installed = True
+except ModuleNotFoundError:
+    lxml_installed = False
+try:
+    import fcntl # File locks on Linux and macOS
+except ModuleNotFoundError:
+    fcntl = None
+try:
+    import msvcrt # File locks on Windows
+except ModuleNotFoundError:
+    msvcrt = None
 from os import getenv, startfile as OpenFile, walk as Search
-from random import choice as RandomOption, random as RandomNumber
+from random import choice as RandomOption, random as RandomNumber, Random as RandomGenerator
 import re
 from shutil import copy2 as CopyFile
+from time import perf_counter as Timer, sleep as Wait
 import stat
+import subprocess
 import sys
+import tarfile
+import threading
+import unicodedata
 import xml.etree.ElementTree as XMLParser
+import zipfile
 
 # Application Data
 APP_DATA = 7777
@@ -473,10 +623,41 @@ MEDIA_TYPE =             1011
 DIR_PATH =               1012
 GAME_PATHS =            102
 IMAGE_PATHS =           103
+CLAIMED_IMAGE_PATHS =   104
+PLANNED_IMAGE_PATHS =   105
 PLATFORMS_DIR_PATH =   11
+PLATFORM_XML_RECORDS = 12
+IMAGE_DIR_INDEXES =    13
+IMAGE_FILES =           131
+TITLE_KEYS =            132
+TITLE_TRIGRAMS =        133
+IMAGE_TITLES =          134
+IMAGE_GAME_IDS =        135
+GAMES_BY_PATH =        14
+GAMES_BY_ID =          15
+ADDITIONAL_APPS_BY_PATH = 16
+DIRECTORY_LISTINGS =   17
+IMAGE_VALIDATIONS =    18
 RETROARCH =           2
 PLAYLISTS_DIR_PATH =   22
 THUMBNAILS_DIR_PATH =  23
+CONFIG_SETTINGS =      24
+PLAYLISTS =            25
+THUMBNAIL_SNAPSHOTS =  26
+THUMBNAIL_FINGERPRINTS = 27
+RESUME_JOURNAL = 3
+JOURNAL_ENTRIES =      31
+JOURNAL_FILE =         32
+PRESET_RUNS = 4
+ENCODED_OUTPUTS = 5
+OUTPUT_FINGERPRINTS =  51
+FINGERPRINT_OUTPUTS =  52
+ARCHIVE_EXPORTS = 6
+ARCHIVE_FILE =         61
+ARCHIVE_MANIFEST =     62
+ARCHIVE_ENTRIES =      63
+ARCHIVE_FILE_PATH =    64
+THUMBNAIL_AUDIT = 7
 
 # Game Images
 FRONT_BOXART = FRONT_BOXART_PRIORITY
@@ -491,15 +672,22 @@ SAVED_IMAGE_PATHS = 2
 GAME_PATHS_IN_LB_RA = 3
 IMAGE_EDITS = 4
 TIME_DATA = 5
+FUZZY_MATCHES = 6
+PEAK_DECODED_PIXELS = 7
+CURRENT_GAME_TITLE = 8
 START_TIME = 50
 END_TIME = 51
 COMPLETION_TIME = 52
 
 MODIFY_IMAGE_SIZE = 0
+COLOR_REDUCTION = 1
+FILE_SIZE = 2
+DECODE_TIME = 3
 ERROR = 99
 NOT_SAVED = 90
 NEW_SAVE = 91
 OVERWRITTEN = 92
+RESUMED = 89
 
 # Image Dimension Indexes
 ORIGINAL_IMAGE_SIZE = 0
@@ -517,6 +705,22 @@ IMAGE_OUTPUT = 1
 SAVE_INFO = 2
 EDIT_ERROR = 2
 
+# Thumbnail File Stat Indexes
+SNAPSHOT_SIZE = 0
+SNAPSHOT_MODIFIED_TIME = 1
+SNAPSHOT_MODE = 2
+
+# I/O Types
+IO_READ = 0
+IO_WRITE = 1
+IO_METADATA = 2
+
+# Thumbnail Audit Problems
+MISSING_THUMBNAIL = 0
+WRONG_SIZE_THUMBNAIL = 1
+STALE_THUMBNAIL = 2
+UNEXPECTED_THUMBNAIL = 3
+
 # You shouldn't have to edit this as it's only used to identify multi-disc game files.
 # However, if you have some unique file naming conventions for your games and know how to
 # use Regular Expressions, go for it.
@@ -538,13 +742,48 @@ re_game_info_compiled_pattern = re.compile( re_game_info_pattern, re.IGNORECASE
 # Regular Expression to find text such as " (parenthesizes)".
 re_parenthesis_text_compiled_pattern = re.compile( '\s*'+re_game_info_pattern, re.IGNORECASE  )
 
+# Region codes compiled from auto_region_detector and the region priority lists built from them.
+region_code_lookup = None
+region_priority_cache = {}
+
+# Directories already created or found while saving thumbnails (in this run), and directories not yet synced to disk.
+existing_directories = set()
+unsynced_directories = set()
+
+# The threads making thumbnails (see getThumbnailPool), and the thumbnails handed to them not yet finished
+# (see finishThumbnailJobs), oldest first. Only the thumbnail workers and the resume journal are shared.
+thumbnail_pool = None
+thumbnail_jobs = []
+resume_journal_lock = threading.Lock()
+
+# Pixels reserved from the image_pixel_budget by the thumbnail workers, and the pixels they actually have decoded right now.
+pixel_budget_condition = threading.Condition()
+pixels_reserved = 0
+pixels_decoded = 0
+
+# Token buckets limiting how fast files are read and written. { I/O Type : [ Tokens, Last Refill Time ] }
+# And the amount of each type of I/O done with the time spent waiting on its limit. { I/O Type : [ Amount, Seconds ] }
+io_throttle_lock = threading.Lock()
+io_throttle_buckets = {}
+io_throttle_stats = { IO_READ : [0, 0], IO_WRITE : [0, 0], IO_METADATA : [0, 0] }
+
+# The part of a game library this script is working on when started with "--shard i/n". ( Shard Number, Shard Count )
+shard = None
+
+# Only checking existing thumbnails when started with "--verify", without creating or changing any files.
+verify_thumbnails = False
+
+# Regular Expression matching the parts of a LaunchBox image file name: [Game Title] + [.<ID>] + [-##] + [.ext]
+re_image_file_name_compiled_pattern = re.compile( '^(.+?)(?:\.([0-9a-f\-]{36}))?-(\d+)\.\w+$', re.IGNORECASE )
+
+# Regular Expressions used to normalize titles and find numbers in titles.
+re_non_word_compiled_pattern = re.compile( '[\W_]+' )
+re_roman_numeral_compiled_pattern = re.compile( '^[ivx]+$' )
+
 # Characters not allowed in file names.
 # Note: While not illegal LB replaces 'single quotes' as well.
 illegal_characters = list( '*\\|:\'"<>/?' )
 
-# Characters to escape in RE searches.
-re_escape_characters = list( '.^$*+()[]{}' )
-
 ROOT_DIR = Path(__file__).parent
 
 
@@ -584,6 +823,8 @@ def changePreset(preset, all_the_data = {}):
         all_the_data[LOG_DATA][SAVED_IMAGE_PATHS] = {}
         all_the_data[LOG_DATA][GAME_PATHS_IN_LB_RA] = []
         all_the_data[LOG_DATA][IMAGE_EDITS] = {}
+        all_the_data[LOG_DATA][FUZZY_MATCHES] = {}
+        all_the_data[LOG_DATA][PEAK_DECODED_PIXELS] = 0
         all_the_data[LOG_DATA][COMPLETION_TIME] = 0
     else:
         all_the_data[APP_DATA] = app_data
@@ -594,6 +835,46 @@ def changePreset(preset, all_the_data = {}):
     return all_the_data
 
 
+### Add more presets to run alongside the first one. All the LaunchBox and RetroArch data read and
+### image directories listed are shared, while each preset selects and saves its own images.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far (of the first preset).
+###     (presets) A list of more presets to run.
+###     --> Returns a [Dictionary]
+def addPresetRuns(all_the_data, presets):
+    preset_runs = [all_the_data]
+    
+    for preset in presets:
+        preset_run = changePreset(dict(preset))
+        preset_run[APP_DATA] = all_the_data[APP_DATA].copy()
+        preset_run[APP_DATA][LAUNCHBOX] = all_the_data[APP_DATA][LAUNCHBOX].copy()
+        preset_run[APP_DATA][RETROARCH] = all_the_data[APP_DATA][RETROARCH].copy()
+        preset_run[APP_DATA][RETROARCH][IMAGE_PATHS] = {}
+        preset_run[APP_DATA][LAUNCHBOX][PLATFORMS] = {}
+        
+        for platform, platform_data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
+            preset_run[APP_DATA][LAUNCHBOX][PLATFORMS][platform] = {
+                ALL_MEDIA_TYPES : platform_data[ALL_MEDIA_TYPES], GAME_PATHS: {}, IMAGE_PATHS : {}, CLAIMED_IMAGE_PATHS : {}, PLANNED_IMAGE_PATHS : {},
+            }
+            preset_run[LOG_DATA][SAVED_IMAGE_PATHS][platform] = {}
+            preset_run[LOG_DATA][IMAGE_EDITS][platform] = {}
+        
+        preset_runs.append(preset_run)
+    
+    for preset_run in preset_runs:
+        preset_run[APP_DATA][PRESET_RUNS] = preset_runs
+    
+    return all_the_data
+
+
+### Get the data of every preset being run, see addPresetRuns().
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [List] of [Dictionaries]
+def getPresetRuns(all_the_data):
+    return all_the_data[APP_DATA].get(PRESET_RUNS) or [all_the_data]
+
+
 ### Get file data and existing paths to needed files and directories from LaunchBox and RetroArch.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
@@ -645,14 +926,14 @@ def getLaunchBoxRetroArchData(all_the_data):
         print(f'Getting Platform Names, Image Type and Path Data From: {launchbox_platforms_xml_path}')
         all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS] = {}
         
-        platforms_root = XMLParser.parse(launchbox_platforms_xml_path).getroot()
-        for image_folders in platforms_root.findall('PlatformFolder'):
-            platform = image_folders.find('Platform').text
-            madia_type = image_folders.find('MediaType').text
-            image_dir_path = Path(image_folders.find('FolderPath').text)
+        platforms_xml_records = readLaunchBoxXML(launchbox_platforms_xml_path, 'PlatformFolder')
+        for image_folders in platforms_xml_records['PlatformFolder']:
+            platform = image_folders.get('Platform')
+            madia_type = image_folders.get('MediaType')
+            image_dir_path = Path(image_folders.get('FolderPath'))
             
             if platform not in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS]:
-                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform] = {ALL_MEDIA_TYPES : [], GAME_PATHS: {}, IMAGE_PATHS : {}, }
+                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform] = {ALL_MEDIA_TYPES : [], GAME_PATHS: {}, IMAGE_PATHS : {}, CLAIMED_IMAGE_PATHS : {}, PLANNED_IMAGE_PATHS : {}, }
                 all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][ALL_MEDIA_TYPES] = [{ MEDIA_TYPE : madia_type, DIR_PATH : image_dir_path }]
                 all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform] = {}
                 all_the_data[LOG_DATA][IMAGE_EDITS][platform] = {}
@@ -668,6 +949,10 @@ def getLaunchBoxRetroArchData(all_the_data):
     if launchbox_platforms_dir_path.exists():
         print(f'Found LaunchBox Platforms Directory: {launchbox_platforms_dir_path}')
         all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS_DIR_PATH] = launchbox_platforms_dir_path
+        all_the_data[APP_DATA][LAUNCHBOX][PLATFORM_XML_RECORDS] = {}
+        all_the_data[APP_DATA][LAUNCHBOX][IMAGE_DIR_INDEXES] = {}
+        all_the_data[APP_DATA][LAUNCHBOX][DIRECTORY_LISTINGS] = {}
+        all_the_data[APP_DATA][LAUNCHBOX][IMAGE_VALIDATIONS] = {}
     else:
         print(f'\nERROR: LaunchBox\'s "Platforms" Directory Does Not Exist. [ {launchbox_platforms_dir_path} ]')
         print('       Check if your LaunchBox is installed properly and you have games imported into LaunchBox.')
@@ -676,13 +961,10 @@ def getLaunchBoxRetroArchData(all_the_data):
     # Get RetroArch Playlists and Thumbnails Directory Paths
     retroarch_config_path = Path(PurePath().joinpath(retroarch_root, 'retroarch.cfg'))
     if retroarch_config_path.exists():
-        with open(retroarch_config_path, 'r') as file:
-            retroarch_config_string = '[SETTINGS]\n' + file.read()
-        retroarch_config_file = configparser.ConfigParser()
-        #retroarch_config_file.read(retroarch_config_path)
-        retroarch_config_file.read_string(retroarch_config_string)
+        retroarch_config_settings = readRetroArchConfig(retroarch_config_path)
+        all_the_data[APP_DATA][RETROARCH][CONFIG_SETTINGS] = retroarch_config_settings
         
-        retroarch_playlists = retroarch_config_file['SETTINGS'].get('playlist_directory')
+        retroarch_playlists = retroarch_config_settings.get('playlist_directory')
         if retroarch_playlists:
             retroarch_playlists_path = getPathFromSetting(retroarch_playlists, retroarch_root)
         else:
@@ -691,12 +973,13 @@ def getLaunchBoxRetroArchData(all_the_data):
         if retroarch_playlists_path and retroarch_playlists_path.exists():
             print(f'Found RetroArch Playlists Directory: {retroarch_playlists_path}')
             all_the_data[APP_DATA][RETROARCH][PLAYLISTS_DIR_PATH] = retroarch_playlists_path
+            all_the_data[APP_DATA][RETROARCH][PLAYLISTS] = {}
         else:
             print(f'\nERROR: RetroArch\'s "Playlist" Directory Does Not Exist. [ {retroarch_playlists_path} ]')
             print('       Update your RetroArch\'s "Settings / Directory / Playlists" settings.')
             return None
         
-        retroarch_thumbnails = retroarch_config_file['SETTINGS'].get('thumbnails_directory')
+        retroarch_thumbnails = retroarch_config_settings.get('thumbnails_directory')
         if retroarch_thumbnails:
             retroarch_thumbnails_path = getPathFromSetting(retroarch_thumbnails, retroarch_root)
         else:
@@ -710,9 +993,311 @@ def getLaunchBoxRetroArchData(all_the_data):
             print('       Update your RetroArch\'s "Settings / Directory / Thumbnails".')
             return None
     
+    all_the_data = loadLaunchBoxRetroArchFiles(all_the_data)
+    all_the_data[APP_DATA][ENCODED_OUTPUTS] = { OUTPUT_FINGERPRINTS : {}, FINGERPRINT_OUTPUTS : {} }
+    all_the_data[APP_DATA][ARCHIVE_EXPORTS] = {}
+    
+    # Verifying leaves the journal (and the temp files it lists) of a run that didn't finish alone.
+    if resume_journal and not verify_thumbnails:
+        all_the_data = openResumeJournal(all_the_data)
+    
+    return all_the_data
+
+
+### Read all the LaunchBox platform XML files and RetroArch playlists and index the games in them.
+### Files already read are only read again if they changed since.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary]
+def loadLaunchBoxRetroArchFiles(all_the_data):
+    start_time = Timer()
+    platform_xml_records = all_the_data[APP_DATA][LAUNCHBOX][PLATFORM_XML_RECORDS]
+    retroarch_playlists = all_the_data[APP_DATA][RETROARCH][PLAYLISTS]
+    xml_record_tags = ['Game', 'AdditionalApplication']
+    # Only keep what's needed to find games, so less is kept in memory.
+    xml_child_tags = ['ID', 'GameID', 'ApplicationPath', 'Title', 'Platform', 'Region']
+    
+    xml_file_keys, changed_xml_files = getChangedFiles(
+        platform_xml_records, all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS_DIR_PATH], '.xml'
+    )
+    playlist_file_keys, changed_playlists = getChangedFiles(
+        retroarch_playlists, all_the_data[APP_DATA][RETROARCH][PLAYLISTS_DIR_PATH], '.lpl', False
+    )
+    if (not changed_xml_files and not changed_playlists and
+        xml_file_keys.keys() == platform_xml_records.keys() and playlist_file_keys.keys() == retroarch_playlists.keys()):
+        return all_the_data
+    
+    read_xml_files = {
+        xml_file_path : readLaunchBoxXML(xml_file_path, xml_record_tags, xml_child_tags) for xml_file_path in changed_xml_files
+    }
+    read_playlists = { playlist_path : readRetroArchPlaylist(playlist_path) for playlist_path in changed_playlists }
+    
+    # Keep files in the order they were found, dropping any deleted. Updated in place since other
+    # presets (see addPresetRuns) share these.
+    updated_xml_records = {
+        xml_file_path : [file_key, read_xml_files[xml_file_path] if xml_file_path in read_xml_files else platform_xml_records[xml_file_path][1]]
+        for xml_file_path, file_key in xml_file_keys.items()
+    }
+    platform_xml_records.clear()
+    platform_xml_records.update(updated_xml_records)
+    updated_playlists = {
+        playlist_path : [file_key, read_playlists[playlist_path] if playlist_path in read_playlists else retroarch_playlists[playlist_path][1]]
+        for playlist_path, file_key in playlist_file_keys.items()
+    }
+    retroarch_playlists.clear()
+    retroarch_playlists.update(updated_playlists)
+    
+    # Index the games of every platform. If found in more than one file, the first file found wins.
+    games_by_path = all_the_data[APP_DATA][LAUNCHBOX].setdefault(GAMES_BY_PATH, {})
+    games_by_id = all_the_data[APP_DATA][LAUNCHBOX].setdefault(GAMES_BY_ID, {})
+    additional_apps_by_path = all_the_data[APP_DATA][LAUNCHBOX].setdefault(ADDITIONAL_APPS_BY_PATH, {})
+    games_by_path.clear()
+    games_by_id.clear()
+    additional_apps_by_path.clear()
+    for file_key, xml_file_data in platform_xml_records.values():
+        for game_data in xml_file_data['AdditionalApplication']:
+            additional_apps_by_path.setdefault(game_data.get('ApplicationPath'), game_data)
+        for game_data in xml_file_data['Game']:
+            games_by_path.setdefault(game_data.get('ApplicationPath'), game_data)
+            games_by_id.setdefault((game_data.get('ID') or '').lower(), game_data) # IDs are matched ignoring case
+    
+    print(f'Read {len(changed_xml_files)} LaunchBox Platform Files and {len(changed_playlists)} RetroArch Playlists '+
+          f'In {round(Timer() - start_time, 3)} Seconds')
+    
+    return all_the_data
+
+
+### Find all files of a certain type in a directory and which of them are new or changed since last read.
+###     (loaded_files) A Dictionary of files already read { Path : [ File Key, Data ] }.
+###     (directory) Directory to search.
+###     (extension) Type of file to find. Example: '.xml'
+###     (search_sub_dirs) Also search all sub-directories.
+###     --> Returns a [Dictionary] { Path : File Key } and [List] of new or changed file paths
+def getChangedFiles(loaded_files, directory, extension, search_sub_dirs = True):
+    file_keys = {}
+    for root, dirs, files in Search(directory):
+        for file in files:
+            if Path(file).suffix.casefold() == extension:
+                file_path = Path(PurePath().joinpath(root, file))
+                file_stat = file_path.stat()
+                file_keys[file_path] = (file_stat.st_size, file_stat.st_mtime_ns)
+        if not search_sub_dirs:
+            break
+    
+    changed_files = [
+        file_path for file_path, file_key in file_keys.items()
+        if file_path not in loaded_files or loaded_files[file_path][0] != file_key
+    ]
+    return file_keys, changed_files
+
+
+### Read the games in a RetroArch playlist file.
+###     (playlist_path) Path to a RetroArch playlist file.
+###     --> Returns a [List] [ { Game Data }, ... ]
+def readRetroArchPlaylist(playlist_path):
+    try:
+        with open(playlist_path, 'r', encoding="UTF-8") as retroarch_playlist_file: # "cp866")
+            return json.load(retroarch_playlist_file).get('items', [])
+    except (OSError, ValueError, AttributeError) as error:
+        print(f'\nERROR: Could not read RetroArch playlist, skipping it. [ {playlist_path} ] {error}')
+        return []
+
+
+### Open the resume journal, reading what was already saved in a previous run that didn't finish
+### and cleaning up any temporary files it left behind. The journal is locked while open, so if
+### another run of this script is using it, this run goes on without one.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (journal_file_path) Path of the journal file.
+###     --> Returns a [Dictionary]
+def openResumeJournal(all_the_data, journal_file_path = None):
+    if all_the_data[APP_DATA].get(RESUME_JOURNAL):
+        return all_the_data # Already open
+    
+    if not journal_file_path:
+        shard_name = f'_shard{shard[0]}of{shard[1]}' if shard else '' # One journal per shard running
+        journal_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__journal{shard_name}.txt'))
+    
+    journal_file = open(journal_file_path, 'a+', encoding='utf-8')
+    if not lockFile(journal_file):
+        journal_file.close()
+        print('WARNING: Another run of this script is using the resume journal, so this run can\'t be resumed if it stops.')
+        return all_the_data
+    
+    journal_entries = {}
+    temp_files = {}
+    journal_file.seek(0)
+    for line in journal_file:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue # Last line may be incomplete after a crash.
+        if 'temp' in entry:
+            temp_files[entry['temp']] = entry['output'] # Temp file of thumbnail being saved
+        else:
+            journal_entries[entry['output']] = entry['fingerprint']
+            temp_files.pop(entry.get('done_temp'), None)
+    
+    if journal_entries or temp_files:
+        print(f'Resuming Previous Run: {len(journal_entries)} Thumbnails Already Saved')
+    
+    # Delete the temporary files of thumbnails that were never completely saved. The old
+    # thumbnails (if any) were never replaced, so nothing else needs to be restored.
+    for temp_file, output_file in temp_files.items():
+        temp_file = Path(temp_file)
+        output_file = Path(output_file)
+        if temp_file.parent != output_file.parent or not temp_file.name.startswith(f'{output_file.name}.tmp'):
+            continue # Not a temp file this script would make.
+        try:
+            temp_file.unlink()
+            if debug: print(f'  -Cleaned Up Temp File: {temp_file}')
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            print(f'  -WARNING: Couldn\'t Clean Up Temp File: {err}')
+    
+    all_the_data[APP_DATA][RESUME_JOURNAL] = {
+        JOURNAL_ENTRIES : journal_entries,
+        JOURNAL_FILE : journal_file,
+    }
+    
     return all_the_data
 
 
+### Lock a file so no other run of this script can lock it until it's closed (or the run ends).
+###     (file) An open file.
+###     --> Returns a [Boolean] False if another run has it locked
+def lockFile(file):
+    try:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+### Empty the resume journal once everything in it is done, like at the start of a new drop.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def resetResumeJournal(all_the_data):
+    journal = all_the_data[APP_DATA].get(RESUME_JOURNAL)
+    if journal:
+        journal[JOURNAL_FILE].seek(0)
+        journal[JOURNAL_FILE].truncate()
+        journal[JOURNAL_ENTRIES].clear() # Shared by all presets running
+    return None
+
+
+### Add an entry to the resume journal, making sure it's written right away.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (entry) A Dictionary of an output path and either its fingerprint or temp file path.
+###     --> Returns a [None]
+def writeResumeJournal(all_the_data, entry):
+    journal = all_the_data[APP_DATA].get(RESUME_JOURNAL)
+    if journal:
+        with resume_journal_lock: # Also written to by the thumbnail workers.
+            journal[JOURNAL_FILE].write(json.dumps(entry) + '\n')
+            journal[JOURNAL_FILE].flush()
+            if 'fingerprint' in entry:
+                journal[JOURNAL_ENTRIES][entry['output']] = entry['fingerprint']
+    return None
+
+
+### Close the resume journal and delete it, once a run finishes normally.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def closeResumeJournal(all_the_data):
+    journal = all_the_data[APP_DATA].get(RESUME_JOURNAL)
+    if journal:
+        journal_file_path = Path(journal[JOURNAL_FILE].name)
+        # Deleted while still locked where possible, so another run can't start using it first.
+        try:
+            journal_file_path.unlink(missing_ok=True)
+            journal[JOURNAL_FILE].close()
+        except PermissionError: # Windows doesn't delete open files.
+            journal[JOURNAL_FILE].truncate(0)
+            journal[JOURNAL_FILE].close()
+            try:
+                journal_file_path.unlink(missing_ok=True)
+            except PermissionError:
+                pass # Another run opened it in the meantime, and it's empty.
+        all_the_data[APP_DATA][RESUME_JOURNAL] = None
+    return None
+
+
+### Create a fingerprint of a LaunchBox image and everything used to turn it into a RetroArch thumbnail.
+###     (image_source_path) Path to a LaunchBox image.
+###     (image_source_stat) The os.stat_result of the LaunchBox image.
+###     (target) The output target with its image size and saving options.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [String]
+def getImageFingerprint(image_source_path, image_source_stat, target, all_the_data):
+    fingerprint = repr((
+        str(image_source_path), image_source_stat.st_size, image_source_stat.st_mtime_ns,
+        target.get(MODIFY_IMAGE_WIDTH), target.get(MODIFY_IMAGE_HEIGHT), target.get(EXTRA_IMAGE_SAVING_PARAMS),
+        all_the_data.get(IMAGE_RESAMPLING_FILTER, NEAREST), all_the_data.get(KEEP_ASPECT_RATIO, True)
+    ))
+    return sha1(fingerprint.encode('utf-8')).hexdigest()
+
+
+### Read all the settings in a RetroArch config file.
+###     (retroarch_config_path) Path to a "retroarch.cfg" file.
+###     --> Returns a [SectionProxy] (Dictionary like)
+def readRetroArchConfig(retroarch_config_path):
+    with open(retroarch_config_path, 'r') as file:
+        retroarch_config_string = '[SETTINGS]\n' + file.read()
+    retroarch_config_file = configparser.ConfigParser(interpolation=None)
+    #retroarch_config_file.read(retroarch_config_path)
+    retroarch_config_file.read_string(retroarch_config_string)
+    return retroarch_config_file['SETTINGS']
+
+
+### Get the largest thumbnail size RetroArch can show on screen, using the menu driver, screen size
+### and thumbnail upscaling settings in a RetroArch config file. This is an upper bound, not the size
+### of a menu's thumbnail boxes: Ozone, XMB, and MaterialUI show thumbnails much smaller in their game
+### lists, but can also show them fullscreen, so their thumbnails are only fit within the screen.
+###     (retroarch_config_settings) All the settings from a "retroarch.cfg" file.
+###     --> Returns a [Tuple] (Width, Height) or [None] if size unknown
+def getThumbnailSizeProfile(retroarch_config_settings):
+    def getSetting(setting, default = ''):
+        return retroarch_config_settings.get(setting, default).strip('"')
+    def getNumberSetting(setting):
+        value = getSetting(setting, '0')
+        return int(value) if value.isdigit() else 0
+    
+    menu_driver = getSetting('menu_driver').casefold()
+    
+    # RGUI draws its menu (and thumbnails) at a low internal resolution.
+    if menu_driver == 'rgui':
+        max_width, max_height = 320, 240
+    
+    # Ozone, XMB, and MaterialUI (glui) show fullscreen thumbnails no larger than the screen.
+    # Note: There is no fixed fraction of the screen they use, their thumbnail boxes change with
+    #       the aspect ratio, menu scale, and layout, so the screen size is the only safe limit.
+    else:
+        max_width = getNumberSetting('video_fullscreen_x')
+        max_height = getNumberSetting('video_fullscreen_y')
+        if not max_width or not max_height: # 0 = Desktop Resolution
+            max_width = getNumberSetting('video_windowed_position_width')
+            max_height = getNumberSetting('video_windowed_position_height')
+        if not max_width or not max_height:
+            return None
+    
+    # Thumbnails smaller than this get upscaled by RetroArch anyways, so don't make them any smaller.
+    upscale_threshold = getNumberSetting('menu_thumbnail_upscale_threshold')
+    max_width = max(max_width, upscale_threshold)
+    max_height = max(max_height, upscale_threshold)
+    
+    return max_width, max_height
+
+
 ### Get directory path from a RetroArch setting.
 ###     (setting) A string from a settings file.
 ###     (root) Root path if setting is a relative path.
@@ -732,46 +1317,145 @@ def getPathFromSetting(setting, root = None):
 ###     (path) A Path or List of Paths to a game file or a directory of games.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
+###     (title_queue) A Queue to hand off each game title to once its images are found, see streamRetroArchThumbnails().
 ###     --> Returns a [Dictionary]
-def findLaunchBoxGameImages(path, all_the_data):
+def findLaunchBoxGameImages(path, all_the_data, title_queue = None):
     search_sub_dirs = all_the_data.get(SEARCH_SUB_DIRS, False)
     paths = makeList(path)
+    preset_runs = getPresetRuns(all_the_data)
     
-    all_the_data[LOG_DATA][START_TIME] = datetime.now().timestamp()
+    for preset_run in preset_runs:
+        preset_run[LOG_DATA][START_TIME] = datetime.now().timestamp()
     
-    for path in paths:
-        
-        if not Path(path).exists():
-            print(f'Does Not Exist: {path}')
-            continue
-        
-        if Path(path).is_file():
-            
-            game_path = Path(path)
-            all_the_data[LOG_DATA][CURRENT_GAME_PATH] = game_path
-            all_the_data = searchForGameImages(all_the_data)
+    # Image folders are listed again for each new search, picking up any images added since.
+    all_the_data[APP_DATA][LAUNCHBOX][IMAGE_DIR_INDEXES].clear()
+    all_the_data[APP_DATA][LAUNCHBOX][DIRECTORY_LISTINGS].clear()
+    
+    # A game title is handed off once all its game files (discs, regions, etc) in LaunchBox are found, or
+    # once the search moves on to another directory, so its images are planned knowing all its game files.
+    if title_queue != None:
+        title_game_files = getTitleGameFiles(all_the_data)
+    found_titles = {}
+    found_title_files = {}
+    search_directory = None
+    
+    # Images are searched for as soon as each game file is found, while directories are still being searched.
+    for game_path in findGameFiles(paths, search_sub_dirs):
+        # Each preset selects its own images for the game found.
+        for preset_run in preset_runs:
+            preset_run[LOG_DATA][CURRENT_GAME_PATH] = game_path
+            searchForGameImages(preset_run)
         
-        elif Path(path).is_dir():
+        if title_queue != None:
+            if game_path.parent != search_directory:
+                for found_title, found_game_paths in found_titles.items():
+                    queueGameTitle(preset_runs, title_queue, *found_title, found_game_paths)
+                found_titles.clear()
+                search_directory = game_path.parent
             
-            for root, dirs, files in Search(path):
-                for file in files:
-                    
-                    game_path = Path(PurePath().joinpath(root, file))
-                    all_the_data[LOG_DATA][CURRENT_GAME_PATH] = game_path
-                    
-                    # Only known game file extensions
-                    if game_path.suffix in game_extensions:
-                        all_the_data = searchForGameImages(all_the_data)
-                
-                if not search_sub_dirs:
-                    break
+            found_title = preset_runs[0][LOG_DATA][CURRENT_GAME_TITLE]
+            if found_title:
+                found_titles.setdefault(found_title, []).append(game_path)
+                found_title_files.setdefault(found_title, set()).add(str(game_path))
+                if found_title_files[found_title] >= title_game_files.get(found_title, set()):
+                    queueGameTitle(preset_runs, title_queue, *found_title, found_titles.pop(found_title))
     
-    all_the_data[LOG_DATA][END_TIME] = datetime.now().timestamp()
-    all_the_data[LOG_DATA][COMPLETION_TIME] += all_the_data[LOG_DATA][END_TIME] - all_the_data[LOG_DATA][START_TIME]
+    if title_queue != None:
+        for found_title, found_game_paths in found_titles.items():
+            queueGameTitle(preset_runs, title_queue, *found_title, found_game_paths)
+    
+    for preset_run in preset_runs:
+        preset_run[LOG_DATA][END_TIME] = datetime.now().timestamp()
+        preset_run[LOG_DATA][COMPLETION_TIME] += preset_run[LOG_DATA][END_TIME] - preset_run[LOG_DATA][START_TIME]
     
     return all_the_data
 
 
+### Find all the game files in the dropped files and directories. Directories are searched at the same
+### time, but game files are still found in the same order they were dropped.
+###     (paths) A List of Paths to game files or directories of games.
+###     (search_sub_dirs) Also search all sub-directories.
+###     --> Yields a [Path] of each game file found
+def findGameFiles(paths, search_sub_dirs = False):
+    extensions = { extension.casefold() for extension in game_extensions }
+    skip_directories = { directory.casefold() for directory in skip_game_directories }
+    
+    dropped_paths = []
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            dropped_paths.append((path, False))
+        elif path.is_dir():
+            dropped_paths.append((path, True))
+        else:
+            print(f'Does Not Exist: {path}')
+    
+    if sum(is_dir for path, is_dir in dropped_paths) < 2:
+        for path, is_dir in dropped_paths:
+            if is_dir:
+                yield from walkGameDirectory(path, extensions, skip_directories, search_sub_dirs)
+            else:
+                yield path
+        return None
+    
+    # Search each directory in its own thread, passing the game files found through its own queue.
+    def searchDirectory(directory, game_file_queue):
+        try:
+            for game_path in walkGameDirectory(directory, extensions, skip_directories, search_sub_dirs):
+                game_file_queue.put(game_path)
+        finally:
+            game_file_queue.put(None) # Done
+    
+    with ThreadPoolExecutor(max(1, image_folder_workers)) as thread_pool:
+        game_file_queues = [ queue.Queue() if is_dir else None for path, is_dir in dropped_paths ]
+        for (path, is_dir), game_file_queue in zip(dropped_paths, game_file_queues):
+            if is_dir:
+                thread_pool.submit(searchDirectory, path, game_file_queue)
+        
+        for (path, is_dir), game_file_queue in zip(dropped_paths, game_file_queues):
+            if not is_dir:
+                yield path
+                continue
+            game_path = game_file_queue.get()
+            while game_path:
+                yield game_path
+                game_path = game_file_queue.get()
+    
+    return None
+
+
+### Go through a directory (and its sub-directories) like os.walk(), finding all the game files in it.
+###     (directory) A directory Path.
+###     (extensions) A Set of lower case game file extensions.
+###     (skip_directories) A Set of lower case sub-directory names to skip.
+###     (search_sub_dirs) Also search all sub-directories.
+###     --> Yields a [Path] of each game file found
+def walkGameDirectory(directory, extensions, skip_directories, search_sub_dirs = False):
+    sub_directories = []
+    throttleIO(IO_METADATA)
+    try:
+        with os.scandir(directory) as directory_entries:
+            for entry in directory_entries:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    is_directory = False
+                if is_directory:
+                    # Sub-directories are searched after all the files in this directory, like os.walk().
+                    if (search_sub_dirs and not entry.is_symlink() and not entry.name.startswith('.') and
+                        entry.name.casefold() not in skip_directories):
+                        sub_directories.append(entry.path)
+                elif os.path.splitext(entry.name)[1].casefold() in extensions:
+                    yield Path(entry.path)
+    except OSError as error:
+        print(f'Can\'t Search Directory ({error.strerror}): {directory}')
+    
+    for sub_directory in sub_directories:
+        yield from walkGameDirectory(sub_directory, extensions, skip_directories, search_sub_dirs)
+    
+    return None
+
+
 ### Search for the correct game images and record thier paths.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
@@ -787,75 +1471,104 @@ def searchForGameImages(all_the_data):
     #is_multidisc_game = re_disc_info_compiled_pattern.search(game_path.stem)
     
     print(f'\nSearching For LaunchBox Images Of The Game: {game_path.name}')
-    game_found = False
+    all_the_data[LOG_DATA][CURRENT_GAME_TITLE] = None
+    
+    # Find games in <Game> (default) and <AdditionalApplication> (additional discs, regions, versions, hacks, etc)
+    launchbox_game_region = None
+    game_data = all_the_data[APP_DATA][LAUNCHBOX][GAMES_BY_PATH].get(str(game_path))
+    additional_app_data = all_the_data[APP_DATA][LAUNCHBOX][ADDITIONAL_APPS_BY_PATH].get(str(game_path))
+    if additional_app_data:
+        launchbox_game_region = additional_app_data.get('Region')
+        if not game_data:
+            game_data = all_the_data[APP_DATA][LAUNCHBOX][GAMES_BY_ID].get((additional_app_data.get('GameID') or '').lower())
     
-    for root, dirs, files in Search(all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS_DIR_PATH]):
+    if game_data:
+        app_path = game_data.get('ApplicationPath')
+        platform = game_data.get('Platform')
+        game_title = game_data.get('Title')
+        if not launchbox_game_region:
+            launchbox_game_region = game_data.get('Region')
         
-        for file in files:
-            if Path(file).suffix == '.xml':
-                xml_file_path = Path(PurePath().joinpath(root, file))
-                xml_file_data = XMLParser.parse(xml_file_path).getroot()
-                
-                # Find games in <Game> (default) and <AdditionalApplication> (additional discs, regions, versions, hacks, etc)
-                app_id = 'zzzzzzzzzz'
-                game_id = 'xxxxxxxxxx'
-                launchbox_game_region = None
-                
-                #if is_multidisc_game:
-                for game_data in xml_file_data.findall('AdditionalApplication'):
-                    app_path = game_data.find('ApplicationPath').text
-                    
-                    if app_path == str(game_path):
-                        app_id = game_data.find('GameID').text
-                        launchbox_game_region = game_data.find('Region').text
-                        break
-                
-                for game_data in xml_file_data.findall('Game'):
-                    app_path = game_data.find('ApplicationPath').text
-                    game_id = game_data.find('ID').text
-                    
-                    if app_path == str(game_path) or game_id == app_id:
-                        platform = game_data.find('Platform').text
-                        game_title = game_data.find('Title').text
-                        if not launchbox_game_region:
-                            launchbox_game_region = game_data.find('Region').text
-                        
-                        if debug: print(f'  <ApplicationPath>{app_path}</ApplicationPath>')
-                        if debug: print(f'  <Platform>{platform}</Platform>')
-                        if debug: print(f'  <Title>{game_title}</Title>')
-                        if debug: print(f'  <Region>{launchbox_game_region}</Region>')
-                        
-                        if platform in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS]:
-                            
-                            region, region_priority_list = getRegionPriority(all_the_data, platform, launchbox_game_region)
-                            
-                            if game_title in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform].get(GAME_PATHS, {}):
-                                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS][game_title].update({ game_path : region })
-                            else:
-                                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS].update({game_title : { game_path : region }})
-                            
-                            if front_boxart_priority != SKIP:
-                                print(f'\nSearching for best image to use for a RetroArch Boxart thumbnail...')
-                                all_the_data = saveImagePaths(all_the_data, platform, game_title, FRONT_BOXART, DEFAULT_FRONT_BOXARTS, region_priority_list)
-                            
-                            if title_screen_priority != SKIP:
-                                print(f'\nSearching for best image to use for a RetroArch Title thumbnail...')
-                                all_the_data = saveImagePaths(all_the_data, platform, game_title, TITLE_SCREEN, DEFAULT_TITLE_SCREENS, region_priority_list)
-                            
-                            if gameplay_screen_priority != SKIP:
-                                print(f'\nSearching for best image to use for a RetroArch Snap thumbnail...')
-                                all_the_data = saveImagePaths(all_the_data, platform, game_title, GAMEPLAY_SCREEN, DEFAULT_GAMEPLAY_SCREENS, region_priority_list)
-                            
-                            #print(all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][IMAGE_PATHS][game_title])
-                        
-                        game_found = True
-                        break
-                if game_found: break
-        if game_found: break
+        if debug: print(f'  <ApplicationPath>{app_path}</ApplicationPath>')
+        if debug: print(f'  <Platform>{platform}</Platform>')
+        if debug: print(f'  <Title>{game_title}</Title>')
+        if debug: print(f'  <Region>{launchbox_game_region}</Region>')
+        game_id = game_data.get('ID')
+        
+        # Game titles belonging to other shards are left to the scripts running them.
+        if shard and getShardNumber(platform, game_title, shard[1]) != shard[0]:
+            print(f'Skipping Game Title (Shard {getShardNumber(platform, game_title, shard[1])}/{shard[1]}): {game_title}')
+            return all_the_data
+        
+        if platform in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS]:
+            
+            region, region_priority_list = getRegionPriority(all_the_data, platform, launchbox_game_region)
+            all_the_data = prefetchImageDirectories(all_the_data, platform)
+            
+            if game_title in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform].get(GAME_PATHS, {}):
+                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS][game_title].update({ game_path : region })
+            else:
+                all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS].update({game_title : { game_path : region }})
+            all_the_data[LOG_DATA][CURRENT_GAME_TITLE] = ( platform, game_title )
+            
+            if front_boxart_priority != SKIP:
+                print(f'\nSearching for best image to use for a RetroArch Boxart thumbnail...')
+                all_the_data = saveImagePaths(all_the_data, platform, game_title, FRONT_BOXART, DEFAULT_FRONT_BOXARTS, region_priority_list, game_id)
+            
+            if title_screen_priority != SKIP:
+                print(f'\nSearching for best image to use for a RetroArch Title thumbnail...')
+                all_the_data = saveImagePaths(all_the_data, platform, game_title, TITLE_SCREEN, DEFAULT_TITLE_SCREENS, region_priority_list, game_id)
+            
+            if gameplay_screen_priority != SKIP:
+                print(f'\nSearching for best image to use for a RetroArch Snap thumbnail...')
+                all_the_data = saveImagePaths(all_the_data, platform, game_title, GAMEPLAY_SCREEN, DEFAULT_GAMEPLAY_SCREENS, region_priority_list, game_id)
+            
+            #print(all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][IMAGE_PATHS][game_title])
     
     return all_the_data
 
 
+### Compile the auto_region_detector into a single lookup of region codes to region directories.
+### Codes listed in more than one detector entry keep the first (highest priority) entry.
+###     --> Returns a [Dictionary] { Region Code : ( Detector Priority, [Region Directories] ) }
+def compileRegionDetector():
+    region_code_lookup = {}
+    for detector_priority, (region_codes, region_directories) in enumerate(auto_region_detector.items()):
+        # A single code in (parenthesis) is just a string, not a tuple.
+        for region_code in makeList(region_codes):
+            if region_code not in region_code_lookup:
+                region_code_lookup[region_code] = (detector_priority, region_directories)
+    return region_code_lookup
+
+
+### Read the child tags and text of specific elements in a LaunchBox XML file. The faster lxml
+### parser is used if installed, otherwise Python's own XML parser, both creating the same records.
+###     (xml_file_path) Path to a LaunchBox XML file.
+###     (record_tags) A tag or list of tags of the elements to read. Example: ['Game', 'AdditionalApplication']
+###     (child_tags) Only read these child tags, or None to read them all. Example: ['Title', 'Platform']
+###     --> Returns a [Dictionary] { Tag : [ { Child Tag : Text, ... }, ... ] }
+def readLaunchBoxXML(xml_file_path, record_tags, child_tags = None):
+    record_tags = makeList(record_tags)
+    records = { tag : [] for tag in record_tags }
+    child_tags = set(child_tags) if child_tags else None
+    
+    if lxml_installed:
+        xml_events = LXMLParser.iterparse(str(xml_file_path), events=('end',), tag=record_tags)
+    else:
+        xml_events = XMLParser.iterparse(xml_file_path, events=('end',))
+    
+    for event, element in xml_events:
+        if element.tag in records:
+            # Skip comments and other non-tag nodes (lxml only).
+            records[element.tag].append({
+                child.tag : child.text for child in element
+                if type(child.tag) == str and (not child_tags or child.tag in child_tags)
+            })
+            element.clear() # Free memory of elements already read.
+    
+    return records
+
+
 ### Find or detect the region code and rebuild the region priority list from either the preset or default
 ### option. Check file name first for a region code, and if missing use the LaunchBox region setting.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
@@ -864,50 +1577,55 @@ def searchForGameImages(all_the_data):
 ###     (launchbox_game_region) A game's region found in LaunchBox, used if no region code found.
 ###     --> Returns a [String] and [List]
 def getRegionPriority(all_the_data, platform, launchbox_game_region = None):
+    global region_code_lookup
+    if region_code_lookup == None:
+        region_code_lookup = compileRegionDetector()
+    
     game_region_code = None
-    region_priority_reordered_list = []
+    region_directories = None
+    detected_priority = len(region_code_lookup)
     game_path = all_the_data[LOG_DATA][CURRENT_GAME_PATH]
     game_info_list = re_game_info_compiled_pattern.findall(game_path.stem)
     region_priority_list = all_the_data.get(REGION_PRIORITY, DEFAULT_REGIONS) # Missing, use defaults
     region_priority_list = region_priority_list if region_priority_list else DEFAULT_REGIONS # None, use defaults
     
-    for region_code, region_directories in auto_region_detector.items():
-        for game_info in game_info_list:
-            game_info = game_info[1:-1]
-            
-            # Change F to W for Sega Genesis only, so as to not be mixed up with the region France.
-            if game_info == 'F' and platform == 'Sega Genesis':
-                game_info = 'W' # World
-            
-            if game_info in region_code:
-                game_region_code = game_info
-                
-                if always_prioritize_region_free:
-                    region_priority_reordered_list.append('Region Free')
-                
-                region_priority_reordered_list.extend(region_directories)
-                
-                if not detected_regions_only:
-                    for dir in region_priority_list:
-                        if dir not in region_priority_reordered_list:
-                            region_priority_reordered_list.append(dir)
-                break
-        if region_priority_reordered_list:
-            break
+    # The region code belonging to the earliest auto_region_detector entry wins.
+    for game_info in game_info_list:
+        game_info = game_info[1:-1]
+        
+        # Change F to W for Sega Genesis only, so as to not be mixed up with the region France.
+        if game_info == 'F' and platform == 'Sega Genesis':
+            game_info = 'W' # World
+        
+        detected = region_code_lookup.get(game_info)
+        if detected and detected[0] < detected_priority:
+            detected_priority, region_directories = detected
+            game_region_code = game_info
     
-    if region_priority_reordered_list:
-        region_priority_list = region_priority_reordered_list
+    # Only a few dozen different lists are ever built, so reuse them.
+    cache_key = (platform, game_region_code, None if game_region_code else launchbox_game_region, tuple(region_priority_list))
+    if cache_key in region_priority_cache:
+        return game_region_code, region_priority_cache[cache_key]
+    
+    region_priority_reordered_list = []
+    
+    if region_directories:
+        if always_prioritize_region_free:
+            region_priority_reordered_list.append('Region Free')
+        region_priority_reordered_list.extend(region_directories)
     
     # If no region code found in a game's file name, use the region setting from LaunchBox,
     # if set, to build a region priority list from.
     elif launchbox_game_region: ## TODO give higher prio to related regions too?
         region_priority_reordered_list.append(launchbox_game_region)
+    
+    if region_priority_reordered_list:
         if not detected_regions_only:
-            for dir in region_priority_list:
-                if dir not in region_priority_reordered_list:
-                    region_priority_reordered_list.append(dir)
-        region_priority_list = region_priority_reordered_list
+            region_priority_reordered_list.extend(region_priority_list)
+        # Remove duplicate regions, keeping the first (highest priority) of each.
+        region_priority_list = list(dict.fromkeys(region_priority_reordered_list))
     
+    region_priority_cache[cache_key] = region_priority_list
     #print(region_priority_list)
     
     return game_region_code, region_priority_list
@@ -921,8 +1639,9 @@ def getRegionPriority(all_the_data, platform, launchbox_game_region = None):
 ###     (media) Key name of image category priority option.
 ###     (default_media) Default list of image categories.
 ###     (region_priority_list) A list of regions in order of priority.
+###     (game_id) The game's LaunchBox ID, to find images named with it. Example: "Title.<ID>-01.png"
 ###     --> Returns a [Dictionary]
-def saveImagePaths(all_the_data, platform, game_title, media, default_media, region_priority_list):
+def saveImagePaths(all_the_data, platform, game_title, media, default_media, region_priority_list, game_id = None):
     game_path = all_the_data[LOG_DATA][CURRENT_GAME_PATH]
     platform_data = all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].get(platform)
     region = platform_data[GAME_PATHS][game_title][game_path] ##get?
@@ -945,43 +1664,79 @@ def saveImagePaths(all_the_data, platform, game_title, media, default_media, reg
     
     if not platform_data[IMAGE_PATHS].get(game_title):
         platform_data[IMAGE_PATHS][game_title] = { FRONT_BOXART : {}, TITLE_SCREEN : {}, GAMEPLAY_SCREEN : {} }
+    if not platform_data[CLAIMED_IMAGE_PATHS].get(game_title):
+        platform_data[CLAIMED_IMAGE_PATHS][game_title] = { FRONT_BOXART : set(), TITLE_SCREEN : set(), GAMEPLAY_SCREEN : set() }
     
     # Get all alternate images to use with games that have additional discs, regions, versions, hacks, etc.
+    # Every image already claimed by this game title (in any region) is kept in a set for fast lookups.
     current_region_images = makeList(platform_data[IMAGE_PATHS][game_title][media].get(region, []))
-    all_regions_images = list(itertools.chain.from_iterable(
-        platform_data[IMAGE_PATHS][game_title][media].values()
-    ))
+    claimed_images = platform_data[CLAIMED_IMAGE_PATHS][game_title][media]
+    
+    image_validations = all_the_data[APP_DATA][LAUNCHBOX][IMAGE_VALIDATIONS]
+    selection_priority = all_the_data.get(SELECTION_PRIORITY) or DEFAULT_SELECTION_PRIORITY
+    
+    # Image category directories in order of priority.
+    image_directories = [
+        path_data[DIR_PATH] for image_category in image_category_priorities
+        for path_data in platform_data[ALL_MEDIA_TYPES] if image_category == path_data[MEDIA_TYPE]
+    ]
+    
+    # All the images of this game's title, from every image category and region, compete in one ranking.
+    image_candidates = getImageCandidates(
+        all_the_data, image_directories, [game_title] * len(image_directories), region_priority_list,
+        claimed_images, format_preference, preferred_image_number, game_id
+    )
+    image_file_path = selectBestImage(image_candidates, selection_priority, use_random_image, image_validations)
+    
+    if image_file_path:
+        print(f'Found: {image_file_path}')
+        all_the_data[LOG_DATA][IMAGES_FOUND] += 1
+        
+        # Update images including possible alternates
+        current_region_images.append(image_file_path)
+        claimed_images.add(image_file_path)
+        platform_data[IMAGE_PATHS][game_title][media].update(
+            { region : current_region_images }
+        )
+        
+        return all_the_data
     
-    for image_category in image_category_priorities:
-        for path_data in platform_data[ALL_MEDIA_TYPES]:
+    # If no images were ever found for this game's title, look for images with a similar title.
+    if fuzzy_title_matching and all(image in all_the_data[LOG_DATA][FUZZY_MATCHES] for image in claimed_images):
+        similar_titles = [
+            findSimilarImageTitle(getImageDirectoryIndex(all_the_data, image_directory, True), game_title)
+            for image_directory in image_directories
+        ]
+        image_candidates = getImageCandidates(
+            all_the_data, image_directories, [image_title for image_title, confidence in similar_titles], region_priority_list,
+            claimed_images, format_preference, preferred_image_number
+        )
+        image_file_path = selectBestImage(image_candidates, selection_priority, use_random_image, image_validations)
+        
+        if image_file_path:
+            image_title, confidence = similar_titles[
+                next(scores[IMAGE_CATEGORY] for scores, order, path in image_candidates if path == image_file_path)
+            ]
+            print(f'Found (Similar Title {confidence:.0%}): {image_file_path}')
+            all_the_data[LOG_DATA][IMAGES_FOUND] += 1
+            all_the_data[LOG_DATA][FUZZY_MATCHES][image_file_path] = (game_title, image_title, confidence)
             
-            if image_category == path_data[MEDIA_TYPE]:
-                
-                ## TODO: change overall priorities? Example: region > image category
-                ## How? if region (get from auto_region_detector) != region used in searchImageDirectory?
-                ## save image_file_path, and only use if regions never match-up.
-                
-                image_file_path = searchImageDirectory(
-                    path_data[DIR_PATH], game_title, region_priority_list, all_regions_images, format_preference, use_random_image, preferred_image_number
-                )
-                
-                if image_file_path:
-                    print(f'Found: {image_file_path}')
-                    all_the_data[LOG_DATA][IMAGES_FOUND] += 1
-                    
-                    # Update images including possible alternates
-                    current_region_images.append(image_file_path)
-                    platform_data[IMAGE_PATHS][game_title][media].update(
-                        { region : current_region_images }
-                    )
-                    
-                    return all_the_data
+            current_region_images.append(image_file_path)
+            claimed_images.add(image_file_path)
+            platform_data[IMAGE_PATHS][game_title][media].update(
+                { region : current_region_images }
+            )
+            
+            return all_the_data
     
     # If no images were found for the current region, use the images found in all other regions, if
     # there are any. This helps prevent having no images even though there is at least one image to
     # use, but the code is trying to prevent dupes for times when there are many images to select from.
     ## TODO: is there a situation where this shouldn't happen? detected_regions_only, any others?
-    if not detected_regions_only and not current_region_images and all_regions_images:
+    if not detected_regions_only and not current_region_images and claimed_images:
+        all_regions_images = list(itertools.chain.from_iterable(
+            platform_data[IMAGE_PATHS][game_title][media].values()
+        ))
         platform_data[IMAGE_PATHS][game_title][media].update(
             { region : all_regions_images }
         )
@@ -989,480 +1744,1574 @@ def saveImagePaths(all_the_data, platform, game_title, media, default_media, reg
     return all_the_data
 
 
-### Search for an image file name within the directory provided and return the full Path.
-###     (directory) A full Path to a directory.
-###     (partial_file_name) Part of a file name string minus the extension.
-###     (region_priority_list) A list of regions in order of priority.
-###     (ignore_files_list) List of files to ignore (because already found).
-###     (format_preference) Prefer extension: JPG, PNG or None.
-###     (use_random_image) Use a random image or select the first (pref) image found.
-###     (preferred_image_number) Preferred number in image file name.
-###     --> Returns a [Path]
-def searchImageDirectory(directory, partial_file_name, region_priority_list, ignore_files_list = [],
-                         format_preference = None, use_random_image = False, preferred_image_number = None):
-    file_not_found = None
-    pref_file_paths = []
-    not_pref_file_paths = []
-    
-    # Problematic Characters
-    for ic in illegal_characters:
-        partial_file_name = partial_file_name.replace(ic, '_')
-    for ec in re_escape_characters:
-        partial_file_name = partial_file_name.replace(ec, f'\\{ec}')
+### Get the index of an image category directory (and its region sub-directories), listing the
+### directory only the first time it's needed. Every image is indexed by its title (ignoring case) and
+### images named with a LaunchBox game ID also by that ID. If needed, every image's title is also indexed
+### by a normalized key and by the trigrams (3 character parts) of that key for finding similar titles.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (directory) A full Path to an image category directory.
+###     (similar_titles) Also index the image titles for finding similar titles.
+###     --> Returns a [Dictionary]
+def getImageDirectoryIndex(all_the_data, directory, similar_titles = False):
+    image_dir_indexes = all_the_data[APP_DATA][LAUNCHBOX][IMAGE_DIR_INDEXES]
     
-    for region in region_priority_list:
-        
-        if region == 'Region Free' or region == '' or region == '.':
-            region_path = Path(directory)
-        else:
-            region_path = Path(PurePath().joinpath(directory, region))
+    if directory not in image_dir_indexes:
+        image_dir_index = { IMAGE_FILES : {}, IMAGE_TITLES : {}, IMAGE_GAME_IDS : {}, TITLE_KEYS : None, TITLE_TRIGRAMS : None }
+        listing_order = 0
         
-        if region_path.exists():
+        for root, files in walkDirectoryListing(all_the_data[APP_DATA][LAUNCHBOX][DIRECTORY_LISTINGS], directory):
+            region = Path(root).relative_to(directory).as_posix()
+            region = region if region != '.' else ''
+            image_dir_index[IMAGE_FILES][region] = files
             
-            for root, dirs, files in Search(region_path):
-                
-                first_image_found = False
+            for file in files:
+                file_name_match = re_image_file_name_compiled_pattern.match(file)
+                if not file_name_match:
+                    continue
+                image_title = file_name_match.group(1).casefold()
+                image_game_id = file_name_match.group(2).lower() if file_name_match.group(2) else None
+                image_entry = (listing_order, region, root, file, int(file_name_match.group(3)), image_game_id)
+                if image_title not in image_dir_index[IMAGE_TITLES]:
+                    image_dir_index[IMAGE_TITLES][image_title] = []
+                image_dir_index[IMAGE_TITLES][image_title].append(image_entry)
+                if image_game_id:
+                    if image_game_id not in image_dir_index[IMAGE_GAME_IDS]:
+                        image_dir_index[IMAGE_GAME_IDS][image_game_id] = []
+                    image_dir_index[IMAGE_GAME_IDS][image_game_id].append(image_entry)
+                listing_order += 1
+        
+        image_dir_indexes[directory] = image_dir_index
+    
+    image_dir_index = image_dir_indexes[directory]
+    
+    if similar_titles and image_dir_index[TITLE_KEYS] == None:
+        image_dir_index[TITLE_KEYS] = {}
+        image_dir_index[TITLE_TRIGRAMS] = {}
+        
+        for files in image_dir_index[IMAGE_FILES].values():
+            for file in files:
+                file_name_match = re_image_file_name_compiled_pattern.match(file)
+                if not file_name_match:
+                    continue
+                image_title = file_name_match.group(1)
+                title_key = normalizeTitle(image_title)
                 
-                for file in files:
-                    file_path = Path(PurePath().joinpath(root, file))
-                    if file_path in ignore_files_list: continue
-                    
-                    # Match: [Game Title] + [.<ID>-##] or [-##]
-                    if re.match(f'{partial_file_name}[\.|\-][\w|\-]*(\-?\d*\.)', file_path.name, re.IGNORECASE):
-                        
-                        # Once any game's title image found, any image afterwards "not matched"
-                        # will mean there aren’t any more images to find in this directory.
-                        first_image_found = True
-                        
-                        #print(re.match(f'{partial_file_name}[\.|\-][\w|\-]*(\-?0*{preferred_image_number}\.)', file_path.name, re.IGNORECASE))
-                        
-                        if preferred_image_number != None:
-                            if re.match(f'{partial_file_name}[\.|\-][\w|\-]*(\-?0*{preferred_image_number}\.)', file_path.name, re.IGNORECASE):
-                                ## TODO: let it be known preferred_image_number hit and not search for it again?
-                                ## so make preferred_image_number = None, upon calling def again.
-                                return file_path # Preferred Number Found
-                        
-                        # If Pillow not installed
-                        if not use_random_image and not pillow_installed and file_path.suffix in PNG:
-                            if preferred_image_number != None:
-                                pref_file_paths.append(file_path)
-                            else:
-                                return file_path # No random and pillow not installed
+                if title_key not in image_dir_index[TITLE_KEYS]:
+                    image_dir_index[TITLE_KEYS][title_key] = set()
+                    for trigram in getTrigrams(title_key):
+                        if trigram not in image_dir_index[TITLE_TRIGRAMS]:
+                            image_dir_index[TITLE_TRIGRAMS][trigram] = set()
+                        image_dir_index[TITLE_TRIGRAMS][trigram].add(title_key)
+                image_dir_index[TITLE_KEYS][title_key].add(image_title)
+    
+    return image_dir_index
+
+
+### Get all the images of a title in image category directories that could be used, each scored by
+### every selection priority (lower is better). Images already claimed are never used again.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_directories) A list of image category directories in order of priority.
+###     (image_titles) The title of the images to get from each image category directory, None to skip one.
+###     (region_priority_list) A list of regions in order of priority.
+###     (claimed_images) Set of image files already claimed (used).
+###     (format_preference) Prefer extension: JPG, PNG or None.
+###     (preferred_image_number) Preferred number in image file name.
+###     (game_id) A LaunchBox game ID. Only the images named with it are used, if any are found in an image
+###               category directory, otherwise the images named by title that don't belong to another game.
+###     --> Returns a [List] of [Tuples] ( { Selection Priority : Score }, Listing Order, Image Path )
+def getImageCandidates(all_the_data, image_directories, image_titles, region_priority_list, claimed_images = set(),
+                       format_preference = None, preferred_image_number = None, game_id = None):
+    image_candidates = []
+    region_ranks = getRegionRanks(region_priority_list)
+    region_free_rank = region_ranks.get('')
+    games_by_id = all_the_data[APP_DATA][LAUNCHBOX].get(GAMES_BY_ID, {})
+    game_id = game_id.lower() if game_id else None
+    
+    for directory_rank, (image_directory, image_title) in enumerate(zip(image_directories, image_titles)):
+        if not image_title:
+            continue
+        
+        # Problematic Characters
+        for ic in illegal_characters:
+            image_title = image_title.replace(ic, '_')
+        
+        image_dir_index = getImageDirectoryIndex(all_the_data, image_directory)
+        
+        # Many games can have the same title ("Tetris"), so LaunchBox adds the game's ID to the image file names
+        # of all but one of them. Images of other games with the same title are never used.
+        image_entries = image_dir_index[IMAGE_GAME_IDS].get(game_id) if game_id else None
+        if not image_entries:
+            image_entries = [
+                image_entry for image_entry in image_dir_index[IMAGE_TITLES].get(image_title.casefold(), [])
+                if not image_entry[5] or image_entry[5] == game_id or image_entry[5] not in games_by_id
+            ]
+        
+        for listing_order, region, root, file, image_number, image_game_id in image_entries:
+            
+            # Images in regions not in the region priority list can still be found by searching all of the region free directory.
+            region = region.split('/')[0]
+            if region in region_ranks:
+                region_score = (region_ranks[region], 0)
+            elif region_free_rank != None:
+                region_score = (region_free_rank, 1)
+            else:
+                continue
+            
+            file_path = Path(PurePath().joinpath(root, file))
+            if file_path in claimed_images:
+                continue
+            
+            extension = os.path.splitext(file)[1].lower()
+            if not pillow_installed and extension not in PNG:
+                continue # Can't use this image
+            
+            image_candidates.append(({
+                IMAGE_CATEGORY : directory_rank,
+                IMAGE_REGION   : region_score,
+                IMAGE_NUMBER   : 0 if preferred_image_number == None or image_number == int(preferred_image_number) else 1,
+                IMAGE_FORMAT   : 0 if format_preference == None or extension in format_preference else 1,
+            }, listing_order, file_path))
+    
+    return image_candidates
+
+
+### Get the rank of every region directory in a region priority list, with the region free (root)
+### directory as ''.
+###     (region_priority_list) A list of regions in order of priority.
+###     --> Returns a [Dictionary] { Region Directory : Rank }
+def getRegionRanks(region_priority_list):
+    region_ranks = {}
+    for rank, region in enumerate(region_priority_list):
+        if region == 'Region Free' or region == '' or region == '.':
+            region = ''
+        if region not in region_ranks:
+            region_ranks[region] = rank
+    return region_ranks
+
+
+### Select the best image by sorting the images by their scores in the order of selection priorities.
+### Any selection priorities left out are used last, in their default order. Images tied for the best
+### scores are selected from randomly or by the order they were listed in.
+###     (image_candidates) A list of images, see getImageCandidates().
+###     (selection_priority) A list of selection priorities in order. Example: [IMAGE_REGION, IMAGE_CATEGORY]
+###     (use_random_image) Use a random image or select the first image of the best images.
+###     (image_validations) Images already checked for problems, see checkImageFile(). None to not check images.
+###     --> Returns a [Path] or None if no usable image
+def selectBestImage(image_candidates, selection_priority = DEFAULT_SELECTION_PRIORITY, use_random_image = False,
+                    image_validations = None):
+    selection_priority = list(selection_priority)
+    selection_priority.extend(priority for priority in DEFAULT_SELECTION_PRIORITY if priority not in selection_priority)
+    
+    def getScore(image_candidate):
+        return [ image_candidate[0][priority] for priority in selection_priority ]
+    
+    image_candidates = sorted(image_candidates, key = lambda image_candidate: (getScore(image_candidate), image_candidate[1]))
+    
+    for score, best_image_candidates in itertools.groupby(image_candidates, key = getScore):
+        # Skip broken images so the next best image is used.
+        image_paths = [
+            image_path for scores, listing_order, image_path in best_image_candidates
+            if image_validations == None or not checkImageFile(image_validations, image_path)
+        ]
+        if image_paths:
+            return RandomOption(image_paths) if use_random_image else image_paths[0]
+    
+    return None
+
+
+### Find the image title most similar to a game's title in an image directory index.
+###     (image_dir_index) An image directory index.
+###     (game_title) A game's title.
+###     --> Returns a [String] image title (or None) and [Float] confidence from 0.0 to 1.0
+def findSimilarImageTitle(image_dir_index, game_title):
+    title_key = normalizeTitle(game_title)
+    
+    # Same title when ignoring case, accents, and punctuation.
+    if title_key in image_dir_index[TITLE_KEYS]:
+        return sorted(image_dir_index[TITLE_KEYS][title_key])[0], 1.0
+    
+    title_trigrams = getTrigrams(title_key)
+    shared_trigrams = {}
+    for trigram in title_trigrams:
+        for similar_title_key in image_dir_index[TITLE_TRIGRAMS].get(trigram, ()):
+            shared_trigrams[similar_title_key] = shared_trigrams.get(similar_title_key, 0) + 1
+    
+    best_title_key, best_confidence = None, 0
+    title_numbers = getTitleNumbers(title_key)
+    for similar_title_key, shared_count in shared_trigrams.items():
+        # Dice coefficient of both titles' trigrams.
+        confidence = 2 * shared_count / (len(title_trigrams) + len(getTrigrams(similar_title_key)))
+        if (confidence > best_confidence or (confidence == best_confidence and similar_title_key < best_title_key)):
+            # Never match sequels, "Game 2" with "Game 3" or "Game II" with "Game III".
+            if getTitleNumbers(similar_title_key) == title_numbers:
+                best_title_key, best_confidence = similar_title_key, confidence
+    
+    if best_title_key and best_confidence >= fuzzy_title_matching:
+        return sorted(image_dir_index[TITLE_KEYS][best_title_key])[0], best_confidence
+    
+    return None, best_confidence
+
+
+### Normalize a title for comparing, ignoring case, accents, punctuation, and spacing.
+### Example: "Pokémon: Red Version" = "pokemon red version"
+###     (title) A game or image title.
+###     --> Returns a [String]
+def normalizeTitle(title):
+    title = ''.join(c for c in unicodedata.normalize('NFKD', title) if not unicodedata.combining(c))
+    return ' '.join(re_non_word_compiled_pattern.split(title.casefold())).strip()
+
+
+### Get all the trigrams (3 character parts) of a normalized title.
+###     (title_key) A normalized title.
+###     --> Returns a [Set]
+def getTrigrams(title_key):
+    title_key = f'  {title_key} '
+    return { title_key[i:i+3] for i in range(len(title_key) - 2) }
+
+
+### Get all the numbers (including roman numerals) in a normalized title.
+###     (title_key) A normalized title.
+###     --> Returns a [List]
+def getTitleNumbers(title_key):
+    return [ word for word in title_key.split(' ') if word.isdigit() or re_roman_numeral_compiled_pattern.match(word) ]
+
+
+### List all of a platform's image category directories (and their region sub-directories) that
+### will be searched, many at the same time, so searching them later won't need to wait on the disk.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (platform) The platform whose image directories to list.
+###     --> Returns a [Dictionary]
+def prefetchImageDirectories(all_the_data, platform):
+    directory_listings = all_the_data[APP_DATA][LAUNCHBOX][DIRECTORY_LISTINGS]
+    image_categories = set()
+    for media, default_media in [(FRONT_BOXART, DEFAULT_FRONT_BOXARTS),
+                                 (TITLE_SCREEN, DEFAULT_TITLE_SCREENS),
+                                 (GAMEPLAY_SCREEN, DEFAULT_GAMEPLAY_SCREENS)]:
+        if all_the_data.get(media) != SKIP:
+            image_categories.update(all_the_data.get(media) or default_media)
+    
+    directories = [
+        path_data[DIR_PATH] for path_data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][ALL_MEDIA_TYPES]
+        if path_data[MEDIA_TYPE] in image_categories and path_data[DIR_PATH] not in directory_listings
+    ]
+    if not directories:
+        return all_the_data
+    
+    # List one level of directories at a time, then all the sub-directories found in them.
+    with ThreadPoolExecutor(max(1, image_folder_workers)) as thread_pool:
+        while directories:
+            directories = list(dict.fromkeys(directories))
+            for directory, listing in zip(directories, thread_pool.map(listDirectory, directories)):
+                directory_listings[directory] = listing
+            directories = [
+                sub_directory for directory in directories if directory_listings[directory]
+                for sub_directory in directory_listings[directory][1] if sub_directory not in directory_listings
+            ]
+    
+    return all_the_data
+
+
+### List the files and sub-directories in a directory.
+###     (directory) A full Path to a directory.
+###     --> Returns a [Tuple] ( [File Names], [Sub-Directory Paths] ) or None if directory doesn't exist
+def listDirectory(directory):
+    files = []
+    sub_directories = []
+    throttleIO(IO_METADATA)
+    try:
+        with os.scandir(directory) as directory_entries:
+            for entry in directory_entries:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    is_directory = False
+                if is_directory:
+                    sub_directories.append(Path(entry.path))
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return None
+    return files, sub_directories
+
+
+### Get the listing of a directory, only listing it the first time it's needed. If the parent
+### directory was already listed, a directory that isn't in it is known not to exist without asking the disk.
+###     (directory_listings) Directory listings already read { Path : ( [File Names], [Sub-Directory Paths] ) }
+###     (directory) A full Path to a directory.
+###     --> Returns a [Tuple] ( [File Names], [Sub-Directory Paths] ) or None if directory doesn't exist
+def getDirectoryListing(directory_listings, directory):
+    directory = Path(directory)
+    if directory not in directory_listings:
+        parent_listing = directory_listings.get(directory.parent, False)
+        if parent_listing == None or (parent_listing and directory not in parent_listing[1]):
+            return None
+        directory_listings[directory] = listDirectory(directory)
+    return directory_listings[directory]
+
+
+### Go through a directory and all its sub-directories like os.walk(), but using directory listings.
+###     (directory_listings) Directory listings already read, see getDirectoryListing().
+###     (directory) A full Path to a directory.
+###     --> Yields a [Path] directory and [List] of file names in it
+def walkDirectoryListing(directory_listings, directory):
+    listing = getDirectoryListing(directory_listings, directory)
+    if listing:
+        yield Path(directory), listing[0]
+        for sub_directory in listing[1]:
+            yield from walkDirectoryListing(directory_listings, sub_directory)
+
+
+### Check an image file for problems, only checking it again if its file size or modified time changes.
+###     (image_validations) Images already checked { Path : ( ( Size, Modified Time ), Problem ) }
+###     (file_path) A full Path to an image file.
+###     --> Returns a [String] problem found or None if image is usable
+def checkImageFile(image_validations, file_path):
+    if not validate_source_images:
+        return None
+    throttleIO(IO_METADATA)
+    try:
+        file_stat = file_path.stat()
+    except OSError as error:
+        return f'Image File Can\'t Be Read: {error.strerror}'
+    
+    file_version = (file_stat.st_size, file_stat.st_mtime_ns)
+    image_validation = image_validations.get(file_path)
+    if not image_validation or image_validation[0] != file_version:
+        image_problem = validateImageFile(file_path, file_stat.st_size)
+        if image_problem:
+            print(f'Skipping Broken Image ({image_problem}): {file_path}')
+        image_validation = image_validations[file_path] = (file_version, image_problem)
+    
+    return image_validation[1]
+
+
+### Check if an image file is a complete JPEG or PNG image by only reading the start and end of the
+### file, without decoding it. Any extra data after the end of an image (like padding) is ignored, as
+### it is by Pillow and RetroArch.
+###     (file_path) A full Path to an image file.
+###     (file_size) The size of the image file.
+###     --> Returns a [String] problem found or None if image is usable
+def validateImageFile(file_path, file_size):
+    throttleIO(IO_READ, min(file_size, 32 + 1024))
+    try:
+        with open(file_path, 'rb') as file:
+            header = file.read(32)
+            file.seek(max(0, file_size - 1024))
+            footer = file.read()
+    except OSError as error:
+        return f'Image File Can\'t Be Read: {error.strerror}'
+    
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        # The first chunk must be a 13 byte "IHDR" with a width and height.
+        if header[8:16] != b'\x00\x00\x00\x0dIHDR' or not int.from_bytes(header[16:20], 'big') or not int.from_bytes(header[20:24], 'big'):
+            return 'Bad PNG Header'
+        if b'IEND\xae\x42\x60\x82' not in footer and not findImageEnd(file_path, True):
+            return 'Incomplete PNG File'
+    elif header.startswith(b'\xff\xd8\xff'):
+        if not pillow_installed and file_path.suffix.lower() in PNG:
+            return 'JPEG Image With A PNG File Extension' # Can't be converted without Pillow.
+        # Every JPEG ends with an "End Of Image" marker.
+        if b'\xff\xd9' not in footer and not findImageEnd(file_path, False):
+            return 'Incomplete JPEG File'
+    else:
+        return 'Not A JPEG Or PNG Image'
+    
+    return None
+
+
+### Find the end of a PNG or JPEG image with more extra data after it than validateImageFile() reads,
+### by skipping from chunk to chunk (PNG) or segment to segment (JPEG) from the start of the file.
+###     (file_path) A full Path to an image file.
+###     (is_png) True if a PNG image, False if a JPEG image.
+###     --> Returns a [Integer] position in the file the image ends at or None if the image is incomplete
+def findImageEnd(file_path, is_png):
+    try:
+        with open(file_path, 'rb') as file:
+            if is_png:
+                file.seek(8)
+                while True:
+                    throttleIO(IO_READ, 8)
+                    chunk_header = file.read(8)
+                    if len(chunk_header) < 8:
+                        return None
+                    if chunk_header[4:8] == b'IEND':
+                        return file.tell() if len(file.read(4)) == 4 else None # After its CRC
+                    file.seek(int.from_bytes(chunk_header[0:4], 'big') + 4, os.SEEK_CUR) # Chunk data and CRC
+            
+            # Skip the segments before the image data (SOS), any "End Of Image" markers in them belong to
+            # embedded thumbnails. In the image data itself 0xFF is always followed by 0x00 or a marker.
+            file.seek(2)
+            while True:
+                throttleIO(IO_READ, 4)
+                marker = file.read(2)
+                while len(marker) == 2 and marker[1] == 0xFF: # Padding
+                    marker = marker[1:] + file.read(1)
+                if len(marker) < 2 or marker[0] != 0xFF or marker[1] == 0xD9:
+                    return None
+                if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD8: # No segment data
+                    continue
+                segment_size = file.read(2)
+                if len(segment_size) < 2:
+                    return None
+                file.seek(int.from_bytes(segment_size, 'big') - 2, os.SEEK_CUR)
+                if marker[1] == 0xDA:
+                    break
+            
+            last_byte = b''
+            while True:
+                throttleIO(IO_READ, 1024 * 1024)
+                image_data = last_byte + file.read(1024 * 1024)
+                if len(image_data) <= len(last_byte):
+                    return None
+                image_end = image_data.find(b'\xff\xd9')
+                if image_end != -1:
+                    return file.tell() - len(image_data) + image_end + 2
+                last_byte = image_data[-1:]
+    
+    except OSError:
+        return None
+    
+    return None
+
+
+### Create RetroArch thumbnail file paths for each LaunchBox image found.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary]
+def createRetroArchImagePaths(all_the_data):
+    output_targets = getOutputTargets(all_the_data)
+    
+    all_the_data[LOG_DATA][START_TIME] = datetime.now().timestamp()
+    
+    # Thumbnail directories are listed again for each new run, picking up any changes made since.
+    all_the_data[APP_DATA][RETROARCH][THUMBNAIL_SNAPSHOTS] = {}
+    existing_directories.clear()
+    
+    all_the_data = planAlternateImages(all_the_data)
+    
+    for platform, data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
+        for game_title, media in data[IMAGE_PATHS].items():
+            all_the_data = createRetroArchTitleImages(all_the_data, output_targets, platform, game_title, data[GAME_PATHS][game_title], media)
+    
+    finishThumbnailJobs()
+    syncSavedDirectories()
+    saveThumbnailFingerprints(all_the_data)
+    
+    all_the_data[LOG_DATA][END_TIME] = datetime.now().timestamp()
+    all_the_data[LOG_DATA][COMPLETION_TIME] += all_the_data[LOG_DATA][END_TIME] - all_the_data[LOG_DATA][START_TIME]
+    
+    return all_the_data
+
+
+### Create the RetroArch thumbnails of a game title's game files found in a RetroArch playlist.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (output_targets) A list of output targets, see getOutputTargets().
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title, which can have one or more game files.
+###     (game_paths) The game files to create thumbnails for. { Game Path : Region }
+###     (media) The LaunchBox images found for each image category and region.
+###     --> Returns a [Dictionary]
+def createRetroArchTitleImages(all_the_data, output_targets, platform, game_title, game_paths, media):
+    
+    # When verifying, thumbnails are only planned here and checked afterwards, see verifyRetroArchThumbnails().
+    if all_the_data[APP_DATA].get(THUMBNAIL_AUDIT) != None:
+        createThumbnailImage = planThumbnailAudit
+    else:
+        createThumbnailImage = createRetroArchThumbnailImage
+    
+    print('\nGame Title:')
+    print(f'  {game_title}')
+    
+    for retroarch_playlist_path, (file_key, retroarch_game_data) in all_the_data[APP_DATA][RETROARCH][PLAYLISTS].items():
+        launchbox_platform_name = platform
+        retroarch_platform_name = retroarch_playlist_path.stem
+        
+        # Only search playlist files if they belong to the same platform.
+        if match_platforms_before_search:
+            # Remove any ' (text)' from RetroArch platforms/playlists.
+            para_text = re_parenthesis_text_compiled_pattern.findall(retroarch_platform_name)
+            retroarch_platform_name_match = retroarch_platform_name
+            for remove_text in para_text:
+                retroarch_platform_name_match = retroarch_platform_name_match.replace(remove_text, '')
+            
+            # Only search though playlist if platforms are the same (skip others to save time).
+            if launchbox_platform_name in matching_platforms:
+                if retroarch_platform_name_match not in matching_platforms[launchbox_platform_name]:
+                    continue
+            else:
+                if retroarch_platform_name.find('Nintendo - ') > -1:
+                    retroarch_platform_name_match = retroarch_platform_name.replace('Nintendo - ','').casefold()
+                if retroarch_platform_name.find('Bandai - ') > -1:
+                    retroarch_platform_name_match = retroarch_platform_name.replace('Bandai - ','').casefold()
+                if retroarch_platform_name.find('Coleco - ') > -1:
+                    retroarch_platform_name_match = retroarch_platform_name.replace('Coleco - ','').casefold()
+                
+                retroarch_platform_name_match = retroarch_platform_name.replace(' - ',' ').casefold()
+                if retroarch_platform_name_match.find(launchbox_platform_name.casefold()) == -1:
+                    continue
+        
+        if debug: print(f'-Game in LB Platform: {launchbox_platform_name}, Searching RA Platform: {retroarch_platform_name}')
+        
+        # Number of games found under the same game title in RetroArch.
+        ra_games_found = 0
+        ra_game_found = False
+        
+        for game in retroarch_game_data:
+            ra_game_found = False
+            
+            for game_path in game_paths:
+                ra_game_path = Path(game['path'])
+                
+                # If an archived game points to a specific file inside of archive, remove "#file".
+                # Example: "game.zip#game.rom"
+                hash_index = ra_game_path.name.rfind(game_path.suffix + '#')
+                if hash_index > -1:
+                    ra_game_path = Path(PurePath().joinpath(ra_game_path.parent, f'{ra_game_path.name[:hash_index]}{game_path.suffix}'))
+                
+                #if game['path'] == str(game_path):
+                if ra_game_path == game_path:
+                    ra_game_found = True
+                    ra_games_found += 1
+                    
+                    retroarch_game_file_name = f'{game["label"]}.png'.replace('&', '_')
+                    
+                    #print('Game Title:')
+                    #print(f'  {game["label"]}')
+                    print('Game Path (Found In Both LaunchBox and RetroArch):')
+                    print(f'  {game["path"]}')
+                    
+                    region = game_paths[game_path]
+                    launchbox_front_boxart_paths = media[FRONT_BOXART].get(region, [None])
+                    launchbox_title_screen_paths = media[TITLE_SCREEN].get(region, [None])
+                    launchbox_gameplay_screen_paths = media[GAMEPLAY_SCREEN].get(region, [None])
+                    print('Usable Front Boxart Images:')
+                    boxart_paths = ",\n  ".join([str(path) for path in launchbox_front_boxart_paths])
+                    print(f'  {boxart_paths}')
+                    print('Usable Title Screen Images:')
+                    title_paths = ",\n  ".join([str(path) for path in launchbox_title_screen_paths])
+                    print(f'  {title_paths}')
+                    print('Usable Gameplay Screen Images:')
+                    gameplay_paths = ",\n  ".join([str(path) for path in launchbox_gameplay_screen_paths])
+                    print(f'  {gameplay_paths}')
+                    
+                    print('New RetroArch Thumbnail Paths:')
+                    #print(f'Database Name: {game["db_name"]}')
+                    #retroarch_platform_name = Path(game["db_name"]).stem
+                    
+                    if not all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS].get(game_path):
+                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path] = {}
+                        all_the_data[LOG_DATA][GAME_PATHS_IN_LB_RA].append(game_path)
+                    
+                    # Create new RetroArch image paths, one for each output target.
+                    if launchbox_front_boxart_paths[0]:
+                        retroarch_front_boxart_paths = getRetroArchThumbnailPaths(
+                            output_targets,
+                            retroarch_platform_name,
+                            'Named_Boxarts',
+                            retroarch_game_file_name
+                        )
+                        for retroarch_front_boxart_path in retroarch_front_boxart_paths:
+                            print(f'  {retroarch_front_boxart_path}')
+                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
+                            FRONT_BOXART : retroarch_front_boxart_paths
+                        })
+                        createThumbnailImage(
+                            all_the_data,
+                            launchbox_front_boxart_paths,
+                            retroarch_front_boxart_paths,
+                            platform, game_title, game_path, FRONT_BOXART
+                        )
+                    if launchbox_title_screen_paths[0]:
+                        retroarch_title_screen_paths = getRetroArchThumbnailPaths(
+                            output_targets,
+                            retroarch_platform_name,
+                            'Named_Titles',
+                            retroarch_game_file_name
+                        )
+                        for retroarch_title_screen_path in retroarch_title_screen_paths:
+                            print(f'  {retroarch_title_screen_path}')
+                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
+                            TITLE_SCREEN : retroarch_title_screen_paths
+                        })
+                        createThumbnailImage(
+                            all_the_data,
+                            launchbox_title_screen_paths,
+                            retroarch_title_screen_paths,
+                            platform, game_title, game_path, TITLE_SCREEN
+                        )
+                    if launchbox_gameplay_screen_paths[0]:
+                        retroarch_gameplay_screen_paths = getRetroArchThumbnailPaths(
+                            output_targets,
+                            retroarch_platform_name,
+                            'Named_Snaps',
+                            retroarch_game_file_name
+                        )
+                        for retroarch_gameplay_screen_path in retroarch_gameplay_screen_paths:
+                            print(f'  {retroarch_gameplay_screen_path}')
+                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
+                            GAMEPLAY_SCREEN : retroarch_gameplay_screen_paths
+                        })
+                        createThumbnailImage(
+                            all_the_data,
+                            launchbox_gameplay_screen_paths,
+                            retroarch_gameplay_screen_paths,
+                            platform, game_title, game_path, GAMEPLAY_SCREEN
+                        )
+                
+                # If at least one game found in game_paths, move on to next RetroArch game.
+                if ra_game_found:
+                    break
+            
+            # If all games under the same game title found, move on to next game_title.
+            if ra_games_found >= len(game_paths):
+                break
+        
+        # No need to search additional RetroArch playlists if at least one...
+        ## TODO: would the same game ever be in multiple RetroArch playlists?
+        if ra_game_found:
+            break
+    
+    return all_the_data
+
+
+### Create RetroArch thumbnails while game files are still being searched for. Each game title is
+### handed off (see findLaunchBoxGameImages) to a thread creating its thumbnails, so the first
+### thumbnails are saved while the search goes on. The thumbnail workers still make the thumbnails,
+### so it all takes about as long as searching and then creating, unless the search itself is slow.
+###     (paths) A list of Paths to game files or directories of games.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary]
+def streamRetroArchThumbnails(paths, all_the_data):
+    preset_runs = getPresetRuns(all_the_data)
+    completion_times = [ preset_run[LOG_DATA][COMPLETION_TIME] for preset_run in preset_runs ]
+    start_time = datetime.now().timestamp()
+    title_queue = queue.Queue()
+    
+    # Only the thread creating thumbnails prints. What the search prints is handed off with each game title.
+    stream_output = StreamOutput(sys.stdout)
+    sys.stdout = stream_output
+    try:
+        with ThreadPoolExecutor(1) as thread_pool:
+            thumbnail_creator = thread_pool.submit(createQueuedThumbnails, preset_runs, title_queue, stream_output)
+            try:
+                all_the_data = findLaunchBoxGameImages(paths, all_the_data, title_queue)
+            finally:
+                title_queue.put(stream_output.takeHeldOutput())
+                title_queue.put(None) # Done
+            thumbnail_creator.result()
+    finally:
+        sys.stdout = stream_output.stdout
+        print(stream_output.takeHeldOutput(), end='') # Anything not printed if thumbnail creation stopped early
+    
+    # Searching and creating overlap, so the time to completion is the time it all took together.
+    end_time = datetime.now().timestamp()
+    for preset_run, completion_time in zip(preset_runs, completion_times):
+        preset_run[LOG_DATA][END_TIME] = end_time
+        preset_run[LOG_DATA][COMPLETION_TIME] = completion_time + end_time - start_time
+    
+    return all_the_data
+
+
+### Standard output while streaming, only printing what one thread prints. Everything else printed is
+### held until taken, so lines printed by different threads are never mixed together.
+class StreamOutput(TextIOBase):
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.printing_thread = None
+        self.held_output = []
+        self.lock = threading.Lock()
+    
+    def write(self, text):
+        if threading.get_ident() == self.printing_thread:
+            return self.stdout.write(text)
+        with self.lock:
+            self.held_output.append(text)
+        return len(text)
+    
+    def flush(self):
+        if threading.get_ident() == self.printing_thread:
+            self.stdout.flush()
+    
+    ### Take everything held so far.
+    ###     --> Returns a [String]
+    def takeHeldOutput(self):
+        with self.lock:
+            held_output = ''.join(self.held_output)
+            self.held_output.clear()
+        return held_output
+
+
+### Get all the game files of each game title in LaunchBox, including additional applications.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary] { ( Platform, Game Title ) : { Game File Paths } }
+def getTitleGameFiles(all_the_data):
+    title_game_files = {}
+    for app_path, game_data in all_the_data[APP_DATA][LAUNCHBOX][GAMES_BY_PATH].items():
+        title_game_files.setdefault((game_data.get('Platform'), game_data.get('Title')), set()).add(app_path)
+    for app_path, additional_app_data in all_the_data[APP_DATA][LAUNCHBOX][ADDITIONAL_APPS_BY_PATH].items():
+        game_data = all_the_data[APP_DATA][LAUNCHBOX][GAMES_BY_ID].get((additional_app_data.get('GameID') or '').lower())
+        if game_data:
+            title_game_files.setdefault((game_data.get('Platform'), game_data.get('Title')), set()).add(app_path)
+    return title_game_files
+
+
+### Hand off a game title with the images found for it to be created, see streamRetroArchThumbnails().
+### Everything is copied, so any other game files of the same title found later don't change it.
+###     (preset_runs) The data of every preset being run, see getPresetRuns().
+###     (title_queue) The Queue game titles are handed off to.
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title, which can have one or more game files.
+###     (new_game_paths) The game files found since the game title was last handed off.
+###     --> Returns a [None]
+def queueGameTitle(preset_runs, title_queue, platform, game_title, new_game_paths):
+    queued_title = []
+    for preset_index, preset_run in enumerate(preset_runs):
+        platform_data = preset_run[APP_DATA][LAUNCHBOX][PLATFORMS][platform]
+        if not platform_data[IMAGE_PATHS].get(game_title):
+            continue
+        game_paths = dict(platform_data[GAME_PATHS][game_title])
+        media = { media_type : { region : list(image_paths) for region, image_paths in regions.items() }
+                  for media_type, regions in platform_data[IMAGE_PATHS][game_title].items() }
+        queued_title.append(( preset_index, game_paths, media ))
+    
+    # Everything the search printed so far is printed before this game title's thumbnails are created.
+    held_output = sys.stdout.takeHeldOutput() if isinstance(sys.stdout, StreamOutput) else None
+    if held_output:
+        title_queue.put(held_output)
+    if queued_title:
+        title_queue.put(( platform, game_title, new_game_paths, queued_title ))
+    return None
+
+
+### Create the thumbnails of each game title handed off until told to stop, see streamRetroArchThumbnails().
+###     (preset_runs) The data of every preset being run, see getPresetRuns().
+###     (title_queue) The Queue game titles and search output are handed off to, None when done.
+###     (stream_output) The StreamOutput that only this thread prints to.
+###     --> Returns a [None]
+def createQueuedThumbnails(preset_runs, title_queue, stream_output = None):
+    if stream_output:
+        stream_output.printing_thread = threading.get_ident()
+    output_targets = []
+    for preset_run in preset_runs:
+        output_targets.append(getOutputTargets(preset_run))
+        preset_run[APP_DATA][RETROARCH][THUMBNAIL_SNAPSHOTS] = {}
+    existing_directories.clear()
+    
+    try:
+        while True:
+            queued_title = title_queue.get()
+            if queued_title == None:
+                break
+            if type(queued_title) == str:
+                print(queued_title, end='') # Search output
+                continue
+            platform, game_title, new_game_paths, queued_preset_runs = queued_title
+            for preset_index, game_paths, media in queued_preset_runs:
+                # The whole game title is planned again, but only new game files are created.
+                planTitleAlternateImages(preset_runs[preset_index], platform, game_title, game_paths, media)
+                createRetroArchTitleImages(
+                    preset_runs[preset_index], output_targets[preset_index], platform, game_title,
+                    { game_path : game_paths[game_path] for game_path in new_game_paths }, media
+                )
+    finally:
+        finishThumbnailJobs()
+        syncSavedDirectories()
+        for preset_run in preset_runs:
+            saveThumbnailFingerprints(preset_run)
+    
+    return None
+
+
+### Get all the output targets (RetroArch thumbnail directories) with their own image size and
+### saving options. Any option not set in a target uses the option set in the preset.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [List] of [Dictionaries]
+def getOutputTargets(all_the_data):
+    output_targets = []
+    target_options = makeList(all_the_data.get(OUTPUT_TARGETS))
+    if not target_options:
+        target_options = [{}] # Only RetroArch's own thumbnails directory
+    
+    for target_number, target_option in enumerate(target_options):
+        target = {
+            MODIFY_IMAGE_WIDTH : target_option.get(MODIFY_IMAGE_WIDTH, all_the_data.get(MODIFY_IMAGE_WIDTH, NO_CHANGE)),
+            MODIFY_IMAGE_HEIGHT : target_option.get(MODIFY_IMAGE_HEIGHT, all_the_data.get(MODIFY_IMAGE_HEIGHT, NO_CHANGE)),
+            EXTRA_IMAGE_SAVING_PARAMS : target_option.get(EXTRA_IMAGE_SAVING_PARAMS, all_the_data.get(EXTRA_IMAGE_SAVING_PARAMS)),
+        }
+        
+        # Downscale to the largest size RetroArch will show on this target's device.
+        auto_size_profile = target_option.get(AUTO_SIZE_PROFILE, all_the_data.get(AUTO_SIZE_PROFILE, False))
+        if auto_size_profile:
+            if auto_size_profile == True:
+                retroarch_config_settings = all_the_data[APP_DATA][RETROARCH].get(CONFIG_SETTINGS, {})
+            elif Path(auto_size_profile).exists():
+                retroarch_config_settings = readRetroArchConfig(Path(auto_size_profile))
+            else:
+                print(f'\nWARNING: RetroArch Config File Does Not Exist. [ {auto_size_profile} ]')
+                retroarch_config_settings = {}
+            
+            thumbnail_size_profile = getThumbnailSizeProfile(retroarch_config_settings)
+            if thumbnail_size_profile:
+                target[MODIFY_IMAGE_WIDTH] = (DOWNSCALE, thumbnail_size_profile[WIDTH])
+                target[MODIFY_IMAGE_HEIGHT] = (DOWNSCALE, thumbnail_size_profile[HEIGHT])
+                print(f'Auto Size Profile: Thumbnails Downscaled To Fit At Most [ {thumbnail_size_profile[WIDTH]} x {thumbnail_size_profile[HEIGHT]} ]')
+            else:
+                print('\nWARNING: Couldn\'t Find RetroArch\'s Screen Size, Images Sizes Not Changed By Auto Size Profile.')
+        
+        # Note: Image files are saved in this script's root when debuging.
+        if debug:
+            debug_dir_name = 'thumbnails' if target_number == 0 else f'thumbnails_{target_number}'
+            target[THUMBNAILS_ROOT] = Path(PurePath().joinpath(ROOT_DIR, debug_dir_name))
+        elif target_option.get(THUMBNAILS_ROOT, all_the_data.get(THUMBNAILS_ROOT)):
+            target[THUMBNAILS_ROOT] = Path(target_option.get(THUMBNAILS_ROOT, all_the_data.get(THUMBNAILS_ROOT)))
+        else:
+            target[THUMBNAILS_ROOT] = all_the_data[APP_DATA][RETROARCH][THUMBNAILS_DIR_PATH]
+        
+        # Thumbnails exported to an archive use the archive as their root.
+        export_archive = target_option.get(EXPORT_ARCHIVE, all_the_data.get(EXPORT_ARCHIVE))
+        if export_archive:
+            if debug:
+                export_archive = Path(PurePath().joinpath(ROOT_DIR, Path(export_archive).name))
+            if shard: # Shards can't write to the same archive at the same time.
+                export_archive = Path(export_archive)
+                export_archive = export_archive.with_name(f'{export_archive.stem}.shard{shard[0]}of{shard[1]}{export_archive.suffix}')
+            target[EXPORT_ARCHIVE] = Path(export_archive)
+            target[EXPORT_DELTA] = target_option.get(EXPORT_DELTA, all_the_data.get(EXPORT_DELTA, False))
+            target[THUMBNAILS_ROOT] = Path(export_archive)
+        
+        output_targets.append(target)
+    
+    return output_targets
+
+
+### Create the RetroArch thumbnail file path of a game for each output target.
+###     (output_targets) A list of output targets.
+###     (playlist_name) The RetroArch playlist (platform) name.
+###     (thumbnail_dir_name) The RetroArch thumbnail type directory name. Example: 'Named_Boxarts'
+###     (thumbnail_file_name) The RetroArch thumbnail file name.
+###     --> Returns a [Dictionary] { Thumbnail Path : Output Target }
+def getRetroArchThumbnailPaths(output_targets, playlist_name, thumbnail_dir_name, thumbnail_file_name):
+    thumbnail_paths = {}
+    for target in output_targets:
+        thumbnail_path = Path(PurePath().joinpath(
+            target[THUMBNAILS_ROOT],
+            playlist_name,
+            thumbnail_dir_name,
+            thumbnail_file_name
+        ))
+        thumbnail_paths[thumbnail_path] = target
+    return thumbnail_paths
+
+
+### Plan which of the images found for a game title each of its game files (discs, regions, versions,
+### hacks, etc) will use, before any thumbnails are created. Game files are planned in the order their
+### images were found, so each game file always gets the same image, no matter the order thumbnails
+### are created in or if any fail to save.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary]
+def planAlternateImages(all_the_data):
+    for platform, platform_data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
+        platform_data[PLANNED_IMAGE_PATHS] = {}
+        
+        for game_title, media_types in platform_data[IMAGE_PATHS].items():
+            all_the_data = planTitleAlternateImages(all_the_data, platform, game_title, platform_data[GAME_PATHS].get(game_title, {}), media_types)
+    
+    return all_the_data
+
+
+### Plan which image each game file of a single game title will use, see planAlternateImages().
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title, which can have one or more game files.
+###     (game_paths) All the game files of the game title, in the order found. { Game Path : Region }
+###     (media_types) The LaunchBox images found for each image category and region.
+###     --> Returns a [Dictionary]
+def planTitleAlternateImages(all_the_data, platform, game_title, game_paths, media_types):
+    planned_image_paths = { game_path : {} for game_path in game_paths }
+    all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform].setdefault(PLANNED_IMAGE_PATHS, {})[game_title] = planned_image_paths
+    
+    for media, regions in media_types.items():
+        if media == FRONT_BOXART:
+            use_image_alt = all_the_data.get(ALTERNATE_BOXART_IMAGES, False)
+            preferred_image_number = all_the_data.get(PREFERRED_BOXART_NUMBER)
+        elif media == TITLE_SCREEN:
+            use_image_alt = all_the_data.get(ALTERNATE_TITLE_IMAGES, False)
+            preferred_image_number = all_the_data.get(PREFERRED_TITLE_NUMBER)
+        elif media == GAMEPLAY_SCREEN:
+            use_image_alt = all_the_data.get(ALTERNATE_GAMEPLAY_IMAGES, True)
+            preferred_image_number = all_the_data.get(PREFERRED_GAMEPLAY_NUMBER)
+        else:
+            use_image_alt = False
+            preferred_image_number = None
+        
+        # Each game file with images gets the next image in its region's images, starting over once all are used.
+        next_alt_image = 0
+        for game_path in game_paths:
+            image_source_paths = getGameImagePaths(all_the_data, regions.get(game_paths[game_path]), getLaunchBoxGameID(all_the_data, game_path))
+            if not image_source_paths:
+                continue
+            if use_image_alt:
+                image_source_paths = orderAlternateImages(
+                    image_source_paths, preferred_image_number, f'{platform}|{game_title}|{media}' if use_image_alt == RANDOM else None
+                )
+                planned_image_paths[game_path][media] = image_source_paths[next_alt_image % len(image_source_paths)]
+                next_alt_image += 1
+            else:
+                planned_image_paths[game_path][media] = image_source_paths[0]
+    
+    return all_the_data
+
+
+### Get the LaunchBox ID of the game a game file belongs to, including additional applications.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (game_path) The path to a game file.
+###     --> Returns a [String] or None
+def getLaunchBoxGameID(all_the_data, game_path):
+    game_data = all_the_data[APP_DATA][LAUNCHBOX][GAMES_BY_PATH].get(str(game_path))
+    if game_data:
+        return game_data.get('ID')
+    additional_app_data = all_the_data[APP_DATA][LAUNCHBOX][ADDITIONAL_APPS_BY_PATH].get(str(game_path))
+    if additional_app_data:
+        return additional_app_data.get('GameID')
+    return None
+
+
+### Get the images of a game title that belong to a game. Games with the same title share their images,
+### so if some are named with the game's LaunchBox ID ("Title.<ID>-01.png") only those are used, otherwise
+### every image not named with the ID of another game.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_source_paths) A list of image paths to useable images.
+###     (game_id) The game's LaunchBox ID.
+###     --> Returns a [List]
+def getGameImagePaths(all_the_data, image_source_paths, game_id):
+    if not image_source_paths:
+        return image_source_paths
+    games_by_id = all_the_data[APP_DATA][LAUNCHBOX].get(GAMES_BY_ID, {})
+    game_id = game_id.lower() if game_id else None
+    game_image_paths = []
+    untagged_image_paths = []
+    
+    for image_source_path in image_source_paths:
+        file_name_match = re_image_file_name_compiled_pattern.match(Path(image_source_path).name)
+        image_game_id = file_name_match.group(2).lower() if file_name_match and file_name_match.group(2) else None
+        if game_id and image_game_id == game_id:
+            game_image_paths.append(image_source_path)
+        elif not image_game_id or image_game_id not in games_by_id:
+            untagged_image_paths.append(image_source_path)
+    
+    # Images of other games are only used if nothing else was found.
+    return game_image_paths or untagged_image_paths or image_source_paths
+
+
+### Order the alternate images of a game title, with images that have the preferred number first. The
+### rest are shuffled randomly if a random seed is given, the same way every time for the same seed and
+### images, no matter the order the images were found in.
+###     (image_source_paths) A list of image paths to useable images.
+###     (preferred_image_number) Preferred number in image file name.
+###     (random_seed) A String to shuffle images with, or None to keep their order.
+###     --> Returns a [List]
+def orderAlternateImages(image_source_paths, preferred_image_number = None, random_seed = None):
+    preferred_image_paths = []
+    other_image_paths = []
+    
+    for image_source_path in image_source_paths:
+        file_name_match = re_image_file_name_compiled_pattern.match(image_source_path.name)
+        if (preferred_image_number != None and file_name_match and
+            int(file_name_match.group(3)) == int(preferred_image_number)):
+            preferred_image_paths.append(image_source_path)
+        else:
+            other_image_paths.append(image_source_path)
+    
+    if random_seed != None:
+        other_image_paths.sort()
+        RandomGenerator(random_seed).shuffle(other_image_paths)
+    
+    return preferred_image_paths + other_image_paths
+
+
+### TODO: Do thumbnail creation all at once, on command?
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+def createAllRetroArchThumbnailImages(all_the_data):
+    for platform, data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
+        for game_title, image_path_data in data[IMAGE_PATHS].items():
+            game_paths = all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS][game_title]
+            for game_path in game_paths:
+                # Check if game is also in RetroArch (true if image paths were created)
+                if all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS].get(game_path):
+                    #for media, image_source_paths in image_path_data.items():
+                    for media, regions in image_path_data.items():
                         
-                        elif not pillow_installed and file_path.suffix not in PNG:
-                            continue # Can't use this image
+                        image_output_paths = all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path][media]
                         
-                        if format_preference == None or file_path.suffix in format_preference:
-                            if use_random_image:
-                                pref_file_paths.append(file_path)
-                            else:
-                                if preferred_image_number != None:
-                                    pref_file_paths.append(file_path)
-                                else:
-                                    return file_path# No random and 'no preference' or preference is found
-                        else:
-                            not_pref_file_paths.append(file_path)
-                    
-                    elif first_image_found:
-                        break
+                        for region, image_source_paths in regions.items():
+
+                            all_the_data = createRetroArchThumbnailImage(
+                                all_the_data,
+                                image_source_paths, image_output_paths,
+                                platform, game_title, game_path, media
+                            )
+    finishThumbnailJobs()
+    saveThumbnailFingerprints(all_the_data)
+    
+    return all_the_data
+
+
+### Create a new thumbnail image for RetroArch modifying the image as needed from LaunchBox. Which
+### thumbnails to save, overwrite, or skip is checked here, but the thumbnails are made by the thumbnail
+### workers (see makeThumbnailImages) and finished later (see finishThumbnailJobs).
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_source_paths) A list of image paths to useable images.
+###     (image_output_paths) The paths to save the RetroArch thumbnail/image to. { Path : Output Target }
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title, which can have one or more game files.
+###     (game_path) The path to a game file.
+###     (media) One of three image categories in RetroArch.
+###     --> Returns a [Dictionary]
+def createRetroArchThumbnailImage(all_the_data, image_source_paths, image_output_paths, platform, game_title, game_path, media):
+    resampling_filter = all_the_data.get(IMAGE_RESAMPLING_FILTER, NEAREST)
+    keep_aspect_ratio = all_the_data.get(KEEP_ASPECT_RATIO, True)
+    overwrite_retroarch_thumbnails = all_the_data.get(OVERWRITE_IMAGES, False)
+    
+    current_game_image_paths_log = all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform].get(game_title)
+    if not current_game_image_paths_log:
+        all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title] = { game_path : {} }
+    elif not all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title].get(game_path):
+        all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title][game_path] = {}
+    current_game_image_paths_log = all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title]
+    
+    # The image each game file uses was planned before any thumbnails were created, see planAlternateImages().
+    image_source_path = (all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform].get(PLANNED_IMAGE_PATHS, {})
+                         .get(game_title, {}).get(game_path, {}).get(media, image_source_paths[0]))
+    
+    # Check which output files to save, overwrite or skip.
+    file_save_statuses = {}
+    fingerprints = {}
+    image_source_file_size = 0
+    journal = all_the_data[APP_DATA].get(RESUME_JOURNAL)
+    encoded_outputs = all_the_data[APP_DATA].get(ENCODED_OUTPUTS)
+    if journal or encoded_outputs:
+        throttleIO(IO_METADATA)
+        try:
+            image_source_stat = image_source_path.stat()
+            image_source_file_size = image_source_stat.st_size
+            for image_output_path, target in image_output_paths.items():
+                fingerprints[image_output_path] = getImageFingerprint(image_source_path, image_source_stat, target, all_the_data)
+        except OSError:
+            pass # Let the missing image error happen when opened.
+    
+    # Thumbnails still being made to the same paths, or that could be copied, are finished first.
+    finishThumbnailJobs(waiting_on = set(image_output_paths) | set(fingerprints.values()))
+    
+    for image_output_path, target in image_output_paths.items():
+        if target.get(EXPORT_ARCHIVE):
+            archive_export = getArchiveExport(all_the_data, target[EXPORT_ARCHIVE])
+            archive_member_name = getArchiveMemberName(target, image_output_path)
+            if (archive_member_name in archive_export[ARCHIVE_ENTRIES] or
+               (target.get(EXPORT_DELTA) and fingerprints.get(image_output_path) and
+                archive_export[ARCHIVE_MANIFEST].get(archive_member_name) == fingerprints[image_output_path])):
+                file_save_statuses[image_output_path] = NOT_SAVED # Already exported
+            else:
+                file_save_statuses[image_output_path] = NEW_SAVE
+            continue
+        
+        # Existing thumbnails are found in a snapshot of their directory, not by asking the disk for each file.
+        existing_file_stat = getThumbnailDirectorySnapshot(all_the_data, image_output_path.parent).get(
+            os.path.normcase(image_output_path.name)
+        )
+        
+        if (journal and fingerprints.get(image_output_path) and
+            journal[JOURNAL_ENTRIES].get(str(image_output_path)) == fingerprints[image_output_path] and
+            existing_file_stat):
+            file_save_statuses[image_output_path] = RESUMED # Saved in a previous run
+            recordThumbnailFingerprint(all_the_data, image_output_path, fingerprints[image_output_path], target)
+        
+        elif existing_file_stat:
+            if overwrite_retroarch_thumbnails:
                 
-                # If use_random_image and any images found, select one from a list randomly
-                if use_random_image and (pref_file_paths or not_pref_file_paths):
-                    
-                    if format_preference == None:
-                        not_pref_file_paths.extend(pref_file_paths)
-                        return RandomOption(not_pref_file_paths) # Randomly selected from all
-                    else:
-                        if pref_file_paths:
-                            return RandomOption(pref_file_paths) # Randomly selected from pref only
-                        elif not_pref_file_paths:
-                            return RandomOption(not_pref_file_paths) # Randomly selected from not_pref only
+                # Check if file is read-only via file owner permissions.
+                file_permission = existing_file_stat[SNAPSHOT_MODE] & stat.S_IRWXU
                 
-                # If a preferred number was not found but other preferred files were...
-                if pref_file_paths:
-                    return pref_file_paths[0]
+                #if ((file_permission) == stat.S_IWUSR): # stat.S_IWRITE
+                if ((file_permission) == stat.S_IRUSR): # stat.S_IREAD
+                    # If file is not writable, don't overwrite it.
+                    if debug: print(f'  -Read-Only File Permission: {file_permission}')
+                    file_save_statuses[image_output_path] = NOT_SAVED
                 
-                # If a preferred image was not found but another was found...
-                if not_pref_file_paths:
-                    return not_pref_file_paths[0]
+                else:
+                    # The old file is only replaced once the new file is completely saved.
+                    file_save_statuses[image_output_path] = OVERWRITTEN
+            
+            else:
+                file_save_statuses[image_output_path] = NOT_SAVED # Not Overwriting Files
+        else:
+            file_save_statuses[image_output_path] = NEW_SAVE
+    
+    images_to_save = [ path for path, file_save_status in file_save_statuses.items() if file_save_status not in (NOT_SAVED, RESUMED) ]
+    
+    # Copy any thumbnail already made from the same LaunchBox image with the same size and saving
+    # options (by another preset, output target or game file), instead of making it all over again.
+    if encoded_outputs:
+        for image_output_path in images_to_save.copy():
+            fingerprint = fingerprints.get(image_output_path)
+            saved_output_path = encoded_outputs[FINGERPRINT_OUTPUTS].get(fingerprint)
+            if (not saved_output_path or saved_output_path == image_output_path or
+                encoded_outputs[OUTPUT_FINGERPRINTS].get(saved_output_path) != fingerprint):
+                continue
+            try:
+                temp_file = writeThumbnailFile(all_the_data, image_output_path, image_output_paths[image_output_path],
+                                               image_copy_path = saved_output_path)
+            except OSError as err:
+                if debug: print(f'  -Couldn\'t Copy Thumbnail, Making It Instead: {err}')
+                continue
+            if debug: print(f'  -Copied Same Thumbnail From: {saved_output_path}')
+            recordSavedThumbnail(all_the_data, image_output_path, fingerprint, temp_file, image_output_paths[image_output_path])
+            images_to_save.remove(image_output_path)
+    
+    # Thumbnails are made by the thumbnail workers, while this thread goes on to the next ones.
+    if pillow_installed and images_to_save:
+        thumbnail_job = getThumbnailPool().submit(
+            makeThumbnailImages, all_the_data, image_source_path, image_source_file_size,
+            { image_output_path : image_output_paths[image_output_path] for image_output_path in images_to_save },
+            resampling_filter, keep_aspect_ratio
+        )
+        thumbnail_jobs.append((
+            thumbnail_job, all_the_data, image_source_path, image_output_paths, fingerprints,
+            (platform, game_title, game_path, media),
+            set(images_to_save) | { fingerprints[path] for path in images_to_save if fingerprints.get(path) }
+        ))
+    
+    # Alt: Copy and paste image file if Pillow not installed.
+    elif not pillow_installed:
+        for image_output_path in images_to_save:
+            if image_source_path.suffix == '.png':
+                try:
+                    temp_file = writeThumbnailFile(all_the_data, image_output_path, image_output_paths[image_output_path],
+                                                   image_copy_path = image_source_path)
+                except (OSError, ValueError) as err:
+                    error = f'Failed To Save Image: {err}'
+                    print(f'  -ERROR: {error}')
+                    file_save_statuses[image_output_path] = error
+                    continue
+                recordSavedThumbnail(all_the_data, image_output_path, fingerprints.get(image_output_path), temp_file,
+                                     image_output_paths[image_output_path])
+            
+            else:
+                # This shouldn't ever show since only PNG images will be queried/used when Pillow not installed.
+                print('  -WARNING: Without "Pillow" installed non-PNG images will not work in RetroArch.')
+                print(f'  -Skipping image file: {image_source_path}')
+    
+    if not current_game_image_paths_log[game_path].get(media):
+        current_game_image_paths_log[game_path][media] = {}
+    for image_output_path, file_save_status in file_save_statuses.items():
+        current_game_image_paths_log[game_path][media][image_output_path] = [
+            image_source_path, image_output_path, file_save_status
+        ]
+    
+    # Never get too far ahead of the thumbnail workers, so only a few thumbnails are ever waiting on them.
+    finishThumbnailJobs(2 * getThumbnailWorkers())
+    
+    return all_the_data
+
+
+### Get the threads that make thumbnails (see makeThumbnailImages), starting them the first time
+### they're needed. They keep running until this script stops, so a daemon keeps using the same ones.
+###     --> Returns a [ThreadPoolExecutor]
+def getThumbnailPool():
+    global thumbnail_pool
+    if not thumbnail_pool:
+        thumbnail_pool = ThreadPoolExecutor(getThumbnailWorkers(), thread_name_prefix='thumbnail')
+    return thumbnail_pool
+
+
+### Get how many thumbnails are made at the same time, see thumbnail_workers.
+###     --> Returns a [Integer]
+def getThumbnailWorkers():
+    return thumbnail_workers if thumbnail_workers > 0 else (os.cpu_count() or 1)
+
+
+### Make the RetroArch thumbnails of a LaunchBox image, in one of the thumbnail worker threads. The
+### LaunchBox image is only opened once and resized for each output target from largest to smallest,
+### each size resized from the smallest larger image already resized. Thumbnails saved as their own
+### files are saved here, but nothing is logged or recorded, see finishThumbnailJobs().
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far. Only used for the resume journal.
+###     (image_source_path) The LaunchBox image.
+###     (image_source_file_size) The LaunchBox image's file size, or 0 if not known.
+###     (image_outputs) The thumbnails to make. { Path : Output Target }
+###     (resampling_filter) Resampling filter to use while resizing.
+###     (keep_aspect_ratio) Keep aspect ratio only if one size, width or height, has changed.
+###     --> Returns a [Tuple] ( { Path : Error or None }, { Path : Temp File or PNG Data to export },
+###                              { Path : Edit Log }, Most Pixels Decoded By All Thumbnail Workers, [ Messages to print ] )
+def makeThumbnailImages(all_the_data, image_source_path, image_source_file_size, image_outputs, resampling_filter, keep_aspect_ratio):
+    errors = { image_output_path : None for image_output_path in image_outputs }
+    saved_files = {}
+    edit_logs = {}
+    decoded_pixels = 0
+    messages = []
+    
+    image_source = None
+    image_source_decode_time = 0
+    output_images = {}
+    opened_images = [] # Closed once done, instead of waiting on Python to clean them up.
+    decoded_images = []
+    reserved_pixels = 0
+    try:
+        throttleIO(IO_READ, image_source_file_size)
+        try:
+            # Only the image's header is read here, the image itself is decoded by load().
+            image_source = Image.open(image_source_path)
+            opened_images.append(image_source)
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as err:
+            error = f'Failed To Open Image: {err}'
+            messages.append(f'  -ERROR: {error}')
+            return dict.fromkeys(image_outputs, error), saved_files, edit_logs, decoded_pixels, messages
+        
+        org_image_size = (image_source.width, image_source.height)
+        new_image_sizes = {}
+        
+        for image_output_path, target in image_outputs.items():
+            width_change = target.get(MODIFY_IMAGE_WIDTH, NO_CHANGE)
+            height_change = target.get(MODIFY_IMAGE_HEIGHT, NO_CHANGE)
+            
+            if width_change or height_change:
+                edit_logs[image_output_path] = { MODIFY_IMAGE_SIZE : [ org_image_size ] }
+                try:
+                    new_image_sizes[image_output_path] = modifyImageSize(org_image_size, (width_change, height_change), keep_aspect_ratio)
+                except (TypeError, ValueError) as err:
+                    error = f'Image Resize Failed: {err}'
+                    messages.append(f'  -ERROR: {error}')
+                    edit_logs[image_output_path][ERROR] = error
+                    output_images[image_output_path] = image_source
+            else:
+                output_images[image_output_path] = image_source
+        
+        # Wait for enough of the pixel budget to decode the LaunchBox image with all its resized copies,
+        # and one copy with fewer colors at a time.
+        image_pixels = [ size[WIDTH] * size[HEIGHT] for size in [org_image_size, *new_image_sizes.values()] ]
+        needed_pixels = sum(image_pixels) + max(image_pixels)
+        reserved_pixels = reservePixelBudget(needed_pixels)
+        if not reserved_pixels:
+            error = f'Image Too Large To Decode: {needed_pixels / 1_000_000:.1f} Megapixels (image_pixel_budget)'
+            messages.append(f'  -ERROR: {error}')
+            return dict.fromkeys(image_outputs, error), saved_files, edit_logs, decoded_pixels, messages
+        try:
+            decode_start_time = Timer()
+            image_source.load()
+            image_source_decode_time = Timer() - decode_start_time
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as err:
+            error = f'Failed To Open Image: {err}'
+            messages.append(f'  -ERROR: {error}')
+            return dict.fromkeys(image_outputs, error), saved_files, edit_logs, decoded_pixels, messages
+        decoded_images.append(image_source)
+        decoded_pixels = max(decoded_pixels, countDecodedPixels([image_source]))
+        
+        # Largest sizes first, so every smaller size can be resized from the closest larger image.
+        resized_images = [image_source]
+        for image_output_path, new_image_size in sorted(
+            new_image_sizes.items(), key=lambda item: item[1][WIDTH] * item[1][HEIGHT], reverse=True):
+            
+            larger_images = [ image for image in resized_images
+                              if image.width >= new_image_size[WIDTH] and image.height >= new_image_size[HEIGHT] ]
+            if larger_images:
+                best_image = min(larger_images, key=lambda image: image.width * image.height)
+            else:
+                best_image = image_source # Upscaling
+            
+            try:
+                if debug: messages.append(f'  Org Image Size: {image_source.width} x {image_source.height}')
+                if (best_image.width, best_image.height) == new_image_size:
+                    output_image = best_image
+                else:
+                    output_image = resizeImage(
+                        best_image,
+                        (CHANGE_TO, new_image_size[WIDTH]),
+                        (CHANGE_TO, new_image_size[HEIGHT]),
+                        False,
+                        resampling_filter
+                    )
+                    resized_images.append(output_image)
+                    opened_images.append(output_image)
+                    decoded_images.append(output_image)
+                    decoded_pixels = max(decoded_pixels, countDecodedPixels([output_image]))
+                if debug: messages.append(f'  New Image Size: {output_image.width} x {output_image.height}')
+                
+                # Add new image size to log only if it has changed.
+                if (output_image.width, output_image.height) not in edit_logs[image_output_path][MODIFY_IMAGE_SIZE]:
+                    edit_logs[image_output_path][MODIFY_IMAGE_SIZE].append(
+                        (output_image.width, output_image.height)
+                    )
+            
+            except (FileNotFoundError, OSError, TypeError, UnidentifiedImageError, ValueError) as err:
+                error = f'Image Resize Failed: {err}'
+                messages.append(f'  -ERROR: {error}')
+                edit_logs[image_output_path][ERROR] = error
+                output_image = image_source
+            
+            output_images[image_output_path] = output_image
+        
+        # Save Image Files...
+        for image_output_path, target in image_outputs.items():
+            extra_image_saving_params = target.get(EXTRA_IMAGE_SAVING_PARAMS) or {}
+            try:
+                params = getExtraSaveImageParams(target)
+                output_image, color_reduction, color_params = reduceImageColors(output_images[image_output_path], extra_image_saving_params)
+                params.update(color_params)
+                if output_image is not output_images[image_output_path]:
+                    # Only one copy with fewer colors is kept at a time.
+                    decoded_pixels = max(decoded_pixels, countDecodedPixels([output_image]))
+                    try:
+                        image_data = encodePNGImage(output_image, params)
+                    finally:
+                        countDecodedPixels([output_image], -1)
+                        output_image.close()
+                else:
+                    image_data = encodePNGImage(output_image, params)
+                if target.get(EXPORT_ARCHIVE):
+                    saved_files[image_output_path] = image_data # Exported one at a time, see finishThumbnailJobs().
+                else:
+                    saved_files[image_output_path] = saveThumbnailFile(all_the_data, image_output_path, image_data)
+            except (OSError, ValueError) as err:
+                errors[image_output_path] = f'Failed To Save Image: {err}'
+                messages.append(f'  -ERROR: {errors[image_output_path]}')
+                continue
+            
+            # Compare the sizes and decode times of the LaunchBox image and the new RetroArch thumbnail.
+            if (color_reduction or extra_image_saving_params.get(STRIP_METADATA) or
+                extra_image_saving_params.get(PALETTE_COLORS) or extra_image_saving_params.get(REDUCE_BIT_DEPTH)):
+                edit_log = edit_logs.setdefault(image_output_path, {})
+                if color_reduction:
+                    edit_log[COLOR_REDUCTION] = color_reduction
+                try:
+                    if target.get(EXPORT_ARCHIVE):
+                        raise FileNotFoundError('Thumbnail is in an export archive.')
+                    edit_log[FILE_SIZE] = [ image_source_path.stat().st_size, image_output_path.stat().st_size ]
+                    decode_start_time = Timer()
+                    with Image.open(image_output_path) as saved_image:
+                        saved_image.load()
+                    edit_log[DECODE_TIME] = [ image_source_decode_time, Timer() - decode_start_time ]
+                except (OSError, UnidentifiedImageError) as err:
+                    if debug: messages.append(f'  -Couldn\'t Compare Image Sizes: {err}')
+    
+    finally:
+        countDecodedPixels(decoded_images, -1)
+        for image in opened_images:
+            image.close()
+        releasePixelBudget(reserved_pixels)
+    
+    return errors, saved_files, edit_logs, decoded_pixels, messages
+
+
+### Wait until enough of the image_pixel_budget is free and reserve it before a thumbnail worker decodes an image.
+###     (pixels) Amount of pixels to reserve.
+###     --> Returns a [Integer] amount of pixels reserved, or 0 if more than the whole budget is needed
+def reservePixelBudget(pixels):
+    global pixels_reserved
+    if image_pixel_budget and pixels > image_pixel_budget:
+        return 0
+    with pixel_budget_condition:
+        # Never waits forever, any pixels reserved are released once their images are made.
+        pixel_budget_condition.wait_for(lambda: not image_pixel_budget or pixels_reserved + pixels <= image_pixel_budget)
+        pixels_reserved += pixels
+    return pixels
+
+
+### Free pixels reserved from the image_pixel_budget once the images using them are closed.
+###     (pixels) Amount of pixels reserved.
+###     --> Returns a [None]
+def releasePixelBudget(pixels):
+    global pixels_reserved
+    if pixels:
+        with pixel_budget_condition:
+            pixels_reserved -= pixels
+            pixel_budget_condition.notify_all()
+    return None
+
+
+### Count the pixels of images decoded by the thumbnail workers, to measure the most decoded at once.
+###     (images) Images just decoded (or made), or about to be closed.
+###     (sign) 1 if decoded, -1 if being closed.
+###     --> Returns a [Integer] amount of pixels all the thumbnail workers have decoded right now
+def countDecodedPixels(images, sign = 1):
+    global pixels_decoded
+    with pixel_budget_condition:
+        pixels_decoded += sign * sum(image.width * image.height for image in images)
+        return pixels_decoded
+
+
+### Finish the thumbnails handed to the thumbnail workers (see createRetroArchThumbnailImage), oldest
+### first, waiting on any not made yet. Thumbnails are exported, logged, and recorded here, in the same
+### thread that handed them off, so nothing else has to be shared with the thumbnail workers.
+###     (jobs_left) How many of the newest thumbnails can be left unfinished.
+###     (waiting_on) Thumbnail paths and fingerprints, any thumbnails still being made with them are finished too.
+###     --> Returns a [None]
+def finishThumbnailJobs(jobs_left = 0, waiting_on = ()):
+    while thumbnail_jobs and (len(thumbnail_jobs) > jobs_left or
+                              any(not job[-1].isdisjoint(waiting_on) for job in thumbnail_jobs)):
+        (thumbnail_job, all_the_data, image_source_path, image_output_paths, fingerprints,
+         (platform, game_title, game_path, media), waiting_keys) = thumbnail_jobs.pop(0)
+        errors, saved_files, edit_logs, decoded_pixels, messages = thumbnail_job.result()
+        
+        for message in messages:
+            print(message)
+        if decoded_pixels > all_the_data[LOG_DATA].get(PEAK_DECODED_PIXELS, 0):
+            all_the_data[LOG_DATA][PEAK_DECODED_PIXELS] = decoded_pixels
+        for image_output_path, edit_log in edit_logs.items():
+            getImageEditLog(all_the_data, platform, game_title, game_path, media, image_output_path).update(edit_log)
+        
+        for image_output_path, error in errors.items():
+            target = image_output_paths[image_output_path]
+            temp_file = None
+            if not error and target.get(EXPORT_ARCHIVE):
+                try:
+                    exportThumbnailFile(all_the_data, image_output_path, target, saved_files[image_output_path])
+                except (OSError, ValueError) as err:
+                    error = f'Failed To Save Image: {err}'
+                    print(f'  -ERROR: {error}')
+            elif not error:
+                temp_file = saved_files[image_output_path]
+            
+            if error:
+                all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title][game_path][media][image_output_path][SAVE_INFO] = error
+            else:
+                recordSavedThumbnail(all_the_data, image_output_path, fingerprints.get(image_output_path), temp_file, target)
     
-    return file_not_found
+    return None
 
 
-### Create RetroArch thumbnail file paths for each LaunchBox image found.
+### Record a newly saved RetroArch thumbnail, so it's not saved again if this run doesn't finish and
+### so other thumbnails made the same way can be copied from it.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
-###     --> Returns a [Dictionary]
-def createRetroArchImagePaths(all_the_data):
-    retroarch_thumbnails_root = all_the_data[APP_DATA][RETROARCH][THUMBNAILS_DIR_PATH]
-    if debug: debug_thumbnails_root = Path(PurePath().joinpath(ROOT_DIR,'thumbnails'))
+###     (image_output_path) The path of the RetroArch thumbnail saved.
+###     (fingerprint) The fingerprint of the LaunchBox image and everything used to make the thumbnail.
+###     (temp_file) The temporary file the thumbnail was saved to before replacing the old one.
+###     (target) The output target the thumbnail was saved for.
+###     --> Returns a [None]
+def recordSavedThumbnail(all_the_data, image_output_path, fingerprint, temp_file = None, target = {}):
+    # Thumbnails in export archives can't be copied from and are recorded in the archive's manifest instead.
+    if target.get(EXPORT_ARCHIVE):
+        archive_export = getArchiveExport(all_the_data, target[EXPORT_ARCHIVE])
+        archive_export[ARCHIVE_ENTRIES][getArchiveMemberName(target, image_output_path)] = fingerprint
+        return None
     
-    all_the_data[LOG_DATA][START_TIME] = datetime.now().timestamp()
+    updateThumbnailDirectorySnapshot(all_the_data, image_output_path)
+    recordThumbnailFingerprint(all_the_data, image_output_path, fingerprint, target)
     
-    for platform, data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
-        for game_title, media in data[IMAGE_PATHS].items():
-            
-            game_paths = all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS][game_title]
-            
-            print('\nGame Title:')
-            print(f'  {game_title}')
-            
-            for root, dirs, files in Search(all_the_data[APP_DATA][RETROARCH][PLAYLISTS_DIR_PATH]):
-                for file in files:
-                    if Path(file).suffix == '.lpl':
-                        
-                        retroarch_playlist_path = Path(PurePath().joinpath(root, file))
-                        launchbox_platform_name = platform
-                        retroarch_platform_name = retroarch_playlist_path.stem
-                        
-                        # Only search playlist files if they belong to the same platform.
-                        if match_platforms_before_search:
-                            # Remove any ' (text)' from RetroArch platforms/playlists.
-                            para_text = re_parenthesis_text_compiled_pattern.findall(retroarch_platform_name)
-                            retroarch_platform_name_match = retroarch_platform_name
-                            for remove_text in para_text:
-                                retroarch_platform_name_match = retroarch_platform_name_match.replace(remove_text, '')
-                            
-                            # Only search though playlist if platforms are the same (skip others to save time).
-                            if launchbox_platform_name in matching_platforms:
-                                if retroarch_platform_name_match not in matching_platforms[launchbox_platform_name]:
-                                    continue
-                            else:
-                                if retroarch_platform_name.find('Nintendo - ') > -1:
-                                    retroarch_platform_name_match = retroarch_platform_name.replace('Nintendo - ','').casefold()
-                                if retroarch_platform_name.find('Bandai - ') > -1:
-                                    retroarch_platform_name_match = retroarch_platform_name.replace('Bandai - ','').casefold()
-                                if retroarch_platform_name.find('Coleco - ') > -1:
-                                    retroarch_platform_name_match = retroarch_platform_name.replace('Coleco - ','').casefold()
-                                
-                                retroarch_platform_name_match = retroarch_platform_name.replace(' - ',' ').casefold()
-                                if retroarch_platform_name_match.find(launchbox_platform_name.casefold()) == -1:
-                                    continue
-                        
-                        if debug: print(f'-Game in LB Platform: {launchbox_platform_name}, Searching RA Platform: {retroarch_platform_name}')
-                        
-                        # Open and Read RetroArch Playlist File
-                        retroarch_playlist_file = open(retroarch_playlist_path, 'r', encoding="UTF-8") # "cp866")
-                        retroarch_game_data = json.load(retroarch_playlist_file)['items']
-                        
-                        # Number of games found under the same game title in RetroArch.
-                        ra_games_found = 0
-                        
-                        for game in retroarch_game_data:
-                            ra_game_found = False
-                            
-                            for game_path in game_paths:
-                                ra_game_path = Path(game['path'])
-                                
-                                # If an archived game points to a specific file inside of archive, remove "#file".
-                                # Example: "game.zip#game.rom"
-                                hash_index = ra_game_path.name.rfind(game_path.suffix + '#')
-                                if hash_index > -1:
-                                    ra_game_path = Path(PurePath().joinpath(ra_game_path.parent, f'{ra_game_path.name[:hash_index]}{game_path.suffix}'))
-                                
-                                #if game['path'] == str(game_path):
-                                if ra_game_path == game_path:
-                                    ra_game_found = True
-                                    ra_games_found += 1
-                                    
-                                    retroarch_game_file_name = f'{game["label"]}.png'.replace('&', '_')
-                                    
-                                    #print('Game Title:')
-                                    #print(f'  {game["label"]}')
-                                    print('Game Path (Found In Both LaunchBox and RetroArch):')
-                                    print(f'  {game["path"]}')
-                                    
-                                    region = data[GAME_PATHS][game_title][game_path]
-                                    launchbox_front_boxart_paths = media[FRONT_BOXART].get(region, [None])
-                                    launchbox_title_screen_paths = media[TITLE_SCREEN].get(region, [None])
-                                    launchbox_gameplay_screen_paths = media[GAMEPLAY_SCREEN].get(region, [None])
-                                    print('Usable Front Boxart Images:')
-                                    boxart_paths = ",\n  ".join([str(path) for path in launchbox_front_boxart_paths])
-                                    print(f'  {boxart_paths}')
-                                    print('Usable Title Screen Images:')
-                                    title_paths = ",\n  ".join([str(path) for path in launchbox_title_screen_paths])
-                                    print(f'  {title_paths}')
-                                    print('Usable Gameplay Screen Images:')
-                                    gameplay_paths = ",\n  ".join([str(path) for path in launchbox_gameplay_screen_paths])
-                                    print(f'  {gameplay_paths}')
-                                    
-                                    print('New RetroArch Thumbnail Paths:')
-                                    #print(f'Database Name: {game["db_name"]}')
-                                    #retroarch_platform_name = Path(game["db_name"]).stem
-                                    
-                                    if not all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS].get(game_path):
-                                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path] = {}
-                                        all_the_data[LOG_DATA][GAME_PATHS_IN_LB_RA].append(game_path)
-                                    
-                                    # Create new RetroArch image paths
-                                    # Note: Image files are saved in this script's root when debuging.
-                                    if launchbox_front_boxart_paths[0]:
-                                        retroarch_front_boxart_path = Path(PurePath().joinpath(
-                                            debug_thumbnails_root if debug else retroarch_thumbnails_root,
-                                            retroarch_platform_name,
-                                            'Named_Boxarts',
-                                            retroarch_game_file_name
-                                        ))
-                                        print(f'  {retroarch_front_boxart_path}')
-                                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
-                                            FRONT_BOXART : retroarch_front_boxart_path
-                                        })
-                                        createRetroArchThumbnailImage(
-                                            all_the_data,
-                                            launchbox_front_boxart_paths,
-                                            retroarch_front_boxart_path,
-                                            platform, game_title, game_path, FRONT_BOXART
-                                        )
-                                    if launchbox_title_screen_paths[0]:
-                                        retroarch_title_screen_path = Path(PurePath().joinpath(
-                                            debug_thumbnails_root if debug else retroarch_thumbnails_root,
-                                            retroarch_platform_name,
-                                            'Named_Titles',
-                                            retroarch_game_file_name
-                                        ))
-                                        print(f'  {retroarch_title_screen_path}')
-                                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
-                                            TITLE_SCREEN : retroarch_title_screen_path
-                                        })
-                                        createRetroArchThumbnailImage(
-                                            all_the_data,
-                                            launchbox_title_screen_paths,
-                                            retroarch_title_screen_path,
-                                            platform, game_title, game_path, TITLE_SCREEN
-                                        )
-                                    if launchbox_gameplay_screen_paths[0]:
-                                        retroarch_gameplay_screen_path = Path(PurePath().joinpath(
-                                            debug_thumbnails_root if debug else retroarch_thumbnails_root,
-                                            retroarch_platform_name,
-                                            'Named_Snaps',
-                                            retroarch_game_file_name
-                                        ))
-                                        print(f'  {retroarch_gameplay_screen_path}')
-                                        all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path].update({
-                                            GAMEPLAY_SCREEN : retroarch_gameplay_screen_path
-                                        })
-                                        createRetroArchThumbnailImage(
-                                            all_the_data,
-                                            launchbox_gameplay_screen_paths,
-                                            retroarch_gameplay_screen_path,
-                                            platform, game_title, game_path, GAMEPLAY_SCREEN
-                                        )
-                                
-                                # If at least one game found in game_paths, move on to next RetroArch game.
-                                if ra_game_found:
-                                    break
-                            
-                            # If all games under the same game title found, move on to next game_title.
-                            if ra_games_found >= len(game_paths):
-                                break
-                        
-                        # Close RetroArch Playlist File
-                        retroarch_playlist_file.close()
-                        
-                        # No need to search additional RetroArch playlists if at least one...
-                        ## TODO: would the same game ever be in multiple RetroArch playlists?
-                        if ra_game_found:
-                            break
-                
-                break # Ignore Sub-Directories
+    encoded_outputs = all_the_data[APP_DATA].get(ENCODED_OUTPUTS)
+    if encoded_outputs != None:
+        if fingerprint:
+            encoded_outputs[OUTPUT_FINGERPRINTS][image_output_path] = fingerprint
+            encoded_outputs[FINGERPRINT_OUTPUTS][fingerprint] = image_output_path
+        else:
+            encoded_outputs[OUTPUT_FINGERPRINTS].pop(image_output_path, None)
     
-    all_the_data[LOG_DATA][END_TIME] = datetime.now().timestamp()
-    all_the_data[LOG_DATA][COMPLETION_TIME] += all_the_data[LOG_DATA][END_TIME] - all_the_data[LOG_DATA][START_TIME]
+    if fingerprint:
+        writeResumeJournal(all_the_data, {
+            'output' : str(image_output_path),
+            'fingerprint' : fingerprint,
+            'done_temp' : str(temp_file) if temp_file else None
+        })
     
-    return all_the_data
+    return None
 
 
-### TODO: Do thumbnail creation all at once, on command?
+### Record the fingerprint of the LaunchBox image (and everything else) a thumbnail was made from, to be
+### saved in the fingerprints file of its thumbnails directory, see saveThumbnailFingerprints().
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
-def createAllRetroArchThumbnailImages(all_the_data):
-    for platform, data in all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS].items():
-        for game_title, image_path_data in data[IMAGE_PATHS].items():
-            game_paths = all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform][GAME_PATHS][game_title]
-            for game_path in game_paths:
-                # Check if game is also in RetroArch (true if image paths were created)
-                if all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS].get(game_path):
-                    #for media, image_source_paths in image_path_data.items():
-                    for media, regions in image_path_data.items():
-                        
-                        image_output_path = all_the_data[APP_DATA][RETROARCH][IMAGE_PATHS][game_path][media]
-                        
-                        for region, image_source_paths in regions.items():
+###     (image_output_path) The path of the RetroArch thumbnail saved.
+###     (fingerprint) The fingerprint of the LaunchBox image and everything used to make the thumbnail.
+###     (target) The output target the thumbnail was saved for.
+###     --> Returns a [None]
+def recordThumbnailFingerprint(all_the_data, image_output_path, fingerprint, target):
+    thumbnails_root = target.get(THUMBNAILS_ROOT)
+    if thumbnails_root:
+        thumbnail_fingerprints = all_the_data[APP_DATA][RETROARCH].setdefault(THUMBNAIL_FINGERPRINTS, {})
+        thumbnail_name = image_output_path.relative_to(thumbnails_root).as_posix()
+        thumbnail_fingerprints.setdefault(thumbnails_root, {})[thumbnail_name] = fingerprint
+    return None
+
+
+### Save the fingerprints of all the thumbnails saved so far in the fingerprints file of each thumbnails
+### directory, so "--verify" can tell if a thumbnail was made from an older LaunchBox image even if that
+### image's modified time didn't change (some copy tools keep it). Other runs may have saved
+### fingerprints of their own thumbnails since this one started, so the file is read again first.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def saveThumbnailFingerprints(all_the_data):
+    thumbnail_fingerprints = all_the_data[APP_DATA][RETROARCH].get(THUMBNAIL_FINGERPRINTS) or {}
+    for thumbnails_root, new_fingerprints in thumbnail_fingerprints.items():
+        fingerprints_path = getThumbnailFingerprintsPath(thumbnails_root)
+        fingerprints = readThumbnailFingerprints(thumbnails_root)
+        fingerprints.update(new_fingerprints)
+        for thumbnail_name, fingerprint in new_fingerprints.items():
+            if not fingerprint:
+                fingerprints.pop(thumbnail_name) # Made from an image that couldn't be fingerprinted
+        temp_file = fingerprints_path.with_name(f'{fingerprints_path.name}.tmp{os.getpid()}')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as file:
+                json.dump(fingerprints, file, indent=0, sort_keys=True)
+            os.replace(temp_file, fingerprints_path)
+        except OSError as error:
+            print(f'Failed To Save Thumbnail Fingerprints: {error}')
+            temp_file.unlink(missing_ok=True)
+    thumbnail_fingerprints.clear()
+    return None
 
-                            all_the_data = createRetroArchThumbnailImage(
-                                all_the_data,
-                                image_source_paths, image_output_path,
-                                platform, game_title, game_path, media
-                            )
-    
-    return all_the_data
 
+### Read the fingerprints file of a thumbnails directory, see saveThumbnailFingerprints().
+###     (thumbnails_root) A thumbnails directory Path. Example: .../RetroArch/thumbnails
+###     --> Returns a [Dictionary] { Thumbnail Path In The Directory : Fingerprint }
+def readThumbnailFingerprints(thumbnails_root):
+    try:
+        with open(getThumbnailFingerprintsPath(thumbnails_root), 'r', encoding='utf-8') as file:
+            fingerprints = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return fingerprints if type(fingerprints) == dict else {}
 
-### Create a new thumbnail image for RetroArch modifying the image as needed from LaunchBox.
+
+### Get the path of the fingerprints file of a thumbnails directory, see saveThumbnailFingerprints().
+###     (thumbnails_root) A thumbnails directory Path.
+###     --> Returns a [Path]
+def getThumbnailFingerprintsPath(thumbnails_root):
+    return Path(thumbnails_root) / f'.{Path(__file__).stem}__fingerprints.json'
+
+
+### Get (or create) the edit log of a single RetroArch thumbnail.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
-###     (image_source_paths) A list of image paths to useable images.
-###     (image_output_path) The path to save the RetroArch thumbnail/image.
 ###     (platform) The platform a game belongs to.
 ###     (game_title) A game's title, which can have one or more game files.
 ###     (game_path) The path to a game file.
 ###     (media) One of three image categories in RetroArch.
+###     (image_output_path) The path of the RetroArch thumbnail.
 ###     --> Returns a [Dictionary]
-def createRetroArchThumbnailImage(all_the_data, image_source_paths, image_output_path, platform, game_title, game_path, media):
-    width_change = all_the_data.get(MODIFY_IMAGE_WIDTH, NO_CHANGE)
-    height_change = all_the_data.get(MODIFY_IMAGE_HEIGHT, NO_CHANGE)
-    resampling_filter = all_the_data.get(IMAGE_RESAMPLING_FILTER, NEAREST)
-    keep_aspect_ratio = all_the_data.get(KEEP_ASPECT_RATIO, True)
-    overwrite_retroarch_thumbnails = all_the_data.get(OVERWRITE_IMAGES, False)
-    
-    current_game_image_paths_log = all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform].get(game_title)
-    if not current_game_image_paths_log:
-        all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title] = { game_path : {} }
-    elif not all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title].get(game_path):
-        all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title][game_path] = {}
-    current_game_image_paths_log = all_the_data[LOG_DATA][SAVED_IMAGE_PATHS][platform][game_title]
-    
-    # Get next image from source list
-    next_alt_image = 0
-    if len(image_source_paths) > 1 and current_game_image_paths_log:
-        if media == FRONT_BOXART:
-            use_image_alt = all_the_data.get(ALTERNATE_BOXART_IMAGES, False)
-        elif media == TITLE_SCREEN:
-            use_image_alt = all_the_data.get(ALTERNATE_TITLE_IMAGES, False)
-        elif media == GAMEPLAY_SCREEN:
-            use_image_alt = all_the_data.get(ALTERNATE_GAMEPLAY_IMAGES, True)
-        else:
-            use_image_alt = False
-        
-        if use_image_alt:# and current_game_image_paths_log.get(game_path):
-            for media_types in current_game_image_paths_log.values():
-                for media_type, save_data in media_types.items():
-                    if media_type == media:
-                        if type(save_data[SAVE_INFO]) == int and save_data[SAVE_INFO] > 0:
-                            
-                            # Next image, but start over and repeat if max hit
-                            next_alt_image += 1
-                            while next_alt_image >= len(image_source_paths):
-                                next_alt_image -= len(image_source_paths)
-    
-    image_source_path = image_source_paths[next_alt_image]
-    
-    if pillow_installed and image_output_path.exists() and overwrite_retroarch_thumbnails:
-        image_source = Image.open(image_source_path)
-    elif pillow_installed and not image_output_path.exists():
-        image_source = Image.open(image_source_path)
-    else:
-        image_source = None
-    
-    # Image Modification
-    if pillow_installed and image_source and (width_change or height_change):
-        if not all_the_data[LOG_DATA][IMAGE_EDITS][platform].get(game_title):
-            all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title] = {}
-        if not all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title].get(game_path):
-            all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path] = {
-                FRONT_BOXART : {}, TITLE_SCREEN : {}, GAMEPLAY_SCREEN : {}
-            }
-        if not all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media].get(image_output_path):
-            all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output_path] = {}
-        
-        current_game_image_edit_log = all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output_path]
-        current_game_image_edit_log[MODIFY_IMAGE_SIZE] = [ (image_source.width, image_source.height) ]
-        
-        try:
-            if debug: print(f'  Org Image Size: {image_source.width} x {image_source.height}')
-            image_source = resizeImage(
-                image_source,
-                width_change,
-                height_change,
-                keep_aspect_ratio,
-                resampling_filter
-            )
-            if debug: print(f'  New Image Size: {image_source.width} x {image_source.height}')
-            
-            # Add new image size to log only if it has changed.
-            if (image_source.width, image_source.height) not in current_game_image_edit_log[MODIFY_IMAGE_SIZE]:
-                current_game_image_edit_log[MODIFY_IMAGE_SIZE].append(
-                    (image_source.width, image_source.height)
-                )
-        
-        except (FileNotFoundError, TypeError, UnidentifiedImageError, ValueError) as err:
-            error = f'Image Resize Failed: {err}'
-            print(f'  -ERROR: {error}')
-            current_game_image_edit_log[ERROR] = error
-    
-    # Save Image File...
-    if image_output_path.exists():
-        if overwrite_retroarch_thumbnails:
-            
-            # Check if file is read-only via file owner permissions.
-            file_permission = image_output_path.stat().st_mode & stat.S_IRWXU
-            
-            #if ((file_permission) == stat.S_IWUSR): # stat.S_IWRITE
-            if ((file_permission) == stat.S_IRUSR): # stat.S_IREAD
-                # If file is not writable, just let the error happen and don't rename file.
-                if debug: print(f'  -Read-Only File Permission: {file_permission}')
-                file_save_status = NOT_SAVED
-            
-            else:
-                # Rename and delete later after successful save or revert rename if an error occurs.
-                temp_file = Path(PurePath().joinpath(
-                    image_output_path.parent,
-                    f'{image_output_path.name}.tmp'
-                ))
-                if temp_file.exists():
-                    temp_file = Path(PurePath().joinpath(
-                        image_output_path.parent,
-                        f'{image_output_path.name}.tmp{int(RandomNumber()*100000)}'
-                    ))
-                image_output_path.rename(temp_file)
-                file_save_status = OVERWRITTEN
-        
-        else:
-            file_save_status = NOT_SAVED # Not Overwriting Files
-    else:
-        file_save_status = NEW_SAVE
-    
-    if image_source:
-        try:
-            createMissingDirectories(image_output_path)
-            params = getExtraSaveImageParams(all_the_data)
-            image_source.save(image_output_path, **params)
-            if file_save_status == OVERWRITTEN:
-                temp_file.unlink(missing_ok=True) # Delete
-        except (OSError, ValueError) as err:
-            if file_save_status == OVERWRITTEN:
-                image_output_path.unlink(missing_ok=True) # Delete
-                temp_file.rename(image_output_path)
-            error = f'Failed To Save Image: {err}'
-            print(f'  -ERROR: {error}')
-            file_save_status = error
-    
-    # Alt: Copy and paste image file if Pillow not installed.
-    elif not pillow_installed and file_save_status != NOT_SAVED:
-        if image_source_path.suffix == '.png':
-            try:
-                createMissingDirectories(image_output_path)
-                CopyFile(image_source_path, image_output_path)
-                if file_save_status == OVERWRITTEN:
-                    temp_file.unlink(missing_ok=True) # Delete
-            except (OSError, ValueError) as err:
-                if file_save_status == OVERWRITTEN:
-                    image_output_path.unlink(missing_ok=True) # Delete
-                    temp_file.rename(image_output_path)
-                error = f'Failed To Save Image: {err}'
-                print(f'  -ERROR: {error}')
-                file_save_status = error
-        
-        else:
-            # This shouldn't ever show since only PNG images will be queried/used when Pillow not installed.
-            print('  -WARNING: Without "Pillow" installed non-PNG images will not work in RetroArch.')
-            print(f'  -Skipping image file: {image_source_path}')
-    
-    current_game_image_paths_log[game_path][media] = [
-        image_source_path, image_output_path, file_save_status
-    ]
+def getImageEditLog(all_the_data, platform, game_title, game_path, media, image_output_path):
+    if not all_the_data[LOG_DATA][IMAGE_EDITS][platform].get(game_title):
+        all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title] = {}
+    if not all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title].get(game_path):
+        all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path] = {
+            FRONT_BOXART : {}, TITLE_SCREEN : {}, GAMEPLAY_SCREEN : {}
+        }
+    if not all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media].get(image_output_path):
+        all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output_path] = {}
     
-    return all_the_data
+    return all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output_path]
 
 
 ### Resize an image.
@@ -1517,15 +3366,15 @@ def modifyImageSize(org_image_shape, image_size_modifications, keep_aspect_ratio
         
         if image_size_modifications[WIDTH][MODIFIER] == UPSCALE:
             if org_image_shape[WIDTH] < image_size_modifications[WIDTH][NUMBER]:
-                new_height = image_size_modifications[WIDTH][NUMBER]
+                new_width = image_size_modifications[WIDTH][NUMBER]
             else:
-                new_height = org_image_shape[WIDTH]
+                new_width = org_image_shape[WIDTH]
         
         if image_size_modifications[WIDTH][MODIFIER] == DOWNSCALE:
             if org_image_shape[WIDTH] > image_size_modifications[WIDTH][NUMBER]:
-                new_height = image_size_modifications[WIDTH][NUMBER]
+                new_width = image_size_modifications[WIDTH][NUMBER]
             else:
-                new_height = org_image_shape[WIDTH]
+                new_width = org_image_shape[WIDTH]
     
     elif image_size_modifications[WIDTH] != NO_CHANGE:
         new_width = image_size_modifications[WIDTH]
@@ -1533,83 +3382,606 @@ def modifyImageSize(org_image_shape, image_size_modifications, keep_aspect_ratio
     else:
         new_width = org_image_shape[WIDTH]
     
-    # Height
-    if type(image_size_modifications[HEIGHT]) is tuple:
+    # Height
+    if type(image_size_modifications[HEIGHT]) is tuple:
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == NO_CHANGE:
+            new_height = org_image_shape[HEIGHT]
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == CHANGE_TO:
+            new_height = image_size_modifications[HEIGHT][NUMBER]
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == MODIFY_BY_PERCENT:
+            if type(image_size_modifications[HEIGHT][NUMBER]) == str:
+                percent_number = re_number_compiled_pattern.search(image_size_modifications[HEIGHT][NUMBER])
+                if percent_number:
+                    multipler = float(percent_number.group().strip()) / 100
+                    new_height = org_image_shape[HEIGHT] * multipler
+                else:
+                    print(f'Error: Can\'t decipher what kind of number this is: {image_size_modifications[HEIGHT]}')
+                    new_height = org_image_shape[HEIGHT]
+            else:
+                multipler = image_size_modifications[HEIGHT][NUMBER] / 100
+                new_height = org_image_shape[HEIGHT] * multipler
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == MODIFY_BY_PIXELS:
+            new_height = org_image_shape[HEIGHT] + image_size_modifications[HEIGHT][NUMBER]
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == UPSCALE:
+            if org_image_shape[HEIGHT] < image_size_modifications[HEIGHT][NUMBER]:
+                new_height = image_size_modifications[HEIGHT][NUMBER]
+            else:
+                new_height = org_image_shape[HEIGHT]
+        
+        if image_size_modifications[HEIGHT][MODIFIER] == DOWNSCALE:
+            if org_image_shape[HEIGHT] > image_size_modifications[HEIGHT][NUMBER]:
+                new_height = image_size_modifications[HEIGHT][NUMBER]
+            else:
+                new_height = org_image_shape[HEIGHT]
+    
+    elif image_size_modifications[HEIGHT] != NO_CHANGE:
+        new_height = image_size_modifications[HEIGHT]
+    
+    else:
+        new_height = org_image_shape[HEIGHT]
+    
+    # Aspect Ratio
+    if keep_aspect_ratio and image_size_modifications[WIDTH] == NO_CHANGE and image_size_modifications[HEIGHT] != NO_CHANGE :
+        factor_w = org_image_shape[WIDTH] / org_image_shape[HEIGHT]
+        new_width = org_image_shape[WIDTH] - (org_image_shape[HEIGHT] - new_height) * factor_w
+    
+    elif keep_aspect_ratio and image_size_modifications[HEIGHT] == NO_CHANGE and image_size_modifications[WIDTH] != NO_CHANGE:
+        factor_h = org_image_shape[HEIGHT] / org_image_shape[WIDTH]
+        new_height = org_image_shape[HEIGHT] - (org_image_shape[WIDTH] - new_width) * factor_h
+    
+    # If both sizes are downscaled, fit the image within both sizes.
+    elif (keep_aspect_ratio and type(image_size_modifications[WIDTH]) is tuple and type(image_size_modifications[HEIGHT]) is tuple and
+          image_size_modifications[WIDTH][MODIFIER] == DOWNSCALE and image_size_modifications[HEIGHT][MODIFIER] == DOWNSCALE):
+        factor = min(new_width / org_image_shape[WIDTH], new_height / org_image_shape[HEIGHT])
+        new_width = org_image_shape[WIDTH] * factor
+        new_height = org_image_shape[HEIGHT] * factor
+    
+    new_width = round(new_width)
+    new_height = round(new_height)
+    #print(f'Width: [{new_width}]  X  Height: [{new_height}]')
+    
+    return new_width, new_height
+
+
+### Save a RetroArch thumbnail file without ever leaving a partly saved thumbnail behind. The image is
+### saved in memory, written to a temporary file in the same directory, and only then replaces the old
+### thumbnail (if any) in a single step.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_output_path) The path to save the RetroArch thumbnail to.
+###     (image) An Image to save.
+###     (params) Image saving parameters.
+###     (image_copy_path) Path to an image file to copy instead of saving an Image (Pillow not installed).
+###     --> Returns a [Path] of the temporary file used
+def saveThumbnailFile(all_the_data, image_output_path, image_data = None, image_copy_path = None):
+    createMissingDirectories(image_output_path)
+    
+    temp_file = Path(PurePath().joinpath(
+        image_output_path.parent,
+        f'{image_output_path.name}.tmp{int(RandomNumber()*100000)}'
+    ))
+    writeResumeJournal(all_the_data, { 'output' : str(image_output_path), 'temp' : str(temp_file) })
+    
+    try:
+        if image_data:
+            throttleIO(IO_WRITE, len(image_data))
+            with open(temp_file, 'wb') as file:
+                file.write(image_data)
+                if save_durability != NO_SYNC:
+                    file.flush()
+                    os.fsync(file.fileno())
+        else:
+            throttleCopyIO(image_copy_path)
+            CopyFile(image_copy_path, temp_file)
+            if save_durability != NO_SYNC:
+                with open(temp_file, 'rb+') as file:
+                    os.fsync(file.fileno())
+        
+        os.replace(temp_file, image_output_path)
+    
+    except OSError:
+        temp_file.unlink(missing_ok=True) # Delete
+        raise
+    
+    if save_durability == SYNC_EACH_FILE:
+        syncDirectory(image_output_path.parent)
+    elif save_durability == SYNC_DIRECTORIES:
+        unsynced_directories.add(image_output_path.parent)
+    
+    return temp_file
+
+
+### Write a RetroArch thumbnail to its output target, either saved as its own file or exported into an archive.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_output_path) The path to save the RetroArch thumbnail to.
+###     (target) The output target the thumbnail is for.
+###     (image_data) A PNG image file's data to save, see encodePNGImage().
+###     (image_copy_path) Path to an image file to copy instead.
+###     --> Returns a [Path] of the temporary file used or None if exported to an archive
+def writeThumbnailFile(all_the_data, image_output_path, target, image_data = None, image_copy_path = None):
+    if target.get(EXPORT_ARCHIVE):
+        exportThumbnailFile(all_the_data, image_output_path, target, image_data, image_copy_path)
+        return None
+    return saveThumbnailFile(all_the_data, image_output_path, image_data, image_copy_path)
+
+
+### Encode an image as a PNG image file, in memory.
+###     (image) An Image to encode.
+###     (params) Image saving parameters.
+###     --> Returns a [Bytes]
+def encodePNGImage(image, params = {}):
+    image_buffer = BytesIO()
+    image.save(image_buffer, format='PNG', **params)
+    return image_buffer.getvalue()
+
+
+### Export a RetroArch thumbnail into a ".zip" or ".tar" archive, laid out just like RetroArch's thumbnails
+### directory. The archive is opened when the first thumbnail is exported and stays open until closed.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_output_path) The path the RetroArch thumbnail would be saved to.
+###     (target) The output target the thumbnail is for.
+###     (image_data) A PNG image file's data to export, see encodePNGImage().
+###     (image_copy_path) Path to an image file to copy instead.
+###     --> Returns a [None]
+def exportThumbnailFile(all_the_data, image_output_path, target, image_data = None, image_copy_path = None):
+    archive_path = target[EXPORT_ARCHIVE]
+    archive_export = getArchiveExport(all_the_data, archive_path)
+    archive_member_name = getArchiveMemberName(target, image_output_path)
+    
+    if not archive_export[ARCHIVE_FILE]:
+        # A delta export gets its own archive, so the last export is never replaced by only what changed since.
+        if not archive_export.get(ARCHIVE_FILE_PATH):
+            if target.get(EXPORT_DELTA) and archive_export[ARCHIVE_MANIFEST]:
+                archive_export[ARCHIVE_FILE_PATH] = getDeltaArchivePath(archive_path)
+            else:
+                archive_export[ARCHIVE_FILE_PATH] = archive_path
+        archive_file_path = archive_export[ARCHIVE_FILE_PATH]
+        createMissingDirectories(archive_file_path)
+        # Replace the last export, unless thumbnails were already added to it during this run.
+        mode = 'a' if archive_export[ARCHIVE_ENTRIES] else 'w'
+        if archive_file_path.suffix.lower() == '.tar':
+            archive_export[ARCHIVE_FILE] = tarfile.open(archive_file_path, mode)
+        else:
+            archive_export[ARCHIVE_FILE] = zipfile.ZipFile(archive_file_path, mode, zipfile.ZIP_STORED) # PNGs are already compressed.
+    archive_file = archive_export[ARCHIVE_FILE]
+    
+    if image_data:
+        throttleIO(IO_WRITE, len(image_data))
+        if type(archive_file) is tarfile.TarFile:
+            tar_info = tarfile.TarInfo(archive_member_name)
+            tar_info.size = len(image_data)
+            tar_info.mtime = int(datetime.now().timestamp())
+            archive_file.addfile(tar_info, BytesIO(image_data))
+        else:
+            archive_file.writestr(archive_member_name, image_data)
+    else:
+        throttleCopyIO(image_copy_path)
+        if type(archive_file) is tarfile.TarFile:
+            archive_file.add(image_copy_path, archive_member_name)
+        else:
+            archive_file.write(image_copy_path, archive_member_name)
+    
+    return None
+
+
+### Get the export details of an archive, loading the manifest of what was exported to it last time.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (archive_path) The Path of the archive.
+###     --> Returns a [Dictionary] { ARCHIVE_FILE : Open Archive, ARCHIVE_FILE_PATH : Path of the Open Archive,
+###                                  ARCHIVE_MANIFEST : {...}, ARCHIVE_ENTRIES : {...} }
+def getArchiveExport(all_the_data, archive_path):
+    archive_exports = all_the_data[APP_DATA][ARCHIVE_EXPORTS]
+    if archive_path not in archive_exports:
+        try:
+            with open(f'{archive_path}.manifest.json', 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            manifest = {}
+        archive_exports[archive_path] = { ARCHIVE_FILE : None, ARCHIVE_FILE_PATH : None, ARCHIVE_MANIFEST : manifest, ARCHIVE_ENTRIES : {} }
+    return archive_exports[archive_path]
+
+
+### Get a new path for a delta export next to the archive it's a delta of, named with the time it was exported.
+###     (archive_path) The Path of the archive.
+###     --> Returns a [Path] Example: D:\thumbnails_delta_20240131_201500.zip
+def getDeltaArchivePath(archive_path):
+    delta_name = f'{archive_path.stem}_delta_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+    delta_archive_path = archive_path.with_name(f'{delta_name}{archive_path.suffix}')
+    delta_number = 1
+    while delta_archive_path.exists():
+        delta_number += 1
+        delta_archive_path = archive_path.with_name(f'{delta_name}_{delta_number}{archive_path.suffix}')
+    return delta_archive_path
+
+
+### Get the name a RetroArch thumbnail is stored under in an archive.
+###     (target) The output target the thumbnail is for.
+###     (image_output_path) The path the RetroArch thumbnail would be saved to.
+###     --> Returns a [String] Example: thumbnails/Sega - Mega Drive - Genesis/Named_Boxarts/Sonic.png
+def getArchiveMemberName(target, image_output_path):
+    return PurePath('thumbnails', image_output_path.relative_to(target[THUMBNAILS_ROOT])).as_posix()
+
+
+### Close all open export archives and save their manifests, so the next delta export only includes
+### thumbnails that are new or changed.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def closeArchiveExports(all_the_data):
+    archive_exports = all_the_data[APP_DATA].get(ARCHIVE_EXPORTS, {})
+    for archive_path, archive_export in archive_exports.items():
+        if not archive_export[ARCHIVE_FILE]:
+            print(f'No New Thumbnails To Export, No Archive Saved: {archive_path}')
+            continue
+        archive_export[ARCHIVE_FILE].close()
+        archive_export[ARCHIVE_MANIFEST].update(archive_export[ARCHIVE_ENTRIES])
+        try:
+            with open(f'{archive_path}.manifest.json', 'w', encoding='utf-8') as file:
+                json.dump(archive_export[ARCHIVE_MANIFEST], file, indent=1)
+        except OSError as error:
+            print(f'Failed To Save Archive Manifest: {error}')
+        print(f'Exported {len(archive_export[ARCHIVE_ENTRIES])} Thumbnails To: {archive_export[ARCHIVE_FILE_PATH]}')
+    archive_exports.clear()
+    return None
+
+
+### Get a snapshot of all the files in a RetroArch thumbnail directory, listing it only the first time
+### it's needed. Used to check if thumbnails exist or are read-only without asking the disk for each file.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (directory) A RetroArch thumbnail directory Path. Example: .../Sega - Genesis/Named_Boxarts
+###     --> Returns a [Dictionary] { Normalized File Name : ( Size, Modified Time, Mode ) }
+def getThumbnailDirectorySnapshot(all_the_data, directory):
+    thumbnail_snapshots = all_the_data[APP_DATA][RETROARCH].setdefault(THUMBNAIL_SNAPSHOTS, {})
+    if directory not in thumbnail_snapshots:
+        snapshot = {}
+        throttleIO(IO_METADATA)
+        try:
+            with os.scandir(directory) as directory_entries:
+                for entry in directory_entries:
+                    try:
+                        entry_stat = entry.stat() # No extra disk access on Windows.
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(entry_stat.st_mode):
+                        snapshot[os.path.normcase(entry.name)] = (entry_stat.st_size, entry_stat.st_mtime_ns, entry_stat.st_mode)
+            existing_directories.add(Path(directory))
+        except OSError:
+            pass # Directory doesn't exist (yet), so no thumbnails in it either.
+        thumbnail_snapshots[directory] = snapshot
+    return thumbnail_snapshots[directory]
+
+
+### Update a RetroArch thumbnail directory's snapshot after a thumbnail is saved in it.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_output_path) The path of the RetroArch thumbnail saved.
+###     --> Returns a [None]
+def updateThumbnailDirectorySnapshot(all_the_data, image_output_path):
+    snapshot = getThumbnailDirectorySnapshot(all_the_data, image_output_path.parent)
+    try:
+        file_stat = image_output_path.stat()
+        snapshot[os.path.normcase(image_output_path.name)] = (file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_mode)
+    except OSError:
+        snapshot.pop(os.path.normcase(image_output_path.name), None)
+    return None
+
+
+### Verify the RetroArch thumbnails already saved match what the current preset would create, without
+### creating any. Only image headers are read, many at the same time, to check each thumbnail's size.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Dictionary] { Audit Problem : [ ( Thumbnail Path, Details ) ] }
+def verifyRetroArchThumbnails(all_the_data):
+    thumbnail_audit = all_the_data[APP_DATA][THUMBNAIL_AUDIT] = {}
+    all_the_data = createRetroArchImagePaths(all_the_data)
+    all_the_data[APP_DATA][THUMBNAIL_AUDIT] = None
+    
+    audit_results = { MISSING_THUMBNAIL : [], WRONG_SIZE_THUMBNAIL : [], STALE_THUMBNAIL : [], UNEXPECTED_THUMBNAIL : [] }
+    
+    # Each LaunchBox image is checked once for all the thumbnails made from it.
+    audit_sources = {}
+    for image_output_path, (image_source_path, target) in thumbnail_audit.items():
+        audit_sources.setdefault(image_source_path, {})[image_output_path] = target
+    thumbnails_roots = { target[THUMBNAILS_ROOT] for image_source_path, target in thumbnail_audit.values() if not target.get(EXPORT_ARCHIVE) }
+    saved_fingerprints = { thumbnails_root : readThumbnailFingerprints(thumbnails_root) for thumbnails_root in thumbnails_roots }
+    
+    # The thumbnail directories of every playlist are checked, not only the ones with thumbnails to verify.
+    playlist_thumbnail_names = {}
+    thumbnail_directories = set()
+    for retroarch_playlist_path, (file_key, retroarch_game_data) in all_the_data[APP_DATA][RETROARCH][PLAYLISTS].items():
+        playlist_thumbnail_names[retroarch_playlist_path.stem] = {
+            os.path.normcase(f'{game["label"]}.png'.replace('&', '_')) for game in retroarch_game_data
+        }
+        for thumbnails_root in thumbnails_roots:
+            for thumbnail_dir_name in ('Named_Boxarts', 'Named_Titles', 'Named_Snaps'):
+                thumbnail_directories.add(Path(PurePath().joinpath(thumbnails_root, retroarch_playlist_path.stem, thumbnail_dir_name)))
+    thumbnail_directories.update( image_output_path.parent for image_output_path, (image_source_path, target)
+                                  in thumbnail_audit.items() if not target.get(EXPORT_ARCHIVE) )
+    
+    print(f'\nVerifying {len(thumbnail_audit)} RetroArch Thumbnails...')
+    with ThreadPoolExecutor(max(1, image_folder_workers)) as thread_pool:
+        list(thread_pool.map(lambda directory: getThumbnailDirectorySnapshot(all_the_data, directory), thumbnail_directories))
+        for source_audit_results in thread_pool.map(
+            lambda audit_source: auditThumbnailFiles(all_the_data, *audit_source, saved_fingerprints), audit_sources.items()):
+            for audit_problem, image_output_path, details in source_audit_results:
+                audit_results[audit_problem].append((image_output_path, details))
+    
+    # Thumbnails for games no longer (or never) in their RetroArch playlist.
+    for thumbnail_directory in sorted(thumbnail_directories):
+        thumbnail_names = playlist_thumbnail_names.get(thumbnail_directory.parent.name, set())
+        for thumbnail_name in getThumbnailDirectorySnapshot(all_the_data, thumbnail_directory):
+            if thumbnail_name not in thumbnail_names:
+                audit_results[UNEXPECTED_THUMBNAIL].append((Path(PurePath().joinpath(thumbnail_directory, thumbnail_name)), 'Not In Playlist'))
+    
+    for audit_problem_results in audit_results.values():
+        audit_problem_results.sort()
+    
+    return audit_results
+
+
+### Record the thumbnails that would be created from a LaunchBox image so they can be verified,
+### instead of creating them. Takes the same arguments as createRetroArchThumbnailImage().
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_source_paths) A list of image paths to useable images.
+###     (image_output_paths) The paths the RetroArch thumbnails would be saved to. { Path : Output Target }
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title, which can have one or more game files.
+###     (game_path) The path to a game file.
+###     (media) One of three image categories in RetroArch.
+###     --> Returns a [Dictionary]
+def planThumbnailAudit(all_the_data, image_source_paths, image_output_paths, platform, game_title, game_path, media):
+    image_source_path = (all_the_data[APP_DATA][LAUNCHBOX][PLATFORMS][platform].get(PLANNED_IMAGE_PATHS, {})
+                         .get(game_title, {}).get(game_path, {}).get(media, image_source_paths[0]))
+    for image_output_path, target in image_output_paths.items():
+        all_the_data[APP_DATA][THUMBNAIL_AUDIT][image_output_path] = ( image_source_path, target )
+    return all_the_data
+
+
+### Check the thumbnails made from a LaunchBox image are all there, the right size, and made from the
+### LaunchBox image as it is now, using the fingerprints saved with them (or, for thumbnails saved
+### before fingerprints were, that they aren't older than the LaunchBox image). Thumbnails in export
+### archives are checked against the archive's manifest instead.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (image_source_path) Path to a LaunchBox image.
+###     (image_output_paths) The paths of the RetroArch thumbnails made from it. { Path : Output Target }
+###     (saved_fingerprints) The fingerprints saved in each thumbnails directory. { Thumbnails Root : { Thumbnail : Fingerprint } }
+###     --> Returns a [List] of problems found [ ( Audit Problem, Thumbnail Path, Details ) ]
+def auditThumbnailFiles(all_the_data, image_source_path, image_output_paths, saved_fingerprints = {}):
+    audit_problems = []
+    throttleIO(IO_METADATA)
+    try:
+        image_source_stat = image_source_path.stat()
+    except OSError as error:
+        for image_output_path in image_output_paths:
+            audit_problems.append((MISSING_THUMBNAIL, image_output_path, f'LaunchBox Image Can\'t Be Read: {error.strerror}'))
+        return audit_problems
+    image_source_size = None
+    
+    for image_output_path, target in image_output_paths.items():
         
-        if image_size_modifications[HEIGHT][MODIFIER] == NO_CHANGE:
-            new_height = org_image_shape[HEIGHT]
-        
-        if image_size_modifications[HEIGHT][MODIFIER] == CHANGE_TO:
-            new_height = image_size_modifications[HEIGHT][NUMBER]
+        if target.get(EXPORT_ARCHIVE):
+            archive_export = getArchiveExport(all_the_data, target[EXPORT_ARCHIVE])
+            exported_fingerprint = archive_export[ARCHIVE_MANIFEST].get(getArchiveMemberName(target, image_output_path))
+            if not exported_fingerprint:
+                audit_problems.append((MISSING_THUMBNAIL, image_output_path, f'Not Exported To: {target[EXPORT_ARCHIVE]}'))
+            elif exported_fingerprint != getImageFingerprint(image_source_path, image_source_stat, target, all_the_data):
+                audit_problems.append((STALE_THUMBNAIL, image_output_path, f'Exported From An Older Image Or Preset: {image_source_path}'))
+            continue
         
-        if image_size_modifications[HEIGHT][MODIFIER] == MODIFY_BY_PERCENT:
-            if type(image_size_modifications[HEIGHT][NUMBER]) == str:
-                percent_number = re_number_compiled_pattern.search(image_size_modifications[HEIGHT][NUMBER])
-                if percent_number:
-                    multipler = float(percent_number.group().strip()) / 100
-                    new_height = org_image_shape[HEIGHT] * multipler
-                else:
-                    print(f'Error: Can\'t decipher what kind of number this is: {image_size_modifications[HEIGHT]}')
-                    new_height = org_image_shape[HEIGHT]
-            else:
-                multipler = image_size_modifications[HEIGHT][NUMBER] / 100
-                new_height = org_image_shape[HEIGHT] * multipler
+        thumbnail_stat = getThumbnailDirectorySnapshot(all_the_data, image_output_path.parent).get(
+            os.path.normcase(image_output_path.name)
+        )
+        if not thumbnail_stat:
+            audit_problems.append((MISSING_THUMBNAIL, image_output_path, f'From: {image_source_path}'))
+            continue
         
-        if image_size_modifications[HEIGHT][MODIFIER] == MODIFY_BY_PIXELS:
-            new_height = org_image_shape[HEIGHT] + image_size_modifications[HEIGHT][NUMBER]
+        # Copying a LaunchBox image can keep its old modified time, but not its fingerprint.
+        saved_fingerprint = saved_fingerprints.get(target[THUMBNAILS_ROOT], {}).get(
+            image_output_path.relative_to(target[THUMBNAILS_ROOT]).as_posix()
+        )
+        if saved_fingerprint:
+            if saved_fingerprint != getImageFingerprint(image_source_path, image_source_stat, target, all_the_data):
+                audit_problems.append((STALE_THUMBNAIL, image_output_path, f'Made From An Older Image Or Preset: {image_source_path}'))
+        elif thumbnail_stat[SNAPSHOT_MODIFIED_TIME] < image_source_stat.st_mtime_ns:
+            audit_problems.append((STALE_THUMBNAIL, image_output_path, f'LaunchBox Image Changed Since: {image_source_path}'))
         
-        if image_size_modifications[HEIGHT][MODIFIER] == UPSCALE:
-            if org_image_shape[HEIGHT] < image_size_modifications[HEIGHT][NUMBER]:
-                new_height = image_size_modifications[HEIGHT][NUMBER]
-            else:
-                new_height = org_image_shape[HEIGHT]
+        # Without Pillow thumbnails are copies of the LaunchBox image, never resized.
+        width_change = target.get(MODIFY_IMAGE_WIDTH, NO_CHANGE)
+        height_change = target.get(MODIFY_IMAGE_HEIGHT, NO_CHANGE)
+        if image_source_size == None:
+            image_source_size = readImageSize(image_source_path)
+        if not image_source_size:
+            continue
+        if pillow_installed and (width_change or height_change):
+            try:
+                planned_image_size = modifyImageSize(image_source_size, (width_change, height_change), all_the_data.get(KEEP_ASPECT_RATIO, True))
+            except (TypeError, ValueError):
+                continue # Resizing fails when saved too, keeping the original size.
+        else:
+            planned_image_size = image_source_size
         
-        if image_size_modifications[HEIGHT][MODIFIER] == DOWNSCALE:
-            if org_image_shape[HEIGHT] > image_size_modifications[HEIGHT][NUMBER]:
-                new_height = image_size_modifications[HEIGHT][NUMBER]
-            else:
-                new_height = org_image_shape[HEIGHT]
+        thumbnail_size = readImageSize(image_output_path)
+        if thumbnail_size != tuple(planned_image_size):
+            thumbnail_size_text = f'{thumbnail_size[WIDTH]} x {thumbnail_size[HEIGHT]}' if thumbnail_size else 'Unreadable'
+            audit_problems.append((WRONG_SIZE_THUMBNAIL, image_output_path,
+                f'[ {thumbnail_size_text} ] Should Be [ {planned_image_size[WIDTH]} x {planned_image_size[HEIGHT]} ]'))
     
-    elif image_size_modifications[HEIGHT] != NO_CHANGE:
-        new_height = image_size_modifications[HEIGHT]
-    
-    else:
-        new_height = org_image_shape[HEIGHT]
+    return audit_problems
+
+
+### Get the width and height of an image by only reading its header. PNG and JPEG headers are read
+### directly, any other image format needs Pillow (which also only reads the header).
+###     (file_path) A full Path to an image file.
+###     --> Returns a [Tuple] ( Width, Height ) or None if not readable
+def readImageSize(file_path):
+    throttleIO(IO_METADATA) # Reading a header is mostly opening the file.
+    try:
+        with open(file_path, 'rb') as file:
+            header = file.read(24)
+            if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+                return int.from_bytes(header[16:20], 'big'), int.from_bytes(header[20:24], 'big')
+            
+            if header.startswith(b'\xff\xd8'):
+                # Skip from segment to segment until the frame header (SOF) with the image size is found.
+                file.seek(2)
+                while True:
+                    marker = file.read(2)
+                    while len(marker) == 2 and marker[1] == 0xFF: # Padding
+                        marker = marker[1:] + file.read(1)
+                    if len(marker) < 2 or marker[0] != 0xFF or marker[1] == 0xDA: # End of headers
+                        return None
+                    if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD8: # No segment data
+                        continue
+                    segment = file.read(7)
+                    if len(segment) < 2:
+                        return None
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        if len(segment) < 7:
+                            return None
+                        return int.from_bytes(segment[5:7], 'big'), int.from_bytes(segment[3:5], 'big')
+                    file.seek(int.from_bytes(segment[0:2], 'big') - len(segment), os.SEEK_CUR)
     
-    # Aspect Ratio
-    if keep_aspect_ratio and image_size_modifications[WIDTH] == NO_CHANGE and image_size_modifications[HEIGHT] != NO_CHANGE :
-        factor_w = org_image_shape[WIDTH] / org_image_shape[HEIGHT]
-        new_width = org_image_shape[WIDTH] - (org_image_shape[HEIGHT] - new_height) * factor_w
+    except OSError:
+        return None
     
-    elif keep_aspect_ratio and image_size_modifications[HEIGHT] == NO_CHANGE and image_size_modifications[WIDTH] != NO_CHANGE:
-        factor_h = org_image_shape[HEIGHT] / org_image_shape[WIDTH]
-        new_height = org_image_shape[HEIGHT] - (org_image_shape[WIDTH] - new_width) * factor_h
+    if pillow_installed:
+        try:
+            with Image.open(file_path) as image:
+                return image.size
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+            pass
+    return None
+
+
+### Wait until reading, writing, or checking files is within its limit (if any), set by io_read_limit,
+### io_write_limit and io_metadata_limit. Each limit is a token bucket shared by all threads, refilled
+### at the limit every second and holding up to a second's worth, allowing short bursts.
+###     (io_type) IO_READ, IO_WRITE or IO_METADATA
+###     (amount) Bytes read or written, or the number of directories listed and files checked.
+###     --> Returns a [Float] seconds waited
+def throttleIO(io_type, amount = 1):
+    if io_type == IO_READ:
+        io_limit = io_read_limit
+    elif io_type == IO_WRITE:
+        io_limit = io_write_limit
+    else:
+        io_limit = io_metadata_limit
     
-    new_width = round(new_width)
-    new_height = round(new_height)
-    #print(f'Width: [{new_width}]  X  Height: [{new_height}]')
+    wait_time = 0
+    with io_throttle_lock:
+        io_throttle_stats[io_type][0] += amount
+        if io_limit and amount:
+            now = Timer()
+            tokens, last_refill_time = io_throttle_buckets.get(io_type, (io_limit, now))
+            # Tokens can go below zero when more than a second's worth is needed at once, making
+            # this and any later I/O wait until paid back.
+            tokens = min(io_limit, tokens + (now - last_refill_time) * io_limit) - amount
+            if tokens < 0:
+                wait_time = -tokens / io_limit
+                io_throttle_stats[io_type][1] += wait_time
+            io_throttle_buckets[io_type] = (tokens, now)
     
-    return new_width, new_height
+    if wait_time:
+        Wait(wait_time)
+    return wait_time
+
+
+### Wait until copying a file is within the read and write limits, see throttleIO().
+###     (file_path) The Path of the file to be copied.
+###     --> Returns a [None]
+def throttleCopyIO(file_path):
+    if io_read_limit or io_write_limit:
+        throttleIO(IO_METADATA)
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            return None # Let the copy fail.
+        throttleIO(IO_READ, file_size)
+        throttleIO(IO_WRITE, file_size)
+    return None
+
+
+### Lower the CPU and disk priority of this script (and any processes it starts), so other programs
+### using the same computer or drives go first.
+###     --> Returns a [Boolean] True if lowered
+def setLowPriority():
+    priority_lowered = False
+    if sys.platform == 'win32':
+        import ctypes
+        PROCESS_MODE_BACKGROUND_BEGIN = 0x00100000 # Low CPU, disk and memory priority
+        kernel32 = ctypes.windll.kernel32
+        priority_lowered = bool(kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), PROCESS_MODE_BACKGROUND_BEGIN))
+    else:
+        try:
+            os.nice(10)
+            priority_lowered = True
+        except OSError as error:
+            print(f'Couldn\'t Lower CPU Priority: {error.strerror}')
+        if sys.platform.startswith('linux'):
+            try: # Lowest "best effort" disk priority, still getting a turn when the disk is always busy.
+                subprocess.run(['ionice', '-c', '2', '-n', '7', '-p', str(os.getpid())], check=True, capture_output=True)
+            except (OSError, subprocess.CalledProcessError) as error:
+                print(f'Couldn\'t Lower Disk Priority: {error}')
+    return priority_lowered
+
+
+### Make sure all file changes (new, renamed, and replaced files) in a directory are written to disk.
+###     (directory) A directory Path.
+###     --> Returns a [None]
+def syncDirectory(directory):
+    throttleIO(IO_METADATA)
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return None # Directories can't be opened on Windows, where file replacements are already durable.
+    try:
+        os.fsync(directory_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_fd)
+    return None
+
+
+### Make sure all file changes in every directory saved to (since last synced) are written to disk.
+###     --> Returns a [None]
+def syncSavedDirectories():
+    while unsynced_directories:
+        syncDirectory(unsynced_directories.pop())
+    return None
 
 
-### Create any missing directories in a path if they don't already exists.
+### Create any missing directories in a path if they don't already exists. Directories already
+### created or found are remembered, so they're not checked again.
 ###     (path) A full absolute path.
 ###     --> Returns a [Boolean]
 def createMissingDirectories(path):
     path = Path(path)
-    if path.is_absolute():
-        for i in reversed(range(0, len(path.parents))):
-            path.parents[i].mkdir(mode=0o777, parents=False, exist_ok=True)
-    return Path(path).exists()
+    if path.is_absolute() and path.parent not in existing_directories:
+        throttleIO(IO_METADATA)
+        path.parent.mkdir(mode=0o777, parents=True, exist_ok=True)
+        existing_directories.update(path.parents)
+    return path.parent in existing_directories
 
 
 ### Get any extra image saving parameters to use before finally saving an image file.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
-###                    handle them with logs of everything done so far.
+###                    handle them with logs of everything done so far, or an output target.
 ###     --> Returns a [Dictionary]
 def getExtraSaveImageParams(all_the_data):
     save_params = {}
-    extra_image_saving_params = all_the_data.get(EXTRA_IMAGE_SAVING_PARAMS, {})
+    extra_image_saving_params = all_the_data.get(EXTRA_IMAGE_SAVING_PARAMS) or {}
     compress_min, compress_max = 1, 9
     
     for param, value in extra_image_saving_params.items():
@@ -1630,10 +4002,70 @@ def getExtraSaveImageParams(all_the_data):
             else: # Default
                 print(f'  -WARNING: Unknown PNG "Compression" value used: "{value}", default value used instead.')
                 save_params['compress_level'] = 6
+        
+        elif param == STRIP_METADATA:
+            if value == True:
+                save_params['icc_profile'] = None
+                save_params['exif'] = b''
     
     return save_params
 
 
+### Reduce the colors of an image, before saving it, by converting it to a palette image. Images with
+### few colors (pixel-art) are converted without any color loss and with a lower bit depth, while
+### other images are quantized, but only used if the quality of the quantized image is high enough.
+###     (image) An Image that is about to be saved.
+###     (extra_image_saving_params) A Dictionary of extra image saving parameters.
+###     --> Returns a [Image], [String] and [Dictionary]
+def reduceImageColors(image, extra_image_saving_params):
+    reduce_bit_depth = extra_image_saving_params.get(REDUCE_BIT_DEPTH, False)
+    palette_colors = extra_image_saving_params.get(PALETTE_COLORS)
+    palette_quality = extra_image_saving_params.get(PALETTE_QUALITY, 40)
+    color_reduction = None
+    save_params = {}
+    
+    if image.mode not in ('RGB', 'RGBA') or not (reduce_bit_depth or palette_colors):
+        return image, color_reduction, save_params
+    
+    # Only a fast octree can quantize images with transparency.
+    quantize_method = Image.Quantize.FASTOCTREE if image.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    
+    colors_used = image.getcolors(maxcolors=256)
+    if reduce_bit_depth and colors_used:
+        palette_image = image.quantize(colors=len(colors_used), method=quantize_method)
+        if getImageQuality(image, palette_image) == float('inf'): # No color loss
+            for bits in (1, 2, 4, 8):
+                if len(colors_used) <= 2 ** bits:
+                    break
+            color_reduction = f'{len(colors_used)} Colors ({bits}-Bit)'
+            save_params['bits'] = bits
+            return palette_image, color_reduction, save_params
+    
+    if type(palette_colors) == int:
+        palette_colors = min(max(palette_colors, 2), 256)
+        palette_image = image.quantize(colors=palette_colors, method=quantize_method)
+        quality = getImageQuality(image, palette_image)
+        if quality >= palette_quality:
+            color_reduction = f'{palette_colors} Color Palette (Quality: {"Lossless" if quality == float("inf") else f"{quality:.1f} dB"})'
+            return palette_image, color_reduction, save_params
+        elif debug:
+            print(f'  Palette Quality Too Low: {quality:.1f} dB')
+    
+    return image, color_reduction, save_params
+
+
+### Get the quality (peak signal-to-noise ratio) of an edited image compared to its original.
+###     (org_image) The original Image.
+###     (edited_image) The edited Image, same size as the original.
+###     --> Returns a [Float] in dB (infinite if images are the same)
+def getImageQuality(org_image, edited_image):
+    difference = ImageChops.difference(org_image, edited_image.convert(org_image.mode))
+    mean_squared_error = sum(rms ** 2 for rms in ImageStat.Stat(difference).rms) / len(org_image.getbands())
+    if mean_squared_error == 0:
+        return float('inf')
+    return 10 * log10(255 ** 2 / mean_squared_error)
+
+
 ### Make any variable a list if not already a list tuple for looping purposes.
 ###     (variable) A variable of any kind.
 ###     --> Returns a [List] or [Tuple]
@@ -1645,6 +4077,330 @@ def makeList(variable):
     return variable
 
 
+### Print the totals of everything found and saved so far.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def printRunSummary(all_the_data):
+    (formated_completion_time, launchbox_images_found, games_found_in_lb_ra,
+     image_edit_errors, image_files_saved, image_file_dupes, image_save_errors) = getLogNumbers(all_the_data)
+    
+    print(f'\nAmount of Game Files Found in Both LaunchBox and RetroArch: {games_found_in_lb_ra}')
+    print(f'Total Usable LaunchBox Images Found: {launchbox_images_found}')
+    print(f'Amount of RetroArch Images Saved (Duplicates): {image_files_saved} ({image_file_dupes})')
+    print(f'Images Not Saved Due To Errors: {image_save_errors}')
+    print(f'Images That Failed Editing*: {image_edit_errors}')
+    print('*If an error happens while editing an image, it still keeps it\'s previous edits and can still be saved.')
+    print(f'\nTime To Completion: {formated_completion_time}')
+    return None
+
+
+### Keep running in the background with all the LaunchBox and RetroArch data already read, waiting
+### for files and directories passed on from this script (see forwardToDaemon) until told to stop.
+### Each drop is handled in the order it came in, since they all share the same data, but the same
+### thumbnail workers (see getThumbnailPool) keep making the thumbnails of every drop.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (daemon_file_path) Path of the file telling this script where to find the daemon.
+###     --> Returns a [Dictionary]
+def runDaemon(all_the_data, daemon_file_path = None):
+    if not daemon_file_path:
+        daemon_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__daemon.txt'))
+    
+    # Only connections from this computer that know the secret key are accepted.
+    authkey = os.urandom(32)
+    listener = Listener(('127.0.0.1', 0), authkey=authkey)
+    with open(daemon_file_path, 'w', encoding='utf-8') as daemon_file:
+        json.dump({ 'port' : listener.address[1], 'authkey' : authkey.hex() }, daemon_file)
+    
+    print(f'Daemon Running, Waiting For Files... (Stop with "--stop-daemon")')
+    running = True
+    try:
+        while running:
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError) as error:
+                if debug: print(f'  -Rejected Connection: {error}')
+                continue
+            
+            with connection:
+                try:
+                    paths = connection.recv()
+                except (OSError, EOFError):
+                    continue
+                
+                if paths == None:
+                    print('Daemon Stopping...')
+                    connection.send('Daemon Stopped.')
+                    running = False
+                    continue
+                
+                start_time = Timer()
+                output = StringIO()
+                with redirect_stdout(output):
+                    try:
+                        if type(paths) != list or not paths or not all(type(path) == str for path in paths):
+                            raise ValueError(f'Expected a list of file and directory paths, not: {str(paths)[:200]}')
+                        all_the_data = loadLaunchBoxRetroArchFiles(all_the_data)
+                        resetResumeJournal(all_the_data)
+                        clearFoundGames(all_the_data)
+                        all_the_data = findLaunchBoxGameImages(paths, all_the_data)
+                        print('\n---------------------------------')
+                        for preset_run in getPresetRuns(all_the_data):
+                            print(f'LaunchBox Images Found: {preset_run[LOG_DATA][IMAGES_FOUND]}')
+                            if preset_run[LOG_DATA][IMAGES_FOUND]:
+                                createRetroArchImagePaths(preset_run)
+                            printRunSummary(preset_run)
+                        closeArchiveExports(all_the_data)
+                    except Exception as error:
+                        print(f'\nERROR: {type(error).__name__}: {error}')
+                
+                if type(paths) == list and paths:
+                    print(f'Finished {len(paths)} Path(s) In {round(Timer() - start_time, 3)} Seconds: {paths[0]}')
+                else:
+                    print('Rejected A Request Without Paths.')
+                try:
+                    connection.send(output.getvalue())
+                except OSError:
+                    pass # Script closed before getting the results.
+    except KeyboardInterrupt:
+        print('Daemon Stopping...')
+    finally:
+        listener.close()
+        daemon_file_path.unlink(missing_ok=True)
+    
+    return all_the_data
+
+
+### Forget the games and images found in earlier drops, so the next drop only handles its own games.
+### Everything logged so far is kept.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [None]
+def clearFoundGames(all_the_data):
+    for preset_run in getPresetRuns(all_the_data):
+        preset_run[APP_DATA][RETROARCH][IMAGE_PATHS] = {}
+        for platform_data in preset_run[APP_DATA][LAUNCHBOX][PLATFORMS].values():
+            platform_data[GAME_PATHS] = {}
+            platform_data[IMAGE_PATHS] = {}
+            platform_data[CLAIMED_IMAGE_PATHS] = {}
+            platform_data[PLANNED_IMAGE_PATHS] = {}
+    return None
+
+
+### Pass files and directories on to a daemon of this script, if one is running, and print what it did.
+###     (paths) A list of file and directory paths, or None to stop the daemon.
+###     (daemon_file_path) Path of the file telling this script where to find the daemon.
+###     --> Returns a [Boolean]
+def forwardToDaemon(paths, daemon_file_path = None):
+    if not daemon_file_path:
+        daemon_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__daemon.txt'))
+    if not daemon_file_path.exists():
+        return False
+    
+    try:
+        with open(daemon_file_path, 'r', encoding='utf-8') as daemon_file:
+            daemon_info = json.load(daemon_file)
+        connection = Client(('127.0.0.1', daemon_info['port']), authkey=bytes.fromhex(daemon_info['authkey']))
+    except (OSError, ValueError, KeyError, AuthenticationError):
+        # Daemon closed without cleaning up (crash, power loss, etc).
+        daemon_file_path.unlink(missing_ok=True)
+        return False
+    
+    with connection:
+        if paths != None:
+            # The daemon may be running in a different directory.
+            paths = [str(Path(path).absolute()) for path in paths]
+            print(f'Passing {len(paths)} Path(s) On To Daemon...')
+        connection.send(paths)
+        try:
+            print(connection.recv())
+        except EOFError:
+            print('\nERROR: Daemon closed before finishing.')
+    
+    return True
+
+
+### Get the shard a game title belongs to. Always the same shard for the same platform and title,
+### so all of a title's game files (discs, regions, versions, etc) are handled by the same script.
+###     (platform) The platform a game belongs to.
+###     (game_title) A game's title.
+###     (shard_count) The number of shards a game library is split into.
+###     --> Returns a [Integer] from 1 to shard_count
+def getShardNumber(platform, game_title, shard_count):
+    return int(sha1(f'{platform}|{game_title}'.encode('utf-8')).hexdigest(), 16) % shard_count + 1
+
+
+### Read a shard argument. Example: "2/4" = The second of four shards.
+###     (shard_argument) A String "i/n".
+###     --> Returns a [Tuple] ( Shard Number, Shard Count ) or None if not valid
+def parseShard(shard_argument):
+    try:
+        shard_number, shard_count = ( int(number) for number in shard_argument.split('/') )
+    except (AttributeError, ValueError):
+        return None
+    if not 1 <= shard_number <= shard_count:
+        return None
+    return shard_number, shard_count
+
+
+### Save a manifest of everything a shard found and saved, to be merged with the other shards later.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (manifest_path) Path to save the manifest to.
+###     (preset_number) The preset used.
+###     --> Returns a [Boolean] True if saved
+def writeShardManifest(all_the_data, manifest_path, preset_number = None):
+    log_data = all_the_data[LOG_DATA]
+    saved_images = []
+    
+    for platform, games in log_data[SAVED_IMAGE_PATHS].items():
+        for game_title, game_paths in games.items():
+            for game_path, media_types in game_paths.items():
+                for media, saved_outputs in media_types.items():
+                    for image_output_path, save_data in saved_outputs.items():
+                        image_edit_log = (log_data[IMAGE_EDITS].get(platform, {}).get(game_title, {})
+                                          .get(game_path, {}).get(media, {}).get(image_output_path, {}))
+                        saved_images.append({
+                            'platform' : platform, 'title' : game_title, 'game' : str(game_path), 'media' : media,
+                            'source' : str(save_data[IMAGE_SOURCE]), 'output' : str(save_data[IMAGE_OUTPUT]),
+                            'save_info' : save_data[SAVE_INFO], 'edits' : image_edit_log
+                        })
+    
+    broken_images = {
+        str(image_path) : image_validation[1] for image_path, image_validation in
+        all_the_data[APP_DATA][LAUNCHBOX].get(IMAGE_VALIDATIONS, {}).items() if image_validation[1]
+    }
+    
+    manifest = {
+        'shard' : shard, 'preset' : preset_number, 'description' : all_the_data.get(DESCRIPTION) or '',
+        'images_found' : log_data[IMAGES_FOUND], 'completion_time' : log_data.get(COMPLETION_TIME, 0),
+        'peak_decoded_pixels' : log_data.get(PEAK_DECODED_PIXELS, 0),
+        'games_found' : [ str(game_path) for game_path in log_data[GAME_PATHS_IN_LB_RA] ],
+        'fuzzy_matches' : [ [str(image_path), *fuzzy_match] for image_path, fuzzy_match in log_data[FUZZY_MATCHES].items() ],
+        'broken_images' : broken_images,
+        'saved_images' : saved_images
+    }
+    
+    try:
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=1)
+    except (OSError, TypeError, ValueError) as error:
+        print(f'\nCouldn\'t save shard manifest due to a {type(error).__name__}: {error}')
+        return False
+    
+    print(f'Shard Manifest Saved: {manifest_path}')
+    return True
+
+
+### Merge the manifests of all shards into one log file per preset used, as if a single script
+### had done all the work. Only the newest manifest of each shard is merged, and only the shards split
+### the same way (same shard count) as the newest manifest of a preset.
+###     (manifest_paths) A list of shard manifest Paths.
+###     --> Returns a [List] of log file Paths created
+def mergeShardManifests(manifest_paths):
+    shard_manifests = []
+    for manifest_path in manifest_paths:
+        try:
+            shard_manifests.append(readShardManifest(manifest_path))
+        except (OSError, AttributeError, TypeError, ValueError, KeyError) as error:
+            print(f'Skipping Shard Manifest ({type(error).__name__}: {error}): {manifest_path}')
+    
+    # { Preset : ( Shard Count, { Shard Number : Shard Manifest } ) }
+    merged_shards = {}
+    for shard_manifest in sorted(shard_manifests, key = lambda shard_manifest: shard_manifest['modified_time'], reverse = True):
+        shard_number, shard_count = shard_manifest['shard']
+        shard_count_used, preset_shards = merged_shards.setdefault(shard_manifest['preset'], (shard_count, {}))
+        if shard_count != shard_count_used:
+            print(f'Skipping Shard Manifest (Split Into {shard_count} Shards, Not {shard_count_used}): {shard_manifest["path"]}')
+        elif shard_number in preset_shards:
+            print(f'Skipping Older Shard Manifest Of Shard {shard_number}/{shard_count}: {shard_manifest["path"]}')
+        else:
+            preset_shards[shard_number] = shard_manifest
+    
+    merged_runs = {}
+    for preset_number, (shard_count, preset_shards) in merged_shards.items():
+        merged_run = merged_runs[preset_number] = {
+            DESCRIPTION : preset_shards[min(preset_shards)]['description'],
+            APP_DATA : { LAUNCHBOX : { IMAGE_VALIDATIONS : {} } },
+            LOG_DATA : {
+                IMAGES_FOUND : 0, GAME_PATHS_IN_LB_RA : [], SAVED_IMAGE_PATHS : {}, IMAGE_EDITS : {},
+                FUZZY_MATCHES : {}, PEAK_DECODED_PIXELS : 0, COMPLETION_TIME : 0
+            }
+        }
+        log_data = merged_run[LOG_DATA]
+        
+        for shard_number, shard_manifest in sorted(preset_shards.items()):
+            print(f'Merging Shard {shard_number}/{shard_count}: {shard_manifest["path"]}')
+            log_data[IMAGES_FOUND] += shard_manifest['images_found']
+            log_data[GAME_PATHS_IN_LB_RA].extend(shard_manifest['games_found'])
+            # Shards run side by side, so the whole run took as long as the slowest shard.
+            log_data[COMPLETION_TIME] = max(log_data[COMPLETION_TIME], shard_manifest['completion_time'])
+            log_data[PEAK_DECODED_PIXELS] = max(log_data[PEAK_DECODED_PIXELS], shard_manifest['peak_decoded_pixels'])
+            log_data[FUZZY_MATCHES].update(shard_manifest['fuzzy_matches'])
+            merged_run[APP_DATA][LAUNCHBOX][IMAGE_VALIDATIONS].update(shard_manifest['broken_images'])
+            
+            for platform, game_title, game_path, media, image_source_path, image_output_path, save_info, edits in shard_manifest['saved_images']:
+                saved_outputs = ( log_data[SAVED_IMAGE_PATHS].setdefault(platform, {}).setdefault(game_title, {})
+                                  .setdefault(game_path, {}).setdefault(media, {}) )
+                saved_outputs[image_output_path] = [ image_source_path, image_output_path, save_info ]
+                
+                if edits:
+                    log_data[IMAGE_EDITS].setdefault(platform, {})
+                    getImageEditLog(merged_run, platform, game_title, game_path, media, image_output_path).update(edits)
+    
+    log_files_created = []
+    for preset_number, merged_run in merged_runs.items():
+        shard_count, preset_shards = merged_shards[preset_number]
+        missing_shards = [ str(shard_number) for shard_number in range(1, shard_count + 1) if shard_number not in preset_shards ]
+        if missing_shards:
+            print(f'\nWARNING: Shards Not Merged: {", ".join(missing_shards)} (Of {shard_count})')
+        
+        preset_suffix = f'_preset{preset_number}' if len(merged_runs) > 1 else ''
+        log_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__log_shards{preset_suffix}.txt'))
+        log_file_created = createLogFile(merged_run, log_file_path)
+        if log_file_created:
+            log_files_created.append(log_file_created)
+    
+    return log_files_created
+
+
+### Read a shard manifest, checking all of it before anything is merged, see writeShardManifest().
+###     (manifest_path) Path of a shard manifest.
+###     --> Returns a [Dictionary] of the manifest with Paths, Tuples and Integer keys where they were before
+###                                saving, plus the manifest's 'path' and 'modified_time'
+def readShardManifest(manifest_path):
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+        modified_time = os.fstat(file.fileno()).st_mtime_ns
+    
+    shard_number, shard_count = ( int(number) for number in manifest['shard'] )
+    if not 1 <= shard_number <= shard_count:
+        raise ValueError(f'Not A Shard: {shard_number}/{shard_count}')
+    
+    # JSON keys are always Strings and Tuples are saved as lists.
+    def readImageEdits(edits):
+        edits = { int(edit) : edit_data for edit, edit_data in edits.items() }
+        if MODIFY_IMAGE_SIZE in edits:
+            edits[MODIFY_IMAGE_SIZE] = [ tuple(image_size) for image_size in edits[MODIFY_IMAGE_SIZE] ]
+        return edits
+    
+    return {
+        'path' : manifest_path, 'modified_time' : modified_time, 'shard' : (shard_number, shard_count),
+        'preset' : None if manifest['preset'] == None else int(manifest['preset']), 'description' : str(manifest['description']),
+        'images_found' : int(manifest['images_found']), 'completion_time' : float(manifest['completion_time']),
+        'peak_decoded_pixels' : int(manifest['peak_decoded_pixels']),
+        'games_found' : [ Path(game_path) for game_path in manifest['games_found'] ],
+        'fuzzy_matches' : { Path(image_path) : tuple(fuzzy_match) for image_path, *fuzzy_match in manifest['fuzzy_matches'] },
+        'broken_images' : { Path(image_path) : ( None, str(image_problem) ) for image_path, image_problem in manifest['broken_images'].items() },
+        'saved_images' : [
+            ( saved_image['platform'], saved_image['title'], Path(saved_image['game']), int(saved_image['media']),
+              Path(saved_image['source']), Path(saved_image['output']), saved_image['save_info'], readImageEdits(saved_image['edits']) )
+            for saved_image in manifest['saved_images']
+        ]
+    }
+
+
 ### Create log file for all LaunchBox images found and RetroArch thumbnails created.
 ###     (all_the_data) A Dictionary of all the details on what images to find and how to
 ###                    handle them with logs of everything done so far.
@@ -1655,7 +4411,8 @@ def createLogFile(all_the_data, log_file_path = None):
     log_data = all_the_data.get(LOG_DATA)
     save_msg = { NOT_SAVED   : 'Image File Not Saved (A File With The Same Name Already Exists)',
                  NEW_SAVE    : 'New Image File Created',
-                 OVERWRITTEN : 'Image File Overwritten' }
+                 OVERWRITTEN : 'Image File Overwritten',
+                 RESUMED     : 'Image File Already Saved (In A Previous Run That Didn\'t Finish)' }
     base_arrow = '----> '
     
     if log_data:
@@ -1683,6 +4440,33 @@ def createLogFile(all_the_data, log_file_path = None):
         text_lines.append(f'- Images That Failed Editing*: [ {image_edit_errors} ]')
         text_lines.append('*If an error happens while editing an image, it still keeps it\'s previous edits and can still be saved.')
     
+    if log_data[FUZZY_MATCHES]:
+        text_lines.append(f'- LaunchBox Images Found Using A Similar Title: {len(log_data[FUZZY_MATCHES])}')
+    
+    broken_images = {
+        image_path : image_validation[1] for image_path, image_validation in
+        all_the_data[APP_DATA].get(LAUNCHBOX, {}).get(IMAGE_VALIDATIONS, {}).items() if image_validation[1]
+    }
+    if broken_images:
+        text_lines.append(f'- Broken LaunchBox Images Skipped: {len(broken_images)}')
+    
+    if log_data.get(PEAK_DECODED_PIXELS):
+        text_lines.append(f'- Most Image Pixels Decoded At Once: [ {log_data[PEAK_DECODED_PIXELS] / 1_000_000:.1f} Megapixels ]')
+    
+    if io_read_limit or io_write_limit or io_metadata_limit or low_priority:
+        io_time = max(log_data.get(COMPLETION_TIME, 0), 0.001)
+        (io_read, read_throttled), (io_written, write_throttled), (io_metadata, metadata_throttled) = (
+            io_throttle_stats[IO_READ], io_throttle_stats[IO_WRITE], io_throttle_stats[IO_METADATA] )
+        text_lines.append(f'- Files Read -To- Written: [ {formatFileSize(io_read)} ({formatFileSize(int(io_read / io_time))}/s) -To- '+
+                          f'{formatFileSize(io_written)} ({formatFileSize(int(io_written / io_time))}/s) ]')
+        text_lines.append(f'- Directories Listed And Files Checked: [ {io_metadata} ({io_metadata / io_time:.0f}/s) ]')
+        text_lines.append(f'- Time Spent Waiting On I/O Limits (Read, Write, Checks): [ {read_throttled:.1f}s, {write_throttled:.1f}s, {metadata_throttled:.1f}s ]')
+    
+    source_file_sizes, output_file_sizes, source_decode_time, output_decode_time = getImageSavings(all_the_data)
+    if source_file_sizes:
+        text_lines.append(f'- LaunchBox Image Sizes -To- RetroArch Thumbnail Sizes: [ {formatFileSize(source_file_sizes)} -To- {formatFileSize(output_file_sizes)} ]')
+        text_lines.append(f'- LaunchBox Image Decode Time -To- RetroArch Thumbnail Decode Time: [ {source_decode_time:.2f}s -To- {output_decode_time:.2f}s ]')
+    
     text_lines.append(f'\n- Time To Completion: [ {formated_completion_time} ]')
     
     print_text_lines = text_lines.copy()
@@ -1703,6 +4487,12 @@ def createLogFile(all_the_data, log_file_path = None):
             text_lines.append('\nPreset Used Description:')
             text_lines.append(f'  {desc}')
         
+        if broken_images:
+            text_lines.append('\nBroken LaunchBox Images Skipped:')
+            for image_path, image_problem in broken_images.items():
+                text_lines.append(f'  {image_path}')
+                text_lines.append(f'           {base_arrow}    {image_problem}')
+        
         for platform, game_titles in log_data[SAVED_IMAGE_PATHS].items():
             for game_title, game_paths in game_titles.items():
                 text_lines.append(f'\nGame Title: 	   {game_title}')
@@ -1710,33 +4500,47 @@ def createLogFile(all_the_data, log_file_path = None):
                 for game_path, media_types in game_paths.items():
                     text_lines.append(f'  Game File:  	   {game_path}')
                     
-                    for media, image_save_data in media_types.items():
-                        image_source = image_save_data[IMAGE_SOURCE]
-                        image_output = image_save_data[IMAGE_OUTPUT]
-                        save_info = image_save_data[SAVE_INFO]
-                        
-                        ## TODO: show or don't show game title/files dropped if nothing was saved?
-                        
-                        if type(save_info) != int:
-                            text_lines.append(f'  From LaunchBox:  {image_source}')
-                            text_lines.append(f'    To RetroArch:  ERROR - {save_info}')
-                        elif save_info > NOT_SAVED:
-                            text_lines.append(f'  From LaunchBox:  {image_source}')
-                            text_lines.append(f'    To RetroArch:  {image_output}')
+                    for media, saved_outputs in media_types.items():
+                        for image_save_data in saved_outputs.values():
+                            image_source = image_save_data[IMAGE_SOURCE]
+                            image_output = image_save_data[IMAGE_OUTPUT]
+                            save_info = image_save_data[SAVE_INFO]
                             
-                            #if save_info > NOT_SAVED:
-                            image_edit_error = all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output].get(ERROR)
-                            image_size_edits = all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][image_output].get(MODIFY_IMAGE_SIZE)
-                            if image_edit_error:
-                                text_lines.append(f'           {base_arrow}    {image_edit_error}')
-                            elif image_size_edits and len(image_size_edits) > NEW_IMAGE_SIZE:
-                                org_w = image_size_edits[ORIGINAL_IMAGE_SIZE][WIDTH]
-                                org_h = image_size_edits[ORIGINAL_IMAGE_SIZE][HEIGHT]
-                                new_w = image_size_edits[NEW_IMAGE_SIZE][WIDTH]
-                                new_h = image_size_edits[NEW_IMAGE_SIZE][HEIGHT]
-                                text_lines.append(f'           {base_arrow}    Image Size Changed From: [ {org_w} x {org_h} -To- {new_w} x {new_h} ]')
-                            #text_lines.append(f'           {base_arrow}    Image Rotated: [ {} ]')
-                            text_lines.append(f'           {base_arrow}    Save Details: [ {save_msg[save_info]} ]')
+                            ## TODO: show or don't show game title/files dropped if nothing was saved?
+                            
+                            if type(save_info) != int:
+                                text_lines.append(f'  From LaunchBox:  {image_source}')
+                                text_lines.append(f'    To RetroArch:  ERROR - {save_info}')
+                            elif save_info > NOT_SAVED:
+                                text_lines.append(f'  From LaunchBox:  {image_source}')
+                                text_lines.append(f'    To RetroArch:  {image_output}')
+                                
+                                fuzzy_match = log_data[FUZZY_MATCHES].get(image_source)
+                                if fuzzy_match:
+                                    text_lines.append(f'           {base_arrow}    Similar Title Used: [ {fuzzy_match[1]} ({fuzzy_match[2]:.0%}) ]')
+                                
+                                #if save_info > NOT_SAVED:
+                                image_edit_log = getImageEditLog(all_the_data, platform, game_title, game_path, media, image_output)
+                                image_edit_error = image_edit_log.get(ERROR)
+                                image_size_edits = image_edit_log.get(MODIFY_IMAGE_SIZE)
+                                if image_edit_error:
+                                    text_lines.append(f'           {base_arrow}    {image_edit_error}')
+                                elif image_size_edits and len(image_size_edits) > NEW_IMAGE_SIZE:
+                                    org_w = image_size_edits[ORIGINAL_IMAGE_SIZE][WIDTH]
+                                    org_h = image_size_edits[ORIGINAL_IMAGE_SIZE][HEIGHT]
+                                    new_w = image_size_edits[NEW_IMAGE_SIZE][WIDTH]
+                                    new_h = image_size_edits[NEW_IMAGE_SIZE][HEIGHT]
+                                    text_lines.append(f'           {base_arrow}    Image Size Changed From: [ {org_w} x {org_h} -To- {new_w} x {new_h} ]')
+                                if image_edit_log.get(COLOR_REDUCTION):
+                                    text_lines.append(f'           {base_arrow}    Image Colors Reduced To: [ {image_edit_log[COLOR_REDUCTION]} ]')
+                                if image_edit_log.get(FILE_SIZE):
+                                    org_size = formatFileSize(image_edit_log[FILE_SIZE][0])
+                                    new_size = formatFileSize(image_edit_log[FILE_SIZE][1])
+                                    org_time = image_edit_log[DECODE_TIME][0] * 1000 if image_edit_log.get(DECODE_TIME) else 0
+                                    new_time = image_edit_log[DECODE_TIME][1] * 1000 if image_edit_log.get(DECODE_TIME) else 0
+                                    text_lines.append(f'           {base_arrow}    File Size (Decode Time) Changed From: [ {org_size} ({org_time:.1f}ms) -To- {new_size} ({new_time:.1f}ms) ]')
+                                #text_lines.append(f'           {base_arrow}    Image Rotated: [ {} ]')
+                                text_lines.append(f'           {base_arrow}    Save Details: [ {save_msg[save_info]} ]')
         
         try: # Write Log File
             log_file_path.write_text('\n'.join(text_lines), encoding='utf-8', errors='strict')
@@ -1763,7 +4567,7 @@ def getLogNumbers(all_the_data):
     image_files_saved = 0
     image_file_dupes = 0
     image_save_errors = 0
-    image_source_paths = []
+    image_source_paths = set()
     
     # Time Formating
     completion_time = round(completion_time, 1)
@@ -1774,31 +4578,125 @@ def getLogNumbers(all_the_data):
     else:
         time_format = '%S.%f'
     #if debug: print(completion_time)
-    formated_completion_time = datetime.fromtimestamp(completion_time).strftime(time_format)[:-5].rstrip('.0')
+    formated_completion_time = datetime.fromtimestamp(completion_time).strftime(time_format)[:-5].rstrip('0').rstrip('.')
     if formated_completion_time[0] == '0':
         formated_completion_time = formated_completion_time[1:]
     
     for platform, games in all_the_data[LOG_DATA][SAVED_IMAGE_PATHS].items():
         for game_title, game_paths in games.items():
             for game_path, media_types in game_paths.items():
-                for media, save_data in media_types.items():
-                    
-                    if (pillow_installed and save_data[SAVE_INFO] != NOT_SAVED and
-                        all_the_data[LOG_DATA][IMAGE_EDITS][platform][game_title][game_path][media][save_data[IMAGE_OUTPUT]].get(ERROR)):
-                            image_edit_errors += 1
-                    if type(save_data[SAVE_INFO]) == int and save_data[SAVE_INFO] > NOT_SAVED:
-                        image_files_saved += 1
-                        if save_data[IMAGE_SOURCE] in image_source_paths:
-                            image_file_dupes += 1
-                        else:
-                            image_source_paths.append(save_data[IMAGE_SOURCE])
-                    elif type(save_data[SAVE_INFO]) != int:
-                        image_save_errors += 1
+                for media, saved_outputs in media_types.items():
+                    for save_data in saved_outputs.values():
+                        
+                        if (pillow_installed and save_data[SAVE_INFO] != NOT_SAVED and
+                            getImageEditLog(all_the_data, platform, game_title, game_path, media, save_data[IMAGE_OUTPUT]).get(ERROR)):
+                                image_edit_errors += 1
+                        if type(save_data[SAVE_INFO]) == int and save_data[SAVE_INFO] > NOT_SAVED:
+                            image_files_saved += 1
+                            # Only a dupe if used more than once in the same thumbnails directory (output target).
+                            # Output Path: [Thumbnails Root]/[Playlist]/[Named_Type]/[Game].png
+                            image_source_in_target = (save_data[IMAGE_SOURCE], save_data[IMAGE_OUTPUT].parents[2])
+                            if image_source_in_target in image_source_paths:
+                                image_file_dupes += 1
+                            else:
+                                image_source_paths.add(image_source_in_target)
+                        elif type(save_data[SAVE_INFO]) != int:
+                            image_save_errors += 1
     
     return (formated_completion_time, launchbox_images_found, games_found_in_lb_ra,
             image_edit_errors, image_files_saved, image_file_dupes, image_save_errors)
 
 
+### Get the total file sizes and decode times of the LaunchBox images and the RetroArch thumbnails
+### created from them. Only images saved with color reduction or stripped metadata are compared.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     --> Returns a [Integer] x 2 and [Float] x 2
+def getImageSavings(all_the_data):
+    source_file_sizes = output_file_sizes = 0
+    source_decode_time = output_decode_time = 0
+    
+    for platform, games in all_the_data[LOG_DATA][IMAGE_EDITS].items():
+        for game_title, game_paths in games.items():
+            for game_path, media_types in game_paths.items():
+                for media, image_edit_logs in media_types.items():
+                    for image_edit_log in image_edit_logs.values():
+                        if image_edit_log.get(FILE_SIZE):
+                            source_file_sizes += image_edit_log[FILE_SIZE][0]
+                            output_file_sizes += image_edit_log[FILE_SIZE][1]
+                        if image_edit_log.get(DECODE_TIME):
+                            source_decode_time += image_edit_log[DECODE_TIME][0]
+                            output_decode_time += image_edit_log[DECODE_TIME][1]
+    
+    return source_file_sizes, output_file_sizes, source_decode_time, output_decode_time
+
+
+### Create a log file of all the problems found while verifying RetroArch thumbnails.
+###     (all_the_data) A Dictionary of all the details on what images to find and how to
+###                    handle them with logs of everything done so far.
+###     (audit_results) The problems found, see verifyRetroArchThumbnails().
+###     (log_file_path) Path of a log file.
+###     --> Returns a [Boolean] or the [Path] of the log file created
+def createVerifyLogFile(all_the_data, audit_results, log_file_path = None):
+    log_file_created = False
+    audit_problem_titles = { MISSING_THUMBNAIL    : 'Missing RetroArch Thumbnails',
+                             WRONG_SIZE_THUMBNAIL : 'RetroArch Thumbnails With The Wrong Size',
+                             STALE_THUMBNAIL      : 'RetroArch Thumbnails Older Than Their LaunchBox Image',
+                             UNEXPECTED_THUMBNAIL : 'Unexpected RetroArch Thumbnails' }
+    base_arrow = '----> '
+    
+    text_lines = []
+    text_lines.append('=================================')
+    text_lines.append('= RetroArch Thumbnails Verified =')
+    text_lines.append('=================================')
+    text_lines.append(f'- Game Files Found in Both LaunchBox and RetroArch: {len(all_the_data[LOG_DATA][GAME_PATHS_IN_LB_RA])}')
+    for audit_problem, audit_problem_title in audit_problem_titles.items():
+        text_lines.append(f'- {audit_problem_title}: {len(audit_results[audit_problem])}')
+    
+    print('\n'+'\n'.join(text_lines))
+    
+    if not any(audit_results.values()):
+        print('All RetroArch thumbnails match.')
+        return False
+    
+    if create_log_file:
+        
+        if not log_file_path:
+            log_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__verify.txt'))
+        
+        desc = all_the_data.get(DESCRIPTION)
+        if desc and desc != '':
+            text_lines.append('\nPreset Used Description:')
+            text_lines.append(f'  {desc}')
+        
+        for audit_problem, audit_problem_title in audit_problem_titles.items():
+            if audit_results[audit_problem]:
+                text_lines.append(f'\n{audit_problem_title}:')
+                for image_output_path, details in audit_results[audit_problem]:
+                    text_lines.append(f'  {image_output_path}')
+                    text_lines.append(f'           {base_arrow}    {details}')
+        
+        try: # Write Log File
+            log_file_path.write_text('\n'.join(text_lines), encoding='utf-8', errors='strict')
+            log_file_created = log_file_path # return log file path
+        except (OSError, UnicodeError, ValueError) as error:
+            print(f'\nCouldn\'t save log file due to a {type(error).__name__}: {type(error).__doc__}')
+            print(f'{error}\n')
+    
+    return log_file_created
+
+
+### Format a file size in bytes to a readable string.
+###     (file_size) Number of bytes.
+###     --> Returns a [String]
+def formatFileSize(file_size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if file_size < 1024 or unit == 'GB':
+            break
+        file_size /= 1024
+    return f'{file_size:.1f} {unit}' if unit != 'B' else f'{file_size} {unit}'
+
+
 ### Open a log file for viewing.
 ###     (log_file_path) Path to a log file.
 ###     --> Returns a [None]
@@ -1819,49 +4717,108 @@ if __name__ == '__main__':
     MIN_VERSION_STR = '.'.join([str(n) for n in MIN_VERSION])
     assert sys.version_info >= MIN_VERSION, f'This Script Requires Python v{MIN_VERSION_STR} or Newer'
     
+    if low_priority and setLowPriority():
+        print('[Running At Low Priority]')
+    
     paths = sys.argv[1:]
+    run_daemon = '--daemon' in paths
+    stop_daemon = '--stop-daemon' in paths
+    verify_thumbnails = '--verify' in paths
+    paths = [path for path in paths if path not in ('--daemon', '--stop-daemon', '--verify')]
+    
+    # Merge the manifests left by each shard into a single log: "--merge-shards [Manifest Files]"
+    if '--merge-shards' in paths:
+        manifest_paths = [ Path(path) for path in paths if path != '--merge-shards' ]
+        if not manifest_paths:
+            manifest_paths = sorted(ROOT_DIR.glob(f'{Path(__file__).stem}__shard*of*.json'))
+        log_files_created = mergeShardManifests(manifest_paths)
+        for log_file_created in log_files_created:
+            print('--> Check log for more details.')
+            openLogFile(log_file_created)
+        if not manifest_paths:
+            print('No shard manifests found.')
+        sys.exit()
+    
+    # Split a game library between scripts running at the same time: "--shard 1/4", "--shard 2/4", etc.
+    if '--shard' in paths:
+        shard_index = paths.index('--shard')
+        shard = parseShard(paths[shard_index + 1] if shard_index + 1 < len(paths) else None)
+        if not shard:
+            print('ERROR: A shard must be written as "--shard i/n" where i is from 1 to n.')
+            sys.exit()
+        del paths[shard_index:shard_index + 2]
+        print(f'Running Shard: {shard[0]}/{shard[1]}')
+    
     if not paths:
         paths = [ROOT_DIR]
     
+    if stop_daemon:
+        if not forwardToDaemon(None):
+            print('No daemon running.')
+        sys.exit()
+    
+    if use_daemon and not run_daemon and not shard and not verify_thumbnails and forwardToDaemon(paths):
+        if loop_script:
+            input('\nPress [Enter] to close...')
+        sys.exit()
+    
     print('---------------------------------')
     if debug: print('[Debug Mode On]')
-    all_the_data = changePreset(preset_options[selected_preset])
+    selected_presets = makeList(selected_preset)
+    all_the_data = changePreset(preset_options[selected_presets[0]])
     if all_the_data:
         all_the_data = getLaunchBoxRetroArchData(all_the_data)
+    if all_the_data and len(selected_presets) > 1:
+        print(f'Running Presets: {", ".join(str(preset) for preset in selected_presets)}')
+        all_the_data = addPresetRuns(all_the_data, [preset_options[preset] for preset in selected_presets[1:]])
     print('---------------------------------')
     
     loop = True if all_the_data else False
     
+    if run_daemon and all_the_data and not shard and not verify_thumbnails:
+        all_the_data = runDaemon(all_the_data)
+        loop = False
+    
     while loop:
         
-        for path in paths:
-            all_the_data = findLaunchBoxGameImages(path, all_the_data)
+        if stream_thumbnails and not verify_thumbnails:
+            all_the_data = streamRetroArchThumbnails(paths, all_the_data)
+            closeArchiveExports(all_the_data)
+        else:
+            for path in paths:
+                all_the_data = findLaunchBoxGameImages(path, all_the_data)
         
         print('\n---------------------------------')
-        launchbox_images_found = all_the_data[LOG_DATA][IMAGES_FOUND]
+        launchbox_images_found = sum(preset_run[LOG_DATA][IMAGES_FOUND] for preset_run in getPresetRuns(all_the_data))
         print(f'LaunchBox Images Found: {launchbox_images_found}')
         if debug:
             completion_time = all_the_data[LOG_DATA].get(COMPLETION_TIME, 0)
             print(f'Time To Completion: {completion_time}')
         
-        if launchbox_images_found:
-            input(f'Start Creating RetroArch Thumbnails? [Enter]')
-            all_the_data = createRetroArchImagePaths(all_the_data)
-            #all_the_data = createAllRetroArchThumbnailImages(all_the_data)
+        if launchbox_images_found and verify_thumbnails:
+            for preset_number, preset_run in zip(selected_presets, getPresetRuns(all_the_data)):
+                log_file_path = None
+                if preset_run is not all_the_data: # One log file per preset
+                    log_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__verify_preset{preset_number}.txt'))
+                log_file_created = createVerifyLogFile(preset_run, verifyRetroArchThumbnails(preset_run), log_file_path)
+                if log_file_created:
+                    print('--> Check log for more details.')
+                    openLogFile(log_file_created)
         
-        (formated_completion_time, launchbox_images_found, games_found_in_lb_ra,
-         image_edit_errors, image_files_saved, image_file_dupes, image_save_errors) = getLogNumbers(all_the_data)
+        elif launchbox_images_found and not stream_thumbnails:
+            if not shard: # Shards may be running unattended.
+                input(f'Start Creating RetroArch Thumbnails? [Enter]')
+            for preset_run in getPresetRuns(all_the_data):
+                createRetroArchImagePaths(preset_run)
+            closeArchiveExports(all_the_data)
+            #all_the_data = createAllRetroArchThumbnailImages(all_the_data)
         
-        print(f'\nAmount of Game Files Found in Both LaunchBox and RetroArch: {games_found_in_lb_ra}')
-        print(f'Total Usable LaunchBox Images Found: {launchbox_images_found}')
-        print(f'Amount of RetroArch Images Saved (Duplicates): {image_files_saved} ({image_file_dupes})')
-        print(f'Images Not Saved Due To Errors: {image_save_errors}')
-        print(f'Images That Failed Editing*: {image_edit_errors}')
-        print('*If an error happens while editing an image, it still keeps it\'s previous edits and can still be saved.')
-        print(f'\nTime To Completion: {formated_completion_time}')
+        if not verify_thumbnails:
+            for preset_run in getPresetRuns(all_the_data):
+                printRunSummary(preset_run)
         
-        try_again = loop_script
-        loop = loop_script
+        try_again = loop_script and not shard
+        loop = try_again
         while try_again:
             drop = input('\nDrop another Game file or directory here or leave blank and press [Enter] to create a log file now: ')
             drop = drop.replace('"', '')
@@ -1872,16 +4829,36 @@ if __name__ == '__main__':
             elif path.exists():
                 paths = [path]
                 try_again = False
+                # Pick up any LaunchBox or RetroArch changes made since the last drop.
+                all_the_data = loadLaunchBoxRetroArchFiles(all_the_data)
+                resetResumeJournal(all_the_data) # The last drop finished.
             else:
                 print(f'This is not an existing file or directory path: "{drop}"')
     
-    if create_log_file and all_the_data:
-        log_file_created = createLogFile(all_the_data)
-        if log_file_created:
-            print('--> Check log for more details.')
-            openLogFile(log_file_created)
-        else:
-            print('No log file necessary.')
+    if all_the_data and not verify_thumbnails:
+        closeResumeJournal(all_the_data)
+    
+    if verify_thumbnails and all_the_data:
+        print('\nNo thumbnails created, only verified.')
+    elif shard and all_the_data:
+        for preset_number, preset_run in zip(selected_presets, getPresetRuns(all_the_data)):
+            preset_suffix = f'_preset{preset_number}' if preset_run is not all_the_data else ''
+            shard_name = f'shard{shard[0]}of{shard[1]}{preset_suffix}'
+            writeShardManifest(preset_run, Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__{shard_name}.json')), preset_number)
+            if create_log_file:
+                createLogFile(preset_run, Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__log_{shard_name}.txt')))
+        print('\nMerge all shards into one log file when they are done using: --merge-shards')
+    elif create_log_file and all_the_data:
+        for preset_number, preset_run in zip(selected_presets, getPresetRuns(all_the_data)):
+            log_file_path = None
+            if preset_run is not all_the_data: # One log file per preset
+                log_file_path = Path(PurePath().joinpath(ROOT_DIR, f'{Path(__file__).stem}__log_preset{preset_number}.txt'))
+            log_file_created = createLogFile(preset_run, log_file_path)
+            if log_file_created:
+                print('--> Check log for more details.')
+                openLogFile(log_file_created)
+            else:
+                print('No log file necessary.')
     elif all_the_data:
         print('Log file creation turned off.')
 
@@ -0,0 +1,259 @@
+# Time the script on a synthetic LaunchBox and RetroArch install, and check that the thumbnails it
+# creates are the same as the ones created by another revision of it.
+#
+#   python tests/benchmark.py drop --before <git revision>
+#   python tests/benchmark.py alternates --variants 500 --before <git revision>
+#   python tests/benchmark.py xml --platforms 48 --platform-games 4000
+#   python tests/benchmark.py startup --before <git revision> [--cold-cache]
+#   python tests/benchmark.py stream --before <git revision>
+#   python tests/benchmark.py drop --before <git revision> --setting save_durability=1 --setting io_write_limit=20_000_000
+
+import argparse
+import ast
+from contextlib import contextmanager, redirect_stdout
+from io import StringIO
+import os
+from pathlib import Path
+import sys
+import tempfile
+from time import perf_counter as Timer
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_library import addPlatforms, buildLibrary, clearThumbnails, hashThumbnails, loadScript, startScript
+
+
+### Drop the library's game files on a script, timing the search and the thumbnail creation apart.
+###     (script) The script module, see loadScript().
+###     (library) A Library.
+###     (preset_number) The preset to use.
+###     --> Returns a [Tuple] (Search Seconds, Create Seconds, Seconds To The First Thumbnail, { Thumbnail : Hash })
+def timeDrop(script, library, preset_number = 1):
+    clearThumbnails(library)
+    all_the_data = startScript(script, library, preset_number)
+    with redirect_stdout(StringIO()), watchFirstThumbnail(script) as first_thumbnail_times:
+        start_time = Timer()
+        all_the_data = script.findLaunchBoxGameImages(library.games, all_the_data)
+        search_time = Timer() - start_time
+        create_start_time = Timer()
+        all_the_data = script.createRetroArchImagePaths(all_the_data)
+        if hasattr(script, 'closeArchiveExports'):
+            script.closeArchiveExports(all_the_data)
+        create_time = Timer() - create_start_time
+    return search_time, create_time, first_thumbnail_times[0] - start_time, hashThumbnails(library)
+
+
+### Drop the library's game files on a script in stream mode, creating thumbnails while still searching.
+###     (script) The script module, see loadScript().
+###     (library) A Library.
+###     (preset_number) The preset to use.
+###     --> Returns a [Tuple] (Seconds, Seconds To The First Thumbnail, { Thumbnail : Hash })
+def timeStreamDrop(script, library, preset_number = 1):
+    clearThumbnails(library)
+    all_the_data = startScript(script, library, preset_number)
+    with redirect_stdout(StringIO()), watchFirstThumbnail(script) as first_thumbnail_times:
+        start_time = Timer()
+        all_the_data = script.streamRetroArchThumbnails([library.games], all_the_data)
+        script.closeArchiveExports(all_the_data)
+        stream_time = Timer() - start_time
+    return stream_time, first_thumbnail_times[0] - start_time, hashThumbnails(library)
+
+
+### Note the time the first thumbnail is saved, while in this context. Revisions older than
+### recordSavedThumbnail() only note the time the context ends.
+###     (script) The script module, see loadScript().
+###     --> Returns a [List] the time the first thumbnail was saved is added to
+@contextmanager
+def watchFirstThumbnail(script):
+    first_thumbnail_times = []
+    record_saved_thumbnail = getattr(script, 'recordSavedThumbnail', None)
+    def recordSavedThumbnail(*args, **kwargs):
+        if not first_thumbnail_times:
+            first_thumbnail_times.append(Timer())
+        return record_saved_thumbnail(*args, **kwargs)
+    if record_saved_thumbnail:
+        script.recordSavedThumbnail = recordSavedThumbnail
+    try:
+        yield first_thumbnail_times
+    finally:
+        if record_saved_thumbnail:
+            script.recordSavedThumbnail = record_saved_thumbnail
+        if not first_thumbnail_times:
+            first_thumbnail_times.append(Timer())
+
+
+### Time each revision of the script on the same library, in batch mode (searching, then creating) and in
+### stream mode (both at the same time), best of a few runs, and compare their thumbnails. Stream mode is
+### meant to save the first thumbnail sooner, not to finish sooner.
+###     (library) A Library.
+###     (revisions) A Dictionary { Name : git revision or None for the working tree }.
+###     (repeat) How many times to run each revision in each mode.
+###     (settings) A Dictionary of the script's settings to change, by name.
+###     --> Returns a [Boolean] True if every revision in both modes created the same thumbnails
+def compareStreaming(library, revisions, repeat = 3, settings = {}):
+    all_thumbnails = []
+    for name, revision in revisions.items():
+        script = loadScript(revision, { 'resume_journal' : False, **settings })
+        # Taking turns, so anything else slowing the computer down slows both modes down the same.
+        batch_runs = []
+        stream_runs = []
+        for run in range(repeat):
+            batch_runs.append(timeDrop(script, library))
+            stream_runs.append(timeStreamDrop(script, library))
+        batch_time = min(run[0] + run[1] for run in batch_runs)
+        stream_time = min(run[0] for run in stream_runs)
+        batch_first_time = min(run[2] for run in batch_runs)
+        stream_first_time = min(run[1] for run in stream_runs)
+        all_thumbnails += [batch_runs[0][3], stream_runs[0][2]]
+        print(f'{name:>8}: batch {batch_time:.3f} s (first thumbnail {batch_first_time:.3f} s), '+
+              f'stream {stream_time:.3f} s (first thumbnail {stream_first_time:.3f} s), {len(stream_runs[0][2])} thumbnails')
+
+    same_thumbnails = all(thumbnails == all_thumbnails[0] for thumbnails in all_thumbnails)
+    print('Same thumbnails created.' if same_thumbnails else 'Thumbnails differ!')
+    return same_thumbnails
+
+
+### Time each revision of the script on the same library (best of a few runs) and compare their thumbnails.
+###     (library) A Library.
+###     (revisions) A Dictionary { Name : git revision or None for the working tree }.
+###     (repeat) How many times to run each revision.
+###     (preset_number) The preset to use.
+###     (settings) A Dictionary of the script's settings to change, by name.
+###     --> Returns a [Boolean] True if every revision created the same thumbnails
+def compareRevisions(library, revisions, repeat = 3, preset_number = 1, settings = {}):
+    results = {}
+    for name, revision in revisions.items():
+        script = loadScript(revision, { 'resume_journal' : False, **settings })
+        runs = [timeDrop(script, library, preset_number) for run in range(repeat)]
+        search_time = min(run[0] for run in runs)
+        create_time = min(run[1] for run in runs)
+        results[name] = runs[0][3]
+        print(f'{name:>8}: search {search_time:.3f} s, create {create_time:.3f} s, {len(runs[0][3])} thumbnails')
+
+    first_name, first_thumbnails = next(iter(results.items()))
+    same_thumbnails = True
+    for name, thumbnails in results.items():
+        if thumbnails != first_thumbnails:
+            same_thumbnails = False
+            different = sorted(set(thumbnails.items()) ^ set(first_thumbnails.items()))
+            print(f'{name} thumbnails differ from {first_name}: {len(different)} differences, first: {different[0][0]}')
+    if same_thumbnails and len(results) > 1:
+        print('Same thumbnails created.')
+    return same_thumbnails
+
+
+### Time reading every platform XML file with lxml and with Python's own XML parser (best of a few
+### runs) and compare the records read.
+###     (library) A Library.
+###     (repeat) How many times to read them with each parser.
+###     --> Returns a [Boolean] True if both parsers read the same records
+def compareXMLParsers(library, repeat = 3):
+    script = loadScript(None, { 'resume_journal' : False })
+    xml_paths = sorted(library.platforms_dir.glob('*.xml'))
+    results = {}
+    for parser_name, lxml_installed in { 'lxml' : True, 'stdlib' : False }.items():
+        script.lxml_installed = lxml_installed
+        read_times = []
+        for run in range(repeat):
+            start_time = Timer()
+            records = [script.readLaunchBoxXML(xml_path, ['Game', 'AdditionalApplication']) for xml_path in xml_paths]
+            read_times.append(Timer() - start_time)
+        results[parser_name] = records
+        print(f'{parser_name:>8}: {min(read_times):.3f} s, {len(xml_paths)} files, {sum(len(record["Game"]) for record in records)} games')
+
+    same_records = results['lxml'] == results['stdlib']
+    print('Same records read.' if same_records else 'Records differ!')
+    return same_records
+
+
+### Empty the operating system's file cache, so files have to be read from the disk again (Linux only,
+### and only as root).
+###     --> Returns a [None]
+def dropFileCache():
+    os.sync()
+    Path('/proc/sys/vm/drop_caches').write_text('3\n')
+    return None
+
+
+### Time the start of each revision of the script, reading all the LaunchBox and RetroArch files (best
+### of a few runs), and compare the games found.
+###     (library) A Library.
+###     (revisions) A Dictionary { Name : git revision or None for the working tree }.
+###     (repeat) How many times to start each revision.
+###     (cold_cache) Empty the file cache before every start.
+###     --> Returns a [Boolean] True if every revision found the same games
+def compareStartup(library, revisions, repeat = 3, cold_cache = False):
+    results = {}
+    for name, revision in revisions.items():
+        script = loadScript(revision, { 'resume_journal' : False })
+        start_times = []
+        for run in range(repeat):
+            if cold_cache:
+                dropFileCache()
+            start_time = Timer()
+            all_the_data = startScript(script, library)
+            start_times.append(Timer() - start_time)
+        launchbox_data = all_the_data[script.APP_DATA][script.LAUNCHBOX]
+        results[name] = (launchbox_data[script.GAMES_BY_PATH], launchbox_data[script.ADDITIONAL_APPS_BY_PATH])
+        print(f'{name:>8}: {min(start_times):.3f} s, {len(results[name][0])} games')
+
+    same_games = all(games == next(iter(results.values())) for games in results.values())
+    print('Same games found.' if same_games else 'Games found differ!')
+    return same_games
+
+
+### Get the revisions of the script to compare, from the command line arguments.
+###     (arguments) The parsed command line arguments.
+###     --> Returns a [Dictionary] { Name : git revision or None for the working tree }
+def getRevisions(arguments):
+    revisions = {}
+    if arguments.before:
+        revisions['before'] = arguments.before
+    revisions['after'] = arguments.after
+    return revisions
+
+
+### Get the script settings to change, from the command line arguments.
+###     (arguments) The parsed command line arguments.
+###     --> Returns a [Dictionary] { Setting Name : Value }
+def getSettings(arguments):
+    settings = {}
+    for setting in arguments.setting:
+        name, value = setting.split('=', 1)
+        settings[name.strip()] = ast.literal_eval(value.strip())
+    return settings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('benchmark', choices=['drop', 'alternates', 'xml', 'startup', 'stream'])
+    parser.add_argument('--before', help='git revision to compare with')
+    parser.add_argument('--after', help='git revision to compare, instead of the working tree')
+    parser.add_argument('--games', type=int, default=50, help='games in the "drop" and "stream" libraries')
+    parser.add_argument('--variants', type=int, default=500, help='game files of the one title in the "alternates" library')
+    parser.add_argument('--platforms', type=int, default=48, help='platforms in the "xml" and "startup" libraries')
+    parser.add_argument('--platform-games', type=int, default=4000, help='games of each platform in the "xml" and "startup" libraries')
+    parser.add_argument('--cold-cache', action='store_true', help='empty the file cache before every "startup" run (Linux, as root)')
+    parser.add_argument('--setting', action='append', default=[], help='a script setting to change, "name=value" (drop, alternates and stream)')
+    parser.add_argument('--repeat', type=int, default=3)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='lb_benchmark_') as root:
+        if arguments.benchmark in ('drop', 'stream'):
+            library = buildLibrary(root, titles=arguments.games)
+        elif arguments.benchmark == 'alternates':
+            # One title with many discs, versions and hacks, all using alternate images.
+            library = buildLibrary(root, titles=['Tetris'], files_per_game=arguments.variants, images_per_region=8)
+        elif arguments.benchmark in ('xml', 'startup'):
+            library = buildLibrary(root)
+            addPlatforms(library, arguments.platforms, arguments.platform_games)
+        print(f'Library: {root}')
+        if arguments.benchmark == 'xml':
+            same_results = compareXMLParsers(library, arguments.repeat)
+        elif arguments.benchmark == 'startup':
+            same_results = compareStartup(library, getRevisions(arguments), arguments.repeat, arguments.cold_cache)
+        elif arguments.benchmark == 'stream':
+            same_results = compareStreaming(library, getRevisions(arguments), arguments.repeat, getSettings(arguments))
+        else:
+            same_results = compareRevisions(library, getRevisions(arguments), arguments.repeat, settings=getSettings(arguments))
+
+    sys.exit(0 if same_results else 1)
@@ -0,0 +1,17 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_library import buildLibrary, loadScript
+
+
+@pytest.fixture
+def script():
+    return loadScript()
+
+
+@pytest.fixture
+def library(tmp_path):
+    return buildLibrary(tmp_path / 'library')
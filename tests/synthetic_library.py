@@ -0,0 +1,236 @@
+# Build a synthetic LaunchBox and RetroArch install and run the script against it, for the tests and
+# benchmarks in this directory. Nothing here touches a real LaunchBox or RetroArch install.
+
+from contextlib import redirect_stdout
+from hashlib import sha1
+from io import StringIO
+import importlib.util
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+
+from PIL import Image
+
+REPO_DIR = Path(__file__).parent.parent
+SCRIPT_NAME = 'launchbox_to_retroarch_images.py'
+PLAYLIST_NAME = 'Sega - Mega Drive - Genesis.lpl'
+PLATFORM = 'Sega Genesis'
+MEDIA_TYPES = ['Box - Front', 'Box - Back', 'Screenshot - Game Title', 'Screenshot - Gameplay']
+IMAGE_REGIONS = ['', 'North America', 'Europe']
+
+# The script imports "startfile" from os, which only exists on Windows.
+if not hasattr(os, 'startfile'):
+    os.startfile = lambda path: None
+
+
+### A synthetic install: LaunchBox, RetroArch and a directory of game files, all under one root.
+class Library:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.launchbox = self.root / 'LaunchBox'
+        self.retroarch = self.root / 'RetroArch'
+        self.games = self.root / 'games'
+        self.thumbnails = self.retroarch / 'thumbnails'
+        self.platforms_dir = self.launchbox / 'Data' / 'Platforms'
+        self.playlists_dir = self.retroarch / 'playlists'
+
+
+### Build a synthetic install with one platform, its games, game files and images.
+###     (root) Directory to build it in, deleted first if it exists.
+###     (titles) A list of game titles, or a number of "Game #: Quest" titles.
+###     (files_per_game) How many game files (discs) each game has.
+###     (images_per_region) How many images each game has in each media type and region.
+###     (game_ids) A list of LaunchBox IDs, one per title, or None for "id-#" IDs.
+###     --> Returns a [Library]
+def buildLibrary(root, titles = 3, files_per_game = 2, images_per_region = 2, game_ids = None):
+    library = Library(root)
+    if library.root.exists():
+        shutil.rmtree(library.root)
+    library.platforms_dir.mkdir(parents=True)
+    library.playlists_dir.mkdir(parents=True)
+    library.thumbnails.mkdir(parents=True)
+    library.games.mkdir(parents=True)
+    (library.launchbox / 'LaunchBox.exe').write_text('')
+    (library.retroarch / 'RetroArch.exe').write_text('')
+    (library.retroarch / 'retroarch.cfg').write_text(
+        'playlist_directory = ":\\playlists"\nthumbnails_directory = ":\\thumbnails"\n'+
+        'menu_driver = "ozone"\nvideo_fullscreen_x = "1280"\nvideo_fullscreen_y = "720"\n'
+    )
+
+    platform_folders = [
+        f'<PlatformFolder><MediaType>{media_type}</MediaType><FolderPath>{library.launchbox / "Images" / PLATFORM / media_type}'+
+        f'</FolderPath><Platform>{PLATFORM}</Platform></PlatformFolder>'
+        for media_type in MEDIA_TYPES
+    ]
+    writeXML(library.launchbox / 'Data' / 'Platforms.xml', platform_folders)
+
+    if isinstance(titles, int):
+        titles = [f'Game {number}: Quest' for number in range(titles)]
+    if not game_ids:
+        game_ids = [f'id-{number}' for number in range(len(titles))]
+
+    game_records = []
+    playlist_items = []
+    images_made = set()
+    for number, (title, game_id) in enumerate(zip(titles, game_ids)):
+        game_paths = []
+        for file_number in range(files_per_game):
+            game_path = library.games / f'{title.replace(":", " -")} [{number}] (USA) (Disc {file_number + 1}).cue'
+            game_path.write_text('x')
+            game_paths.append(game_path)
+            playlist_items.append({
+                'path' : str(game_path), 'label' : f'{title} [{number}] (USA) (Disc {file_number + 1})', 'db_name' : PLAYLIST_NAME
+            })
+        game_records.append(
+            f'<Game><ApplicationPath>{game_paths[0]}</ApplicationPath><ID>{game_id}</ID><Platform>{PLATFORM}</Platform>'+
+            f'<Title>{title}</Title><Region>North America</Region></Game>'
+        )
+        for game_path in game_paths[1:]:
+            game_records.append(
+                f'<AdditionalApplication><ApplicationPath>{game_path}</ApplicationPath><GameID>{game_id}</GameID>'+
+                '<Region /></AdditionalApplication>'
+            )
+
+        # Games with the same title share their images, like in LaunchBox.
+        image_title = title.replace(':', '_')
+        if image_title in images_made:
+            continue
+        images_made.add(image_title)
+        for media_type in MEDIA_TYPES:
+            for region in IMAGE_REGIONS:
+                image_dir = library.launchbox / 'Images' / PLATFORM / media_type / region
+                image_dir.mkdir(parents=True, exist_ok=True)
+                for image_number in range(1, images_per_region + 1):
+                    extension = '.png' if image_number % 2 else '.jpg'
+                    saveImage(image_dir / f'{image_title}-{image_number:02}{extension}', (400 + number % 100, 600), number * 40 + image_number)
+
+    writeXML(library.platforms_dir / f'{PLATFORM}.xml', game_records)
+    (library.playlists_dir / PLAYLIST_NAME).write_text(json.dumps({ 'version' : '1.5', 'items' : playlist_items }))
+    return library
+
+
+### Add more platforms, each with a platform XML and a playlist of games (without images).
+###     (library) A Library to add to.
+###     (platform_count) How many platforms to add.
+###     (game_count) How many games each platform has.
+###     --> Returns a [None]
+def addPlatforms(library, platform_count, game_count):
+    for platform_number in range(platform_count):
+        platform = f'Platform {platform_number}'
+        game_records = []
+        playlist_items = []
+        for number in range(game_count):
+            game_path = library.games / platform / f'Game {number} (USA).zip'
+            game_records.append(
+                f'<Game><ApplicationPath>{game_path}</ApplicationPath><ID>{platform_number:08}-0000-0000-0000-{number:012}</ID>'+
+                f'<Platform>{platform}</Platform><Title>Game {number}</Title><Region>North America</Region>'+
+                '<Notes>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</Notes><Developer>Someone</Developer></Game>'
+            )
+            playlist_items.append({ 'path' : str(game_path), 'label' : f'Game {number} (USA)', 'db_name' : f'{platform}.lpl' })
+        writeXML(library.platforms_dir / f'{platform}.xml', game_records)
+        (library.playlists_dir / f'{platform}.lpl').write_text(json.dumps({ 'version' : '1.5', 'items' : playlist_items }))
+    return None
+
+
+### Write a LaunchBox XML file.
+###     (xml_path) Path of the file.
+###     (records) A list of XML records, as text.
+###     --> Returns a [None]
+def writeXML(xml_path, records):
+    xml_path.write_text('\n'.join(['<?xml version="1.0" standalone="yes"?>', '<LaunchBox>'] + records + ['</LaunchBox>']), encoding='utf-8')
+    return None
+
+
+### Save a solid color image, different for every seed.
+###     (image_path) Path of the image.
+###     (size) Image width and height.
+###     (seed) A number to pick the color with.
+###     --> Returns a [None]
+def saveImage(image_path, size, seed):
+    image = Image.new('RGB', size, (seed * 37 % 256, seed * 91 % 256, seed * 53 % 256))
+    image.save(image_path)
+    image.close()
+    return None
+
+
+### Load a copy of the script as a new module, from the working tree or a git revision. The copy is
+### kept in a temporary directory, so its journal, log and daemon files are never written in the repo.
+###     (revision) A git revision, or None for the script in the working tree.
+###     (settings) A Dictionary of the script's settings to change, by name.
+###     --> Returns a [Module]
+def loadScript(revision = None, settings = {}):
+    script_dir = Path(tempfile.mkdtemp(prefix='lb_script_'))
+    script_path = script_dir / SCRIPT_NAME
+    if revision:
+        script_path.write_bytes(subprocess.run(
+            ['git', 'show', f'{revision}:{SCRIPT_NAME}'], cwd=REPO_DIR, check=True, capture_output=True
+        ).stdout)
+    else:
+        shutil.copyfile(REPO_DIR / SCRIPT_NAME, script_path)
+
+    module_name = f'lb_script_{script_dir.name}'
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    script = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = script
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning) # Regular expressions written without r''
+        warnings.simplefilter('ignore', SyntaxWarning)
+        spec.loader.exec_module(script)
+    for setting, value in settings.items():
+        setattr(script, setting, value)
+    return script
+
+
+### Read the LaunchBox and RetroArch data of a library, as the script does before the first drop.
+###     (script) The script module, see loadScript().
+###     (library) A Library.
+###     (preset_number) The preset to use.
+###     --> Returns a [Dictionary] of all the data
+def startScript(script, library, preset_number = 1):
+    script.launchbox_root = str(library.launchbox)
+    script.retroarch_root = str(library.retroarch)
+    with redirect_stdout(StringIO()):
+        all_the_data = script.changePreset(dict(script.preset_options[preset_number]))
+        return script.getLaunchBoxRetroArchData(all_the_data)
+
+
+### Drop the library's game files on the script and create all their thumbnails.
+###     (script) The script module, see loadScript().
+###     (library) A Library.
+###     (preset_number) The preset to use.
+###     (all_the_data) The data of an earlier startScript(), or None to start anew.
+###     --> Returns a [Dictionary] of all the data
+def runDrop(script, library, preset_number = 1, all_the_data = None):
+    if not all_the_data:
+        all_the_data = startScript(script, library, preset_number)
+    with redirect_stdout(StringIO()):
+        all_the_data = script.findLaunchBoxGameImages(library.games, all_the_data)
+        all_the_data = script.createRetroArchImagePaths(all_the_data)
+        if hasattr(script, 'closeArchiveExports'):
+            script.closeArchiveExports(all_the_data)
+    return all_the_data
+
+
+### Get a fingerprint of every thumbnail created.
+###     (library) A Library.
+###     --> Returns a [Dictionary] { Relative Path : SHA1 Hash }
+def hashThumbnails(library):
+    return {
+        str(thumbnail.relative_to(library.thumbnails)) : sha1(thumbnail.read_bytes()).hexdigest()
+        for thumbnail in sorted(library.thumbnails.rglob('*'))
+        if thumbnail.is_file() and not thumbnail.name.endswith('__fingerprints.json') # Not a thumbnail
+    }
+
+
+### Delete every thumbnail created, so the next run starts from nothing.
+###     (library) A Library.
+###     --> Returns a [None]
+def clearThumbnails(library):
+    shutil.rmtree(library.thumbnails)
+    library.thumbnails.mkdir()
+    return None
@@ -0,0 +1,57 @@
+import json
+
+from synthetic_library import PLATFORM, PLAYLIST_NAME, buildLibrary, clearThumbnails, hashThumbnails, loadScript, runDrop
+
+
+def runAlternatesDrop(library):
+    script = loadScript()
+    all_the_data = runDrop(script, library, preset_number=5)
+    script.closeResumeJournal(all_the_data)
+    return script, all_the_data
+
+
+def getPlannedImages(script, all_the_data):
+    return all_the_data[script.APP_DATA][script.LAUNCHBOX][script.PLATFORMS][PLATFORM][script.PLANNED_IMAGE_PATHS]
+
+
+def testAlternateImagesDontDependOnThePlaylistOrder(tmp_path):
+    library = buildLibrary(tmp_path / 'library', files_per_game=3, images_per_region=3)
+    script, all_the_data = runAlternatesDrop(library)
+    planned_images = getPlannedImages(script, all_the_data)
+    thumbnails = hashThumbnails(library)
+    assert len(thumbnails) == 3 * 3 * 3 # Games, discs, thumbnail types
+
+    # Each disc of a game gets its own image.
+    for game_paths in planned_images.values():
+        for media in (script.FRONT_BOXART, script.TITLE_SCREEN, script.GAMEPLAY_SCREEN):
+            assert len({ planned_media[media] for planned_media in game_paths.values() }) == 3
+
+    playlist_path = library.playlists_dir / PLAYLIST_NAME
+    playlist = json.loads(playlist_path.read_text())
+    playlist['items'].reverse()
+    playlist_path.write_text(json.dumps(playlist))
+    clearThumbnails(library)
+
+    script, all_the_data = runAlternatesDrop(library)
+    assert getPlannedImages(script, all_the_data) == planned_images
+    assert hashThumbnails(library) == thumbnails
+
+
+def testAlternateImagesDontDependOnOtherThumbnailsSaving(tmp_path, monkeypatch):
+    library = buildLibrary(tmp_path / 'library')
+    runAlternatesDrop(library)
+    thumbnails = hashThumbnails(library)
+    clearThumbnails(library)
+
+    # Fail every thumbnail of the first discs.
+    script = loadScript()
+    make_thumbnail_images = script.makeThumbnailImages
+    def failFirstDiscs(all_the_data, image_source_path, image_source_file_size, image_outputs, *args):
+        if any('(Disc 1)' in image_output_path.name for image_output_path in image_outputs):
+            return dict.fromkeys(image_outputs, 'Failed To Save Image: Test'), {}, {}, 0, []
+        return make_thumbnail_images(all_the_data, image_source_path, image_source_file_size, image_outputs, *args)
+    monkeypatch.setattr(script, 'makeThumbnailImages', failFirstDiscs)
+    all_the_data = runDrop(script, library, preset_number=5)
+    script.closeResumeJournal(all_the_data)
+
+    assert hashThumbnails(library) == { thumbnail : thumbnail_hash for thumbnail, thumbnail_hash in thumbnails.items() if '(Disc 1)' not in thumbnail }
@@ -0,0 +1,45 @@
+import zipfile
+
+from synthetic_library import PLAYLIST_NAME, runDrop, saveImage
+
+
+def runExport(script, library):
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    return sorted(library.root.glob('thumbnails*.zip'))
+
+
+def getArchiveMembers(archive_path):
+    with zipfile.ZipFile(archive_path) as archive_file:
+        return sorted(archive_file.namelist())
+
+
+def testDeltaExportsOnlyHoldWhatChangedAndNeverReplaceEarlierExports(script, library):
+    archive_path = library.root / 'thumbnails.zip'
+    script.preset_options[1] = {**script.preset1, script.EXPORT_ARCHIVE : archive_path, script.EXPORT_DELTA : True}
+
+    assert runExport(script, library) == [archive_path]
+    all_members = getArchiveMembers(archive_path)
+    assert len(all_members) == 3 * 2 * 3 # Games, discs, thumbnail types
+    assert all(member.startswith(f'thumbnails/{PLAYLIST_NAME[:-4]}/Named_') for member in all_members)
+    assert not any(library.thumbnails.iterdir())
+    archive_data = archive_path.read_bytes()
+
+    # Nothing changed, nothing exported.
+    assert runExport(script, library) == [archive_path]
+    assert archive_path.read_bytes() == archive_data
+
+    # Only the thumbnails of the game with new images are in the delta.
+    for image_path in (library.launchbox / 'Images').rglob('Game 0_ Quest-*'):
+        saveImage(image_path, (400, 600), 99)
+    archive_paths = runExport(script, library)
+    assert len(archive_paths) == 2 and archive_paths[0] == archive_path
+    delta_archive_path = archive_paths[1]
+    assert delta_archive_path.name.startswith('thumbnails_delta_')
+    assert getArchiveMembers(delta_archive_path) == [ member for member in all_members if '/Game 0: Quest [0]' in member ]
+    assert archive_path.read_bytes() == archive_data
+
+    # A full export replaces the archive.
+    script.preset_options[1][script.EXPORT_DELTA] = False
+    assert runExport(script, library) == archive_paths
+    assert getArchiveMembers(archive_path) == all_members
@@ -0,0 +1,43 @@
+from PIL import Image
+import pytest
+
+from synthetic_library import runDrop
+
+SCREEN = 'video_fullscreen_x = "1920"\nvideo_fullscreen_y = "1080"\n'
+WINDOW = 'video_fullscreen_x = "0"\nvideo_fullscreen_y = "0"\nvideo_windowed_position_width = "800"\nvideo_windowed_position_height = "600"\n'
+
+
+def readConfig(script, tmp_path, config_text):
+    config_path = tmp_path / 'retroarch.cfg'
+    config_path.write_text(config_text)
+    return script.readRetroArchConfig(config_path)
+
+
+@pytest.mark.parametrize('menu_driver, config_text, thumbnail_size', [
+    ('rgui', SCREEN, (320, 240)),
+    ('rgui', SCREEN + 'menu_thumbnail_upscale_threshold = "256"\n', (320, 256)),
+    ('ozone', SCREEN, (1920, 1080)),
+    ('xmb', SCREEN, (1920, 1080)),
+    ('glui', SCREEN, (1920, 1080)),
+    ('ozone', WINDOW, (800, 600)),
+    ('xmb', WINDOW + 'menu_thumbnail_upscale_threshold = "1024"\n', (1024, 1024)),
+    ('ozone', 'video_fullscreen_x = "0"\nvideo_fullscreen_y = "0"\n', None),
+    ('ozone', '', None),
+])
+def testThumbnailSizeForEachMenuDriver(script, tmp_path, menu_driver, config_text, thumbnail_size):
+    config_settings = readConfig(script, tmp_path, f'menu_driver = "{menu_driver}"\n' + config_text)
+    assert script.getThumbnailSizeProfile(config_settings) == thumbnail_size
+
+
+def testAutoSizeProfileOfAnotherDevice(script, library, tmp_path):
+    config_path = tmp_path / 'handheld.cfg'
+    config_path.write_text('menu_driver = "rgui"\n')
+    script.preset_options[1] = {**script.preset1, script.AUTO_SIZE_PROFILE : config_path}
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+
+    thumbnails = list(library.thumbnails.rglob('*.png'))
+    assert thumbnails
+    for thumbnail in thumbnails:
+        with Image.open(thumbnail) as image:
+            assert image.height == 240 and image.width <= 320
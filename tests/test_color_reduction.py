@@ -0,0 +1,56 @@
+from PIL import Image
+
+from synthetic_library import PLAYLIST_NAME, runDrop
+
+ICC_PROFILE = b'not a real color profile'
+
+
+def makeStripes(colors, size = (64, 64)):
+    image = Image.new('RGB', size)
+    for x in range(size[0]):
+        for y in range(size[1]):
+            image.putpixel((x, y), colors[x % len(colors)])
+    return image
+
+
+def testFewColorsAreSavedWithALowerBitDepthAndNoColorLoss(script):
+    image = makeStripes([(0, 0, 0), (255, 0, 0), (0, 255, 0)])
+    palette_image, color_reduction, save_params = script.reduceImageColors(image, { script.REDUCE_BIT_DEPTH : True })
+
+    assert palette_image.mode == 'P'
+    assert save_params == { 'bits' : 2 }
+    assert color_reduction == '3 Colors (2-Bit)'
+    assert palette_image.convert('RGB').tobytes() == image.tobytes()
+
+
+def testPalettesAreOnlyUsedWhenTheQualityIsHighEnough(script):
+    image = makeStripes([(value, 255 - value, value // 2) for value in range(0, 256, 4)])
+
+    palette_image, color_reduction, save_params = script.reduceImageColors(image, { script.PALETTE_COLORS : 8, script.PALETTE_QUALITY : 60 })
+    assert palette_image is image and color_reduction is None and save_params == {}
+
+    palette_image, color_reduction, save_params = script.reduceImageColors(image, { script.PALETTE_COLORS : 8, script.PALETTE_QUALITY : 10 })
+    assert palette_image.mode == 'P' and len(palette_image.getcolors()) <= 8
+    assert color_reduction.startswith('8 Color Palette (Quality: ')
+
+
+def testMetadataIsOnlyStrippedWhenAsked(script, library):
+    for image_path in (library.launchbox / 'Images').rglob('*.*'):
+        with Image.open(image_path) as image:
+            image.load()
+        exif = Image.Exif()
+        exif[0x010e] = 'Synthetic image' # Image description
+        image.save(image_path, icc_profile=ICC_PROFILE, exif=exif.tobytes())
+
+    def getThumbnailMetadata():
+        boxarts = library.thumbnails / PLAYLIST_NAME[:-4] / 'Named_Boxarts'
+        with Image.open(next(boxarts.iterdir())) as image:
+            return image.info.get('icc_profile'), image.info.get('exif')
+
+    runDrop(script, library)
+    assert getThumbnailMetadata()[0] == ICC_PROFILE
+
+    script.preset_options[1] = {**script.preset1, script.EXTRA_IMAGE_SAVING_PARAMS : { script.STRIP_METADATA : True }}
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    assert getThumbnailMetadata() == (None, None)
@@ -0,0 +1,63 @@
+from contextlib import redirect_stdout
+from io import StringIO
+import threading
+
+from synthetic_library import startScript
+
+
+def startDaemon(script, library, daemon_file_path):
+    all_the_data = startScript(script, library)
+    daemon_results = {}
+    def runDaemon():
+        daemon_results['data'] = script.runDaemon(all_the_data, daemon_file_path)
+    daemon_thread = threading.Thread(target=runDaemon)
+    with redirect_stdout(StringIO()):
+        daemon_thread.start()
+        while not daemon_file_path.exists() or not daemon_file_path.read_text():
+            daemon_thread.join(0.01)
+    return daemon_thread, daemon_results
+
+
+def forward(script, paths, daemon_file_path):
+    output = StringIO()
+    with redirect_stdout(output):
+        assert script.forwardToDaemon(paths, daemon_file_path)
+    return output.getvalue()
+
+
+def testDaemonHandlesEachRequestOnItsOwn(script, library, tmp_path):
+    daemon_file_path = tmp_path / 'daemon.txt'
+    daemon_thread, daemon_results = startDaemon(script, library, daemon_file_path)
+    first_game, second_game = sorted(library.games.glob('*(Disc 1).cue'))[:2]
+    try:
+        assert 'ERROR' in forward(script, [], daemon_file_path)
+        forward(script, [first_game], daemon_file_path)
+        forward(script, [second_game], daemon_file_path)
+    finally:
+        forward(script, None, daemon_file_path)
+        daemon_thread.join()
+
+    all_the_data = daemon_results['data']
+    script.closeResumeJournal(all_the_data)
+    assert all_the_data[script.LOG_DATA][script.GAME_PATHS_IN_LB_RA] == [first_game, second_game]
+    game_titles = all_the_data[script.APP_DATA][script.LAUNCHBOX][script.PLATFORMS]['Sega Genesis'][script.IMAGE_PATHS]
+    assert list(game_titles) == ['Game 1: Quest']
+
+
+def testDaemonKeepsItsThumbnailWorkers(script, library, tmp_path):
+    daemon_file_path = tmp_path / 'daemon.txt'
+    daemon_thread, daemon_results = startDaemon(script, library, daemon_file_path)
+    first_game, second_game = sorted(library.games.glob('*(Disc 1).cue'))[:2]
+    thumbnail_pools = []
+    try:
+        for game in (first_game, second_game):
+            forward(script, [game], daemon_file_path)
+            thumbnail_pools.append(script.thumbnail_pool)
+    finally:
+        forward(script, None, daemon_file_path)
+        daemon_thread.join()
+
+    script.closeResumeJournal(daemon_results['data'])
+    assert thumbnail_pools[0] and thumbnail_pools[0] is thumbnail_pools[1]
+    assert script.thumbnail_jobs == []
+    assert len(list(library.thumbnails.rglob('*.png'))) == 2 * 3
@@ -0,0 +1,37 @@
+from synthetic_library import IMAGE_REGIONS, MEDIA_TYPES, PLATFORM, runDrop
+
+
+def testImageFoldersAreEachListedOnceUpFront(script, library, monkeypatch):
+    listed_directories = []
+    list_directory = script.listDirectory
+    def countListedDirectories(directory):
+        listed_directories.append(directory)
+        return list_directory(directory)
+    monkeypatch.setattr(script, 'listDirectory', countListedDirectories)
+
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+
+    image_dir = library.launchbox / 'Images' / PLATFORM
+    assert sorted(listed_directories) == sorted(
+        image_dir / media_type / region if region else image_dir / media_type
+        for media_type in MEDIA_TYPES for region in IMAGE_REGIONS
+    )
+
+    # Region folders that don't exist are known not to without asking the disk.
+    directory_listings = all_the_data[script.APP_DATA][script.LAUNCHBOX][script.DIRECTORY_LISTINGS]
+    assert script.getDirectoryListing(directory_listings, image_dir / 'Box - Front' / 'Japan') == None
+    assert len(listed_directories) == len(MEDIA_TYPES) * len(IMAGE_REGIONS)
+
+
+def testDirectoriesNotListedYetAreListedWhenNeeded(script, tmp_path):
+    (tmp_path / 'Europe').mkdir()
+    (tmp_path / 'Europe' / 'Game-01.png').write_bytes(b'')
+    (tmp_path / 'Game-01.jpg').write_bytes(b'')
+
+    directory_listings = {}
+    assert list(script.walkDirectoryListing(directory_listings, tmp_path)) == [
+        (tmp_path, ['Game-01.jpg']), (tmp_path / 'Europe', ['Game-01.png'])
+    ]
+    assert set(directory_listings) == { tmp_path, tmp_path / 'Europe' }
+    assert script.getDirectoryListing(directory_listings, tmp_path / 'Missing') == None
@@ -0,0 +1,58 @@
+from synthetic_library import buildLibrary, runDrop
+
+IMAGE_FILES = ['Pokemon - Red Version-01.png', 'Sonic the Hedgehog-01.jpg', 'Streets of Rage-01.png', 'Super Mario Bros. 2-01.png']
+
+
+def getIndex(script, tmp_path):
+    for image_file in IMAGE_FILES:
+        (tmp_path / image_file).write_bytes(b'')
+    all_the_data = { script.APP_DATA : { script.LAUNCHBOX : { script.IMAGE_DIR_INDEXES : {}, script.DIRECTORY_LISTINGS : {} } } }
+    return script.getImageDirectoryIndex(all_the_data, tmp_path, True)
+
+
+def testSameTitleIgnoringCaseAccentsAndPunctuation(script, tmp_path):
+    image_dir_index = getIndex(script, tmp_path)
+    assert script.findSimilarImageTitle(image_dir_index, 'POKÉMON: Red Version') == ('Pokemon - Red Version', 1.0)
+
+
+def testSimilarTitlesOnlyMatchAboveTheThreshold(script, tmp_path):
+    image_dir_index = getIndex(script, tmp_path)
+    image_title, confidence = script.findSimilarImageTitle(image_dir_index, 'Strets of Rage')
+    assert image_title == 'Streets of Rage' and 0.85 <= confidence < 1.0
+
+    script.fuzzy_title_matching = confidence
+    assert script.findSimilarImageTitle(image_dir_index, 'Strets of Rage') == ('Streets of Rage', confidence)
+    script.fuzzy_title_matching = confidence + 0.01
+    assert script.findSimilarImageTitle(image_dir_index, 'Strets of Rage') == (None, confidence)
+
+    # Similar, but not similar enough with the default threshold.
+    script.fuzzy_title_matching = 0.85
+    image_title, confidence = script.findSimilarImageTitle(image_dir_index, 'Sonic the Hedgehog Spinball')
+    assert image_title == None and 0.5 < confidence < 0.85
+
+
+def testSequelsNeverMatch(script, tmp_path):
+    image_dir_index = getIndex(script, tmp_path)
+    script.fuzzy_title_matching = 0.01
+    assert script.findSimilarImageTitle(image_dir_index, 'Super Mario Bros. 3') == (None, 0)
+    assert script.findSimilarImageTitle(image_dir_index, 'Streets of Rage 2')[0] != 'Streets of Rage'
+
+
+def testImagesWithSimilarTitlesAreUsedAndLogged(script, tmp_path):
+    library = buildLibrary(tmp_path / 'library', titles=['Streets of Rage'], files_per_game=1)
+    for image_path in list((library.launchbox / 'Images').rglob('Streets of Rage-*')):
+        image_path.rename(image_path.with_name(image_path.name.replace('Streets', 'Strets')))
+
+    script.fuzzy_title_matching = 0.95
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    assert all_the_data[script.LOG_DATA][script.IMAGES_FOUND] == 0
+
+    script.fuzzy_title_matching = 0.85
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    fuzzy_matches = all_the_data[script.LOG_DATA][script.FUZZY_MATCHES]
+    assert all_the_data[script.LOG_DATA][script.IMAGES_FOUND] == 3
+    assert len(fuzzy_matches) == 3
+    assert all(match[:2] == ('Streets of Rage', 'Strets of Rage') for match in fuzzy_matches.values())
+    assert len(list(library.thumbnails.rglob('*.png'))) == 3
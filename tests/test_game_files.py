@@ -0,0 +1,50 @@
+from pathlib import Path
+
+
+def makeFiles(root, file_names):
+    for file_name in file_names:
+        file_path = root / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text('x')
+    return [ root / file_name for file_name in file_names ]
+
+
+def walkGameDirectory(script, directory, search_sub_dirs = True):
+    return list(script.walkGameDirectory(directory, { '.cue', '.zip' }, { 'images', 'manuals' }, search_sub_dirs))
+
+
+def testGameFilesAreFoundByExtensionIgnoringCase(script, tmp_path):
+    game_paths = makeFiles(tmp_path, ['Game 1.cue', 'Game 2.ZIP', 'Game 3.Cue'])
+    makeFiles(tmp_path, ['Game 1.bin', 'Game 1.cue.txt', 'zip'])
+    assert sorted(walkGameDirectory(script, tmp_path)) == sorted(game_paths)
+
+
+def testSubDirectoriesAreSearchedAfterTheirFilesSkippingSome(script, tmp_path):
+    top_game_paths = makeFiles(tmp_path, ['Game 1.zip', 'Game 2.zip'])
+    sub_game_paths = makeFiles(tmp_path, ['Sub/Game 3.zip', 'Sub/Deeper/Game 4.zip'])
+    makeFiles(tmp_path, ['Images/Game 1.zip', 'MANUALS/Game 1.zip', '.hidden/Game 5.zip'])
+    (tmp_path / 'Linked').symlink_to(tmp_path / 'Sub', target_is_directory=True)
+
+    game_paths = walkGameDirectory(script, tmp_path)
+    assert sorted(game_paths[:2]) == top_game_paths
+    assert game_paths[2:] == sub_game_paths
+
+    assert sorted(walkGameDirectory(script, tmp_path, search_sub_dirs=False)) == top_game_paths
+
+
+def testMissingDirectoriesAreSkipped(script, tmp_path, capsys):
+    assert walkGameDirectory(script, tmp_path / 'Missing') == []
+    assert 'Can\'t Search Directory' in capsys.readouterr().out
+
+
+def testGameFilesAreFoundInTheOrderDropped(script, tmp_path):
+    script.game_extensions = ['.zip']
+    first = makeFiles(tmp_path / 'First', [f'Game {number}.zip' for number in range(20)])
+    dropped_game_path, = makeFiles(tmp_path, ['Dropped.zip'])
+    second = makeFiles(tmp_path / 'Second', [f'Game {number}.zip' for number in range(20)])
+
+    game_paths = list(script.findGameFiles([tmp_path / 'First', dropped_game_path, tmp_path / 'Second', tmp_path / 'Missing']))
+    assert sorted(game_paths[:20]) == sorted(first)
+    assert game_paths[20] == dropped_game_path
+    assert sorted(game_paths[21:]) == sorted(second)
+    assert all(isinstance(game_path, Path) for game_path in game_paths)
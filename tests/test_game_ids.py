@@ -0,0 +1,33 @@
+from PIL import Image
+
+from synthetic_library import PLATFORM, PLAYLIST_NAME, buildLibrary, runDrop, saveImage
+
+FIRST_GAME_ID = 'AAAAAAAA-1111-2222-3333-444444444444'
+SECOND_GAME_ID = 'BbBbBbBb-1111-2222-3333-444444444444'
+
+
+def getImageColor(image_path):
+    with Image.open(image_path) as image:
+        return image.convert('RGB').getpixel((0, 0))
+
+
+def testGamesWithTheSameTitleGetTheirOwnImages(script, tmp_path):
+    # Upper and mixed case IDs in the platform XML, lower case in the image file name.
+    library = buildLibrary(tmp_path / 'library', titles=['Tetris', 'Tetris'], files_per_game=2,
+                           game_ids=[FIRST_GAME_ID, SECOND_GAME_ID])
+
+    # Only region-free images named by title, and one image of the second game in a better region.
+    box_front = library.launchbox / 'Images' / PLATFORM / 'Box - Front'
+    for region in ('North America', 'Europe'):
+        for image_path in (box_front / region).iterdir():
+            image_path.unlink()
+    second_game_image = box_front / 'North America' / f'Tetris.{SECOND_GAME_ID.lower()}-01.png'
+    saveImage(second_game_image, (400, 600), 0)
+
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+
+    boxarts = library.thumbnails / PLAYLIST_NAME[:-4] / 'Named_Boxarts'
+    for disc in (1, 2):
+        assert getImageColor(boxarts / f'Tetris [0] (USA) (Disc {disc}).png') != getImageColor(second_game_image)
+        assert getImageColor(boxarts / f'Tetris [1] (USA) (Disc {disc}).png') == getImageColor(second_game_image)
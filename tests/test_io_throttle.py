@@ -0,0 +1,66 @@
+import pytest
+
+
+@pytest.fixture
+def clock(script, monkeypatch):
+    # A clock that only moves when the script waits, or when a test moves it.
+    clock = [100.0]
+    waits = []
+    def wait(seconds):
+        waits.append(seconds)
+        clock[0] += seconds
+    monkeypatch.setattr(script, 'Timer', lambda: clock[0])
+    monkeypatch.setattr(script, 'Wait', wait)
+    script.io_throttle_buckets.clear()
+    yield clock, waits
+    script.io_throttle_buckets.clear()
+
+
+def testNoLimitNeverWaits(script, clock):
+    clock, waits = clock
+    script.io_read_limit = 0
+    assert script.throttleIO(script.IO_READ, 10_000_000) == 0
+    assert waits == []
+    assert script.io_throttle_buckets == {}
+
+
+def testReadsWaitOnceAboveTheLimit(script, clock):
+    clock, waits = clock
+    script.io_read_limit = 1000
+
+    # The bucket starts full, a second's worth of reading.
+    assert script.throttleIO(script.IO_READ, 600) == 0
+    assert script.throttleIO(script.IO_READ, 400) == 0
+    assert script.throttleIO(script.IO_READ, 250) == pytest.approx(0.25)
+    assert waits == [pytest.approx(0.25)]
+
+    # Waiting paid back what was borrowed, so only new reading above the limit waits.
+    assert script.throttleIO(script.IO_READ, 500) == pytest.approx(0.5)
+
+    # Time passing refills the bucket, but never more than a second's worth.
+    clock[0] += 10
+    assert script.throttleIO(script.IO_READ, 1000) == 0
+    assert script.throttleIO(script.IO_READ, 100) == pytest.approx(0.1)
+
+
+def testMoreThanASecondsWorthAtOnce(script, clock):
+    clock, waits = clock
+    script.io_read_limit = 1000
+
+    # One large image waits for everything above the bucket, and so does the next read after it.
+    assert script.throttleIO(script.IO_READ, 3000) == pytest.approx(2.0)
+    assert script.throttleIO(script.IO_READ, 1) == pytest.approx(0.001)
+    assert sum(waits) == pytest.approx(2.001)
+
+
+def testEachKindOfIOHasItsOwnLimit(script, clock):
+    clock, waits = clock
+    script.io_read_limit = 1000
+    script.io_write_limit = 0
+    script.io_metadata_limit = 10
+
+    assert script.throttleIO(script.IO_READ, 1000) == 0
+    assert script.throttleIO(script.IO_WRITE, 1_000_000) == 0
+    assert [script.throttleIO(script.IO_METADATA) for check in range(12)] == [0] * 10 + [pytest.approx(0.1)] * 2
+    assert script.throttleIO(script.IO_READ, 500) == pytest.approx(0.5 - 0.2) # Refilled while checking files
+    assert script.io_throttle_stats[script.IO_METADATA] == [12, pytest.approx(0.2)]
@@ -0,0 +1,47 @@
+import pytest
+
+from synthetic_library import addPlatforms, writeXML
+
+
+def readWithBothParsers(script, xml_path, record_tags, child_tags = None):
+    script.lxml_installed = True
+    lxml_records = script.readLaunchBoxXML(xml_path, record_tags, child_tags)
+    script.lxml_installed = False
+    stdlib_records = script.readLaunchBoxXML(xml_path, record_tags, child_tags)
+    return lxml_records, stdlib_records
+
+
+def testPlatformXMLRecordsAreTheSame(script, library):
+    pytest.importorskip('lxml')
+    addPlatforms(library, 2, 50)
+    for xml_path in library.platforms_dir.glob('*.xml'):
+        lxml_records, stdlib_records = readWithBothParsers(script, xml_path, ['Game', 'AdditionalApplication'])
+        assert lxml_records == stdlib_records
+        assert lxml_records['Game']
+
+
+def testPlatformsXMLRecordsAreTheSame(script, library):
+    pytest.importorskip('lxml')
+    lxml_records, stdlib_records = readWithBothParsers(script, library.launchbox / 'Data' / 'Platforms.xml', 'PlatformFolder')
+    assert lxml_records == stdlib_records
+    assert len(lxml_records['PlatformFolder']) == 4
+
+
+def testUnusualContentIsReadTheSame(script, tmp_path):
+    pytest.importorskip('lxml')
+    xml_path = tmp_path / 'Unusual.xml'
+    writeXML(xml_path, [
+        '<Game><!-- A comment --><ID>1</ID><Title>Tom &amp; Jerry: Fists of Furry</Title><Region /><Notes><![CDATA[<b>Bold</b>]]></Notes></Game>',
+        '<Game><ID>2</ID><Title>Pokémon ポケモン</Title><Region></Region></Game>',
+        '<AdditionalApplication><GameID>2</GameID><ApplicationPath>C:\\Games\\Pokémon (Disc 2).cue</ApplicationPath></AdditionalApplication>',
+        '<Platform><Name>Not A Game</Name></Platform>',
+    ])
+    lxml_records, stdlib_records = readWithBothParsers(script, xml_path, ['Game', 'AdditionalApplication'])
+    assert lxml_records == stdlib_records
+    assert lxml_records['Game'][0] == {
+        'ID' : '1', 'Title' : 'Tom & Jerry: Fists of Furry', 'Region' : None, 'Notes' : '<b>Bold</b>'
+    }
+
+    lxml_records, stdlib_records = readWithBothParsers(script, xml_path, 'Game', ['ID', 'Title'])
+    assert lxml_records == stdlib_records
+    assert lxml_records['Game'][1] == { 'ID' : '2', 'Title' : 'Pokémon ポケモン' }
@@ -0,0 +1,32 @@
+from PIL import Image
+
+from synthetic_library import PLAYLIST_NAME, runDrop
+
+
+def testEachTargetGetsItsOwnSizeFromOneDecode(script, library, monkeypatch):
+    script.preset_options[1] = {**script.preset1, script.OUTPUT_TARGETS : [
+        { script.THUMBNAILS_ROOT : library.root / 'large', script.MODIFY_IMAGE_HEIGHT : (script.CHANGE_TO, 300) },
+        { script.THUMBNAILS_ROOT : library.root / 'small', script.MODIFY_IMAGE_HEIGHT : (script.CHANGE_TO, 150) },
+    ]}
+
+    opened_images = []
+    open_image = Image.open
+    def countOpenedImages(file_path, *args, **kwargs):
+        opened_images.append(file_path)
+        return open_image(file_path, *args, **kwargs)
+    monkeypatch.setattr(Image, 'open', countOpenedImages)
+
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+
+    source_images = [file_path for file_path in opened_images if library.launchbox in file_path.parents]
+    assert source_images and len(source_images) == len(set(source_images))
+
+    for root_name, height in (('large', 300), ('small', 150)):
+        thumbnails = sorted((library.root / root_name / PLAYLIST_NAME[:-4]).rglob('*.png'))
+        assert len(thumbnails) == 3 * 2 * 3 # Games, discs, thumbnail types
+        for thumbnail in thumbnails:
+            with Image.open(thumbnail) as image:
+                assert image.height == height
+                assert abs(image.width - image.height * 400 / 600) <= 2 # Synthetic images are about 400 x 600
+    assert not any(library.thumbnails.iterdir())
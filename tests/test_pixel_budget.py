@@ -0,0 +1,64 @@
+import threading
+
+from PIL import Image
+
+from synthetic_library import PLATFORM, runDrop, saveImage
+
+
+def makeThumbnails(script, tmp_path, size = (400, 600)):
+    image_path = tmp_path / 'Game-01.png'
+    saveImage(image_path, size, 1)
+    image_outputs = {
+        tmp_path / 'large.png' : { script.MODIFY_IMAGE_HEIGHT : (script.CHANGE_TO, 300) },
+        tmp_path / 'small.png' : { script.MODIFY_IMAGE_HEIGHT : (script.CHANGE_TO, 150) },
+    }
+    all_the_data = { script.APP_DATA : {}, script.LOG_DATA : {} }
+    return script.makeThumbnailImages(all_the_data, image_path, 0, image_outputs, script.NEAREST, True)
+
+
+def testPeakIsMeasuredFromTheImagesDecoded(script, tmp_path):
+    errors, saved_files, edit_logs, decoded_pixels, messages = makeThumbnails(script, tmp_path)
+    assert errors == dict.fromkeys(errors, None)
+    # The LaunchBox image and both resized copies were decoded at once, and all of them are closed now.
+    assert decoded_pixels == 400 * 600 + 200 * 300 + 100 * 150
+    assert script.pixels_decoded == 0 and script.pixels_reserved == 0
+
+
+def testImagesLargerThanTheWholeBudgetAreSkipped(script, tmp_path):
+    script.image_pixel_budget = 400 * 600
+    errors, saved_files, edit_logs, decoded_pixels, messages = makeThumbnails(script, tmp_path)
+    assert all(error.startswith('Image Too Large To Decode') for error in errors.values())
+    assert saved_files == {} and decoded_pixels == 0
+    assert script.pixels_reserved == 0
+
+
+def testWorkersWaitForRoomInTheBudget(script):
+    script.image_pixel_budget = 100
+    assert script.reservePixelBudget(80) == 80
+
+    reserved = []
+    waiting_worker = threading.Thread(target=lambda: reserved.append(script.reservePixelBudget(40)))
+    waiting_worker.start()
+    waiting_worker.join(0.2)
+    assert waiting_worker.is_alive() and reserved == []
+
+    script.releasePixelBudget(80)
+    waiting_worker.join(5)
+    assert reserved == [40] and script.pixels_reserved == 40
+    script.releasePixelBudget(40)
+
+
+def testDecompressionBombsAreLoggedAsErrors(script, library, monkeypatch):
+    monkeypatch.setattr(Image, 'MAX_IMAGE_PIXELS', 1000)
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+
+    assert list(library.thumbnails.rglob('*.png')) == []
+    save_infos = [
+        media_log[image_output_path][script.SAVE_INFO]
+        for game_title_log in all_the_data[script.LOG_DATA][script.SAVED_IMAGE_PATHS][PLATFORM].values()
+        for game_path_log in game_title_log.values()
+        for media_log in game_path_log.values()
+        for image_output_path in media_log
+    ]
+    assert save_infos and all(save_info.startswith('Failed To Open Image') for save_info in save_infos)
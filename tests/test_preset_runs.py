@@ -0,0 +1,57 @@
+from contextlib import redirect_stdout
+from hashlib import sha1
+from io import StringIO
+
+from PIL import Image
+
+from synthetic_library import IMAGE_REGIONS, MEDIA_TYPES, PLAYLIST_NAME, startScript
+
+
+def hashThumbnailRoot(thumbnails_root):
+    return {
+        str(thumbnail.relative_to(thumbnails_root)) : sha1(thumbnail.read_bytes()).hexdigest()
+        for thumbnail in sorted((thumbnails_root / PLAYLIST_NAME[:-4]).rglob('*.png'))
+    }
+
+
+def testPresetsShareDiscoveryAndReuseTheSameThumbnails(script, library, monkeypatch):
+    presets = [
+        {**script.preset1, script.THUMBNAILS_ROOT : library.root / 'first'},
+        {**script.preset1, script.THUMBNAILS_ROOT : library.root / 'same'},
+        {**script.preset1, script.THUMBNAILS_ROOT : library.root / 'smaller', script.MODIFY_IMAGE_HEIGHT : (script.CHANGE_TO, 150)},
+    ]
+    script.preset_options[1] = presets[0]
+    all_the_data = script.addPresetRuns(startScript(script, library), presets[1:])
+
+    listed_directories = []
+    list_directory = script.listDirectory
+    def countListedDirectories(directory):
+        listed_directories.append(directory)
+        return list_directory(directory)
+    monkeypatch.setattr(script, 'listDirectory', countListedDirectories)
+
+    opened_images = []
+    open_image = Image.open
+    def countOpenedImages(file_path, *args, **kwargs):
+        opened_images.append(file_path)
+        return open_image(file_path, *args, **kwargs)
+    monkeypatch.setattr(Image, 'open', countOpenedImages)
+
+    with redirect_stdout(StringIO()):
+        all_the_data = script.findLaunchBoxGameImages(library.games, all_the_data)
+        for preset_run in script.getPresetRuns(all_the_data):
+            script.createRetroArchImagePaths(preset_run)
+    script.closeResumeJournal(all_the_data)
+
+    # The image folders are listed once for all the presets.
+    assert len(listed_directories) == len(MEDIA_TYPES) * len(IMAGE_REGIONS)
+
+    first, same, smaller = (hashThumbnailRoot(library.root / name) for name in ('first', 'same', 'smaller'))
+    assert len(first) == 3 * 2 * 3 # Games, discs, thumbnail types
+    assert same == first
+    assert smaller.keys() == first.keys() and smaller != first
+
+    # LaunchBox images are opened once for the first preset and once more for the smaller thumbnails,
+    # the second preset's thumbnails are copies of the first's.
+    source_images = [ file_path for file_path in opened_images if library.launchbox in file_path.parents ]
+    assert len(source_images) == 2 * len(set(source_images))
@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+from synthetic_library import loadScript, runDrop
+
+
+def openJournal(script, journal_path):
+    return script.openResumeJournal({ script.APP_DATA : {} }, journal_path)
+
+
+def testSecondRunDoesNotTakeOverJournal(script, tmp_path):
+    journal_path = tmp_path / 'journal.txt'
+    temp_file = tmp_path / 'Game.png.tmp123'
+    temp_file.write_text('half saved')
+    first_run = openJournal(script, journal_path)
+    script.writeResumeJournal(first_run, { 'output' : str(tmp_path / 'Game.png'), 'temp' : str(temp_file) })
+
+    second_script = loadScript()
+    second_run = openJournal(second_script, journal_path)
+    assert second_run[second_script.APP_DATA].get(second_script.RESUME_JOURNAL) == None
+    second_script.closeResumeJournal(second_run)
+    assert temp_file.exists()
+    assert journal_path.exists()
+
+    script.closeResumeJournal(first_run)
+    assert not journal_path.exists()
+
+
+def testOnlyJournalTempFilesAreDeleted(script, tmp_path):
+    journal_path = tmp_path / 'journal.txt'
+    temp_file = tmp_path / 'Game.png.tmp123'
+    unlisted_temp_file = tmp_path / 'Other.png.tmp456'
+    not_a_temp_file = tmp_path / 'Notes.txt'
+    for file in (temp_file, unlisted_temp_file, not_a_temp_file):
+        file.write_text('x')
+    journal_path.write_text(
+        json.dumps({ 'output' : str(tmp_path / 'Game.png'), 'temp' : str(temp_file) }) + '\n' +
+        json.dumps({ 'output' : str(tmp_path / 'Game2.png'), 'temp' : str(not_a_temp_file) }) + '\n'
+    )
+    all_the_data = openJournal(script, journal_path)
+    script.closeResumeJournal(all_the_data)
+    assert not temp_file.exists()
+    assert unlisted_temp_file.exists()
+    assert not_a_temp_file.exists()
+
+
+def testNewDropStartsWithEmptyJournal(script, library):
+    all_the_data = runDrop(script, library)
+    journal = all_the_data[script.APP_DATA][script.RESUME_JOURNAL]
+    assert journal[script.JOURNAL_ENTRIES]
+
+    script.resetResumeJournal(all_the_data)
+    assert not journal[script.JOURNAL_ENTRIES]
+    assert Path(journal[script.JOURNAL_FILE].name).stat().st_size == 0
+
+    # Thumbnails saved by the last drop are saved again, not resumed.
+    all_the_data = runDrop(script, library, all_the_data=all_the_data)
+    statuses = [
+        saved_image[2] for game_titles in all_the_data[script.LOG_DATA][script.SAVED_IMAGE_PATHS].values()
+        for game_paths in game_titles.values() for medias in game_paths.values()
+        for saved_images in medias.values() for saved_image in saved_images.values()
+    ]
+    script.closeResumeJournal(all_the_data)
+    assert statuses
+    assert script.RESUMED not in statuses
@@ -0,0 +1,12 @@
+from synthetic_library import clearThumbnails, hashThumbnails, runDrop
+
+
+def testThumbnailDirectoriesDeletedBetweenDropsAreCreatedAgain(script, library):
+    all_the_data = runDrop(script, library)
+    thumbnails = hashThumbnails(library)
+    assert thumbnails
+
+    clearThumbnails(library)
+    all_the_data = runDrop(script, library, all_the_data=all_the_data)
+    script.closeResumeJournal(all_the_data)
+    assert hashThumbnails(library) == thumbnails
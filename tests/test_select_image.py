@@ -0,0 +1,89 @@
+from pathlib import Path
+
+BOX_FRONT = Path('/LaunchBox/Images/Sega Genesis/Box - Front')
+BOX_3D = Path('/LaunchBox/Images/Sega Genesis/Box - 3D')
+
+# Image directories are never listed from disk, only from these listings. { Path : ( [File Names], [Sub-Directory Paths] ) }
+DIRECTORY_LISTINGS = {
+    BOX_3D : (['Streets of Rage-01.png'], []),
+    BOX_FRONT : (['Streets of Rage-01.jpg', 'Streets of Rage-02.png', 'Strets of Rage 2-01.png'],
+                 [BOX_FRONT / 'Europe', BOX_FRONT / 'Japan', BOX_FRONT / 'North America']),
+    BOX_FRONT / 'Europe' : (['Streets of Rage-01.jpg', 'Streets of Rage-02.png'], []),
+    BOX_FRONT / 'Japan' : (['Streets of Rage-01.png'], []),
+    BOX_FRONT / 'North America' : (['Streets of Rage-01.jpg', 'Streets of Rage-02.jpg'], []),
+}
+
+
+def getCandidates(script, image_directories, region_priority_list, image_titles = None, **options):
+    all_the_data = { script.APP_DATA : { script.LAUNCHBOX : {
+        script.IMAGE_DIR_INDEXES : {}, script.DIRECTORY_LISTINGS : dict(DIRECTORY_LISTINGS), script.GAMES_BY_ID : {}
+    } } }
+    image_titles = image_titles or ['Streets of Rage'] * len(image_directories)
+    return script.getImageCandidates(all_the_data, image_directories, image_titles, region_priority_list, **options)
+
+
+def selectBestImage(script, image_directories, region_priority_list, selection_priority = None, **options):
+    image_candidates = getCandidates(script, image_directories, region_priority_list, **options)
+    return script.selectBestImage(image_candidates, selection_priority or script.DEFAULT_SELECTION_PRIORITY)
+
+
+def testRegionPriority(script):
+    assert selectBestImage(script, [BOX_FRONT], ['North America', 'Europe']) == BOX_FRONT / 'North America' / 'Streets of Rage-01.jpg'
+    assert selectBestImage(script, [BOX_FRONT], ['Europe', 'North America']) == BOX_FRONT / 'Europe' / 'Streets of Rage-01.jpg'
+    assert selectBestImage(script, [BOX_FRONT], ['Region Free', 'Europe']) == BOX_FRONT / 'Streets of Rage-01.jpg'
+    assert selectBestImage(script, [BOX_FRONT], ['Australia']) == None
+
+    # Regions not in the region priority list are found by searching all of the region free directory,
+    # after the region free images themselves.
+    image_candidates = getCandidates(script, [BOX_FRONT], ['Region Free'])
+    assert sorted(scores[script.IMAGE_REGION] for scores, listing_order, image_path in image_candidates) == [(0, 0)] * 2 + [(0, 1)] * 5
+
+
+def testImageCategoryComesBeforeRegionUnlessSelectedOtherwise(script):
+    image_directories = [BOX_3D, BOX_FRONT]
+    assert selectBestImage(script, image_directories, ['Japan', 'Region Free']) == BOX_3D / 'Streets of Rage-01.png'
+    assert selectBestImage(script, image_directories, ['Japan', 'Region Free'], [script.IMAGE_REGION]) == BOX_FRONT / 'Japan' / 'Streets of Rage-01.png'
+
+
+def testFormatAndNumberPreferences(script):
+    assert selectBestImage(script, [BOX_FRONT], ['Europe'], format_preference=script.PNG) == BOX_FRONT / 'Europe' / 'Streets of Rage-02.png'
+    assert selectBestImage(script, [BOX_FRONT], ['North America'], preferred_image_number=2) == BOX_FRONT / 'North America' / 'Streets of Rage-02.jpg'
+
+    # Region before format, unless selected otherwise.
+    assert selectBestImage(script, [BOX_FRONT], ['North America', 'Europe'], format_preference=script.PNG) == (
+        BOX_FRONT / 'North America' / 'Streets of Rage-01.jpg'
+    )
+    assert selectBestImage(script, [BOX_FRONT], ['North America', 'Europe'], [script.IMAGE_FORMAT], format_preference=script.PNG) == (
+        BOX_FRONT / 'Europe' / 'Streets of Rage-02.png'
+    )
+
+
+def testClaimedAndBrokenImagesAreSkipped(script, monkeypatch):
+    north_america = BOX_FRONT / 'North America'
+    claimed_images = { north_america / 'Streets of Rage-01.jpg' }
+    assert selectBestImage(script, [BOX_FRONT], ['North America'], claimed_images=claimed_images) == north_america / 'Streets of Rage-02.jpg'
+
+    monkeypatch.setattr(script, 'checkImageFile', lambda image_validations, image_path: (
+        'Incomplete JPEG File' if image_path.suffix == '.jpg' else None
+    ))
+    image_candidates = getCandidates(script, [BOX_FRONT], ['North America', 'Europe'])
+    assert script.selectBestImage(image_candidates, image_validations={}) == BOX_FRONT / 'Europe' / 'Streets of Rage-02.png'
+
+
+def testSimilarTitlesAreUsedInImageCategoryOrder(script):
+    all_the_data = { script.APP_DATA : { script.LAUNCHBOX : {
+        script.IMAGE_DIR_INDEXES : {}, script.DIRECTORY_LISTINGS : dict(DIRECTORY_LISTINGS), script.GAMES_BY_ID : {}
+    } } }
+    image_directories = [BOX_3D, BOX_FRONT]
+    similar_titles = [
+        script.findSimilarImageTitle(script.getImageDirectoryIndex(all_the_data, image_directory, True), 'Streets of Rage 2')
+        for image_directory in image_directories
+    ]
+    # Never the first game for its sequel, only the misspelled sequel.
+    assert similar_titles[0][0] == None
+    assert similar_titles[1][0] == 'Strets of Rage 2'
+
+    image_titles = [ image_title for image_title, confidence in similar_titles ]
+    image_candidates = script.getImageCandidates(all_the_data, image_directories, image_titles, ['Region Free'])
+    assert script.selectBestImage(image_candidates) == BOX_FRONT / 'Strets of Rage 2-01.png'
+    assert [ scores[script.IMAGE_CATEGORY] for scores, listing_order, image_path in image_candidates ] == [1]
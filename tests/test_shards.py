@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+from synthetic_library import buildLibrary, clearThumbnails, loadScript, runDrop
+
+
+@pytest.mark.parametrize('shard_argument, shard', [
+    ('2/4', (2, 4)), ('1/1', (1, 1)), ('0/4', None), ('5/4', None), ('2', None), ('1/2/3', None), ('a/b', None), (None, None),
+])
+def testParseShard(script, shard_argument, shard):
+    assert script.parseShard(shard_argument) == shard
+
+
+def testGameTitlesAlwaysGoToTheSameShard(script):
+    # Not Python's hash(), which changes every time Python starts.
+    assert script.getShardNumber('Sega Genesis', 'Sonic the Hedgehog', 4) == 4
+    assert script.getShardNumber('Sega Genesis', 'Streets of Rage', 4) == 2
+    assert loadScript().getShardNumber('Sega Genesis', 'Sonic the Hedgehog', 4) == 4
+
+    shard_numbers = [ script.getShardNumber('Sega Genesis', f'Game {number}', 4) for number in range(100) ]
+    assert set(shard_numbers) == {1, 2, 3, 4}
+
+
+def readLog(log_file_path):
+    # Shards run side by side, so their times and memory use aren't the same as one run's.
+    return [ line for line in log_file_path.read_text(encoding='utf-8').splitlines()
+             if 'Time' not in line and 'Pixels' not in line ]
+
+
+def testShardManifestsMergeIntoTheSameLogAsOneRun(tmp_path):
+    library = buildLibrary(tmp_path / 'library', titles=6, files_per_game=1)
+    script = loadScript()
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    full_log = readLog(script.createLogFile(all_the_data, tmp_path / 'full_log.txt'))
+    full_log_data = all_the_data[script.LOG_DATA]
+
+    clearThumbnails(library)
+    manifest_paths = []
+    for shard_number in (1, 2):
+        script = loadScript(settings={ 'shard' : (shard_number, 2) })
+        all_the_data = runDrop(script, library)
+        script.closeResumeJournal(all_the_data)
+        manifest_paths.append(tmp_path / f'shard{shard_number}of2.json')
+        assert script.writeShardManifest(all_the_data, manifest_paths[-1], 1)
+    assert all(json.loads(manifest_path.read_text())['saved_images'] for manifest_path in manifest_paths)
+
+    merged_runs = []
+    create_log_file = script.createLogFile
+    def keepMergedRun(all_the_data, log_file_path):
+        merged_runs.append(all_the_data)
+        return create_log_file(all_the_data, log_file_path)
+    script.createLogFile = keepMergedRun
+    log_file_path, = script.mergeShardManifests(manifest_paths)
+
+    # Game titles are logged shard by shard, instead of in the order they were found.
+    assert sorted(readLog(log_file_path)) == sorted(full_log)
+    merged_run, = merged_runs
+    for log_key in (script.SAVED_IMAGE_PATHS, script.IMAGE_EDITS, script.GAME_PATHS_IN_LB_RA, script.IMAGES_FOUND):
+        if isinstance(full_log_data[log_key], list):
+            assert sorted(merged_run[script.LOG_DATA][log_key]) == sorted(full_log_data[log_key])
+        else:
+            assert merged_run[script.LOG_DATA][log_key] == full_log_data[log_key]
+
+
+def testOnlyTheNewestManifestOfEachShardIsMerged(script, tmp_path, capsys, monkeypatch):
+    def writeManifest(file_name, shard, images_found, modified_time):
+        manifest_path = tmp_path / file_name
+        manifest_path.write_text(json.dumps({
+            'shard' : shard, 'preset' : 1, 'description' : '', 'images_found' : images_found, 'completion_time' : 1.0,
+            'peak_decoded_pixels' : 0, 'games_found' : [], 'fuzzy_matches' : [], 'broken_images' : {}, 'saved_images' : []
+        }))
+        os.utime(manifest_path, ns=(modified_time, modified_time))
+        return manifest_path
+
+    manifest_paths = [
+        writeManifest('old_shard1of2.json', [1, 2], 100, 1_000_000_000),
+        writeManifest('shard1of2.json', [1, 2], 1, 3_000_000_000),
+        writeManifest('shard2of2.json', [2, 2], 2, 2_000_000_000),
+        writeManifest('shard1of3.json', [1, 3], 1000, 1_500_000_000),
+        writeManifest('broken.json', [1, 2], 'x', 4_000_000_000),
+    ]
+    merged_runs = []
+    monkeypatch.setattr(script, 'createLogFile', lambda all_the_data, log_file_path: merged_runs.append(all_the_data))
+    script.mergeShardManifests(manifest_paths)
+
+    merged_run, = merged_runs
+    assert merged_run[script.LOG_DATA][script.IMAGES_FOUND] == 3
+    output = capsys.readouterr().out
+    assert 'Skipping Shard Manifest (ValueError' in output and str(manifest_paths[4]) in output
+    assert f'Skipping Older Shard Manifest Of Shard 1/2: {manifest_paths[0]}' in output
+    assert f'Skipping Shard Manifest (Split Into 3 Shards, Not 2): {manifest_paths[3]}' in output
+    assert output.index(f'Merging Shard 1/2: {manifest_paths[1]}') < output.index(f'Merging Shard 2/2: {manifest_paths[2]}')
+    assert 'Shards Not Merged' not in output
@@ -0,0 +1,40 @@
+from collections import Counter
+from contextlib import redirect_stdout
+from io import StringIO
+import sys
+import time
+
+from synthetic_library import buildLibrary, clearThumbnails, hashThumbnails, loadScript, startScript
+
+
+# Lets other threads run in the middle of every print, like printing to a console can.
+class ConsoleOutput(StringIO):
+    def write(self, text):
+        time.sleep(0)
+        return super().write(text)
+
+
+def runAndCapture(script, library, stream):
+    clearThumbnails(library)
+    all_the_data = startScript(script, library)
+    output = ConsoleOutput()
+    with redirect_stdout(output):
+        if stream:
+            all_the_data = script.streamRetroArchThumbnails([library.games], all_the_data)
+        else:
+            all_the_data = script.findLaunchBoxGameImages([library.games], all_the_data)
+            all_the_data = script.createRetroArchImagePaths(all_the_data)
+    script.closeResumeJournal(all_the_data)
+    return output.getvalue(), hashThumbnails(library)
+
+
+def testStreamingCreatesAndPrintsTheSameAsBatch(tmp_path):
+    library = buildLibrary(tmp_path / 'library', titles=20)
+    batch_output, batch_thumbnails = runAndCapture(loadScript(), library, False)
+    stream_stdout = sys.stdout
+    stream_output, stream_thumbnails = runAndCapture(loadScript(), library, True)
+
+    assert sys.stdout is stream_stdout
+    assert stream_thumbnails == batch_thumbnails
+    # Every line is printed whole, never mixed with lines printed by the other thread.
+    assert Counter(stream_output.splitlines()) == Counter(batch_output.splitlines())
@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+
+from synthetic_library import PLATFORM, PLAYLIST_NAME, runDrop
+
+
+def getSaveStatuses(script, all_the_data):
+    return {
+        image_output_path : save_data[script.SAVE_INFO]
+        for game_title_log in all_the_data[script.LOG_DATA][script.SAVED_IMAGE_PATHS][PLATFORM].values()
+        for game_path_log in game_title_log.values()
+        for media_log in game_path_log.values()
+        for image_output_path, save_data in media_log.items()
+    }
+
+
+def runDropAgain(script, library):
+    all_the_data = runDrop(script, library)
+    script.closeResumeJournal(all_the_data)
+    return getSaveStatuses(script, all_the_data)
+
+
+def testExistingThumbnailsAreSkippedOrOverwrittenFromTheSnapshot(script, library):
+    first_statuses = runDropAgain(script, library)
+    assert first_statuses and set(first_statuses.values()) == { script.NEW_SAVE }
+
+    read_only_thumbnail, deleted_thumbnail, *thumbnails = sorted(first_statuses)
+    read_only_thumbnail.chmod(0o400)
+    deleted_thumbnail.unlink()
+
+    # Overwriting, except read-only thumbnails.
+    statuses = runDropAgain(script, library)
+    assert statuses.pop(read_only_thumbnail) == script.NOT_SAVED
+    assert statuses.pop(deleted_thumbnail) == script.NEW_SAVE
+    assert set(statuses.values()) == { script.OVERWRITTEN }
+    assert deleted_thumbnail.exists()
+
+    # Not overwriting.
+    script.preset_options[1] = {**script.preset1, script.OVERWRITE_IMAGES : False}
+    deleted_thumbnail.unlink()
+    statuses = runDropAgain(script, library)
+    assert statuses.pop(deleted_thumbnail) == script.NEW_SAVE
+    assert set(statuses.values()) == { script.NOT_SAVED }
+
+
+def testEachThumbnailDirectoryIsListedOnceWithoutCheckingEachFile(script, library, monkeypatch):
+    runDropAgain(script, library)
+
+    listed_directories = []
+    checked_files = []
+    scandir = os.scandir
+    exists = Path.exists
+    def countListedDirectories(directory):
+        listed_directories.append(Path(directory))
+        return scandir(directory)
+    def countCheckedFiles(path, *args, **kwargs):
+        checked_files.append(path)
+        return exists(path, *args, **kwargs)
+    monkeypatch.setattr(os, 'scandir', countListedDirectories)
+    monkeypatch.setattr(Path, 'exists', countCheckedFiles)
+
+    script.preset_options[1] = {**script.preset1, script.OVERWRITE_IMAGES : False}
+    statuses = runDropAgain(script, library)
+    assert set(statuses.values()) == { script.NOT_SAVED }
+
+    playlist_dir = library.thumbnails / PLAYLIST_NAME[:-4]
+    thumbnail_directories = [ path for path in listed_directories if path.is_relative_to(library.thumbnails) ]
+    assert sorted(thumbnail_directories) == sorted({ thumbnail.parent for thumbnail in statuses })
+    assert all(directory.parent == playlist_dir for directory in thumbnail_directories)
+    assert not [ path for path in checked_files if path in statuses ]
@@ -0,0 +1,89 @@
+import os
+
+from PIL import Image
+import pytest
+
+from synthetic_library import saveImage
+
+
+@pytest.fixture(params=['png', 'jpg'])
+def image_path(request, tmp_path):
+    image_path = tmp_path / f'Game-01.{request.param}'
+    image = Image.effect_noise((256, 256), 64).convert('RGB') # Large enough to not fit in the bytes read from the end.
+    exif = Image.Exif()
+    exif[0x010e] = 'Synthetic image' # Image description
+    image.save(image_path, exif=exif.tobytes())
+    return image_path
+
+
+def validateImageFile(script, image_path):
+    return script.validateImageFile(image_path, image_path.stat().st_size)
+
+
+def testCompleteImagesAreValid(script, image_path):
+    assert validateImageFile(script, image_path) == None
+    assert script.findImageEnd(image_path, image_path.suffix == '.png') == image_path.stat().st_size
+
+
+def testTruncatedImagesAreIncomplete(script, image_path):
+    image_data = image_path.read_bytes()
+    image_path.write_bytes(image_data[:len(image_data) // 2])
+    assert validateImageFile(script, image_path) in ('Incomplete PNG File', 'Incomplete JPEG File')
+
+    image_path.write_bytes(image_data[:-1])
+    assert validateImageFile(script, image_path) in ('Incomplete PNG File', 'Incomplete JPEG File')
+
+
+def testExtraDataAfterTheImageIsIgnored(script, image_path):
+    image_size = image_path.stat().st_size
+    with open(image_path, 'ab') as file:
+        file.write(b'\x00' * 2048)
+    assert validateImageFile(script, image_path) == None
+    assert script.findImageEnd(image_path, image_path.suffix == '.png') == image_size
+
+
+def testMislabeledImages(script, tmp_path):
+    png_image_path = tmp_path / 'Game-01.jpg'
+    jpeg_image_path = tmp_path / 'Game-01.png'
+    saveImage(tmp_path / 'image.png', (64, 64), 1)
+    saveImage(tmp_path / 'image.jpg', (64, 64), 1)
+    (tmp_path / 'image.png').rename(png_image_path)
+    (tmp_path / 'image.jpg').rename(jpeg_image_path)
+
+    assert validateImageFile(script, png_image_path) == None
+    assert validateImageFile(script, jpeg_image_path) == None
+    script.pillow_installed = False
+    assert validateImageFile(script, jpeg_image_path) == 'JPEG Image With A PNG File Extension'
+
+    text_file_path = tmp_path / 'Game-02.png'
+    text_file_path.write_text('Not an image')
+    assert validateImageFile(script, text_file_path) == 'Not A JPEG Or PNG Image'
+
+
+def testImagesAreOnlyCheckedAgainOnceChanged(script, tmp_path, monkeypatch):
+    image_path = tmp_path / 'Game-01.png'
+    saveImage(image_path, (64, 64), 1)
+    checked_images = []
+    validate_image_file = script.validateImageFile
+    def countCheckedImages(file_path, file_size):
+        checked_images.append(file_path)
+        return validate_image_file(file_path, file_size)
+    monkeypatch.setattr(script, 'validateImageFile', countCheckedImages)
+
+    image_validations = {}
+    assert script.checkImageFile(image_validations, image_path) == None
+    assert script.checkImageFile(image_validations, image_path) == None
+    assert len(checked_images) == 1
+
+    # A new file size.
+    image_data = image_path.read_bytes()
+    image_path.write_bytes(image_data[:-12])
+    assert script.checkImageFile(image_validations, image_path) == 'Incomplete PNG File'
+    assert len(checked_images) == 2
+
+    # The same file size, but modified since.
+    image_path.write_bytes(image_data[:-12] + b'IEND\xae\x42\x60\x82' + b'\x00' * 4)
+    file_stat = image_path.stat()
+    os.utime(image_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    assert script.checkImageFile(image_validations, image_path) == None
+    assert len(checked_images) == 3
@@ -0,0 +1,68 @@
+from contextlib import redirect_stdout
+from io import StringIO
+import json
+import os
+from pathlib import Path
+
+from synthetic_library import PLATFORM, addPlatforms, loadScript, runDrop, saveImage, startScript
+
+
+def testVerifyLeavesJournalAndTempFilesAlone(script, library):
+    runDrop(script, library) # Thumbnails to verify, journal closed and deleted after.
+
+    # A run that didn't finish, leaving its journal and a temp file behind.
+    thumbnail = next(library.thumbnails.rglob('*.png'))
+    temp_file = thumbnail.with_name(f'{thumbnail.name}.tmp123')
+    temp_file.write_bytes(b'half saved')
+    journal_path = script.ROOT_DIR / f'{Path(script.__file__).stem}__journal.txt'
+    journal_text = json.dumps({ 'output' : str(thumbnail), 'temp' : str(temp_file) }) + '\n'
+    journal_path.write_text(journal_text)
+
+    script.verify_thumbnails = True
+    all_the_data = startScript(script, library)
+    assert all_the_data[script.APP_DATA].get(script.RESUME_JOURNAL) == None
+    all_the_data = script.findLaunchBoxGameImages(library.games, all_the_data)
+    audit_results = script.verifyRetroArchThumbnails(all_the_data)
+
+    assert audit_results is not None
+    assert temp_file.read_bytes() == b'half saved'
+    assert journal_path.read_text() == journal_text
+
+
+def verifyThumbnails(script, library):
+    script.verify_thumbnails = True
+    all_the_data = startScript(script, library)
+    with redirect_stdout(StringIO()):
+        all_the_data = script.findLaunchBoxGameImages(library.games, all_the_data)
+        return script.verifyRetroArchThumbnails(all_the_data)
+
+
+def testReplacedImagesKeepingTheirModifiedTimeAreStale(library):
+    script = loadScript()
+    script.closeResumeJournal(runDrop(script, library))
+    assert not any(verifyThumbnails(loadScript(), library).values())
+
+    # Copied over the old image, keeping the old image's modified time like some copy tools do.
+    for image_path in (library.launchbox / 'Images' / PLATFORM / 'Box - Front').rglob('*-01.png'):
+        image_stat = image_path.stat()
+        saveImage(image_path, (200, 300), 99)
+        os.utime(image_path, ns=(image_stat.st_atime_ns, image_stat.st_mtime_ns))
+
+    audit_results = verifyThumbnails(loadScript(), library)
+    stale_thumbnails = audit_results[script.STALE_THUMBNAIL]
+    assert stale_thumbnails and all('Named_Boxarts' in str(image_output_path) for image_output_path, details in stale_thumbnails)
+    assert all(details.startswith('Made From An Older Image Or Preset') for image_output_path, details in stale_thumbnails)
+
+
+def testStrayThumbnailsInEveryPlaylistAreUnexpected(library):
+    script = loadScript()
+    script.closeResumeJournal(runDrop(script, library))
+    addPlatforms(library, 1, 2)
+    other_playlist_thumbnails = library.thumbnails / 'Platform 0' / 'Named_Titles'
+    other_playlist_thumbnails.mkdir(parents=True)
+    saveImage(other_playlist_thumbnails / 'Game 0 (USA).png', (64, 64), 1)
+    saveImage(other_playlist_thumbnails / 'Not A Game.png', (64, 64), 2)
+
+    # Only the dropped games' thumbnails are verified, but every playlist's thumbnail directories are checked.
+    audit_results = verifyThumbnails(loadScript(), library)
+    assert audit_results[script.UNEXPECTED_THUMBNAIL] == [(other_playlist_thumbnails / os.path.normcase('Not A Game.png'), 'Not In Playlist')]